@@ -0,0 +1,209 @@
+"""Admission control and per-request deadlines for solver work.
+
+Spikes of expensive queries (long racks against SCOWL Large, big grids) would
+otherwise queue up behind each other until every request times out.
+``AdmissionController`` lets a fixed number of requests solve at once, keeps
+a bounded queue of waiters, and turns everyone else away immediately with a
+suggested retry delay. A single client cannot take more than its share of
+slots and queue places.
+
+Admitted work runs under a ``Deadline``. Solver loops call ``checkpoint()``
+between units of work; it raises once the running request's deadline has
+passed or the request was cancelled (the client disconnected), so abandoned
+or runaway searches stop within one unit instead of running to completion.
+"""
+
+import asyncio
+import math
+import time
+from collections import Counter, deque
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from typing import Any, AsyncIterator, Callable, Deque, Optional
+
+
+class RequestRejected(Exception):
+    """The request cannot be served now; retry after ``retry_after`` seconds.
+
+    ``reason`` is "overloaded" when the server is full, "client_limit" when
+    this client already has its share of requests in flight, "deadline" when
+    the request ran out of time and "cancelled" when it was cancelled,
+    typically because the client went away.
+    """
+
+    reason = "overloaded"
+
+    def __init__(self, reason: Optional[str] = None, retry_after: int = 1):
+        super().__init__(reason or self.reason)
+        self.reason = reason or self.reason
+        self.retry_after = retry_after
+
+
+class DeadlineExceeded(RequestRejected):
+    """The request ran past its deadline."""
+
+    reason = "deadline"
+
+
+class Cancelled(RequestRejected):
+    """The request was cancelled before it finished."""
+
+    reason = "cancelled"
+
+
+class Deadline:
+    """A time budget for one request that can also be cancelled."""
+
+    def __init__(self, seconds: float):
+        self.expires = time.monotonic() + seconds
+        self.cancelled = False
+
+    def remaining(self) -> float:
+        return max(0.0, self.expires - time.monotonic())
+
+    def cancel(self) -> None:
+        self.cancelled = True
+
+    def check(self) -> None:
+        """Raise if the request was cancelled or is out of time."""
+        if self.cancelled:
+            raise Cancelled()
+        if time.monotonic() > self.expires:
+            raise DeadlineExceeded()
+
+    def run(self, func: Callable[..., Any], *args: Any) -> Any:
+        """Call ``func`` with this deadline applying to its ``checkpoint()`` calls."""
+        token = _current.set(self)
+        try:
+            self.check()
+            return func(*args)
+        finally:
+            _current.reset(token)
+
+
+_current: ContextVar[Optional[Deadline]] = ContextVar("deadline", default=None)
+
+
+def checkpoint() -> None:
+    """Stop the running request if it is past its deadline or cancelled.
+
+    Cheap enough to call once per unit of solver work; does nothing outside
+    ``Deadline.run``.
+    """
+    deadline = _current.get()
+    if deadline is not None:
+        deadline.check()
+
+
+def remaining() -> Optional[float]:
+    """Seconds left for the running request, or ``None`` outside ``Deadline.run``."""
+    deadline = _current.get()
+    return None if deadline is None else deadline.remaining()
+
+
+class AdmissionController:
+    """Bound concurrent solver requests and the queue waiting for them.
+
+    Waiters are served first come, first served. The retry delay suggested
+    to rejected requests is the time the queue ahead of them should take to
+    drain, from a moving average of how long admitted requests hold a slot.
+    """
+
+    def __init__(
+        self,
+        max_active: int,
+        max_queued: int,
+        queue_timeout: float,
+        max_per_client: int = 0,
+    ):
+        self.max_active = max(1, max_active)
+        self.max_queued = max(0, max_queued)
+        self.queue_timeout = queue_timeout
+        self.max_per_client = max_per_client
+        self.active = 0
+        self.rejected = 0
+        self._waiters: Deque[asyncio.Future] = deque()
+        self._clients: Counter = Counter()
+        self._service_time = 0.05
+
+    @property
+    def queued(self) -> int:
+        return len(self._waiters)
+
+    def retry_after(self) -> int:
+        """Seconds until a request arriving now would likely get a slot."""
+        backlog = (self.queued + 1) * self._service_time / self.max_active
+        return max(1, math.ceil(backlog))
+
+    def _reject(self, reason: str) -> RequestRejected:
+        self.rejected += 1
+        return RequestRejected(reason, self.retry_after())
+
+    async def _acquire(self, timeout: float) -> None:
+        if self.active < self.max_active and not self._waiters:
+            self.active += 1
+            return
+        if self.queued >= self.max_queued:
+            raise self._reject("overloaded")
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            # A released slot is handed straight to the waiter (see _release)
+            await asyncio.wait_for(asyncio.shield(waiter), timeout)
+        except asyncio.TimeoutError:
+            if waiter.done():
+                self._release()  # the slot arrived just too late; pass it on
+            else:
+                self._waiters.remove(waiter)
+            raise self._reject("overloaded")
+        except asyncio.CancelledError:
+            if waiter.done():
+                self._release()
+            else:
+                self._waiters.remove(waiter)
+            raise
+
+    def _release(self) -> None:
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+        self.active -= 1
+
+    @asynccontextmanager
+    async def slot(
+        self, client: str = "", timeout: Optional[float] = None
+    ) -> AsyncIterator[None]:
+        """Hold a solver slot for the duration of the block.
+
+        Raises ``RequestRejected`` when ``client`` is at its limit, when the
+        queue is full, or when no slot frees up within the queue timeout (or
+        ``timeout``, if shorter).
+        """
+        if self.max_per_client and self._clients[client] >= self.max_per_client:
+            raise self._reject("client_limit")
+        self._clients[client] += 1
+        try:
+            wait = self.queue_timeout if timeout is None else timeout
+            await self._acquire(min(self.queue_timeout, wait))
+            started = time.monotonic()
+            try:
+                yield
+            finally:
+                held = time.monotonic() - started
+                self._service_time += 0.2 * (held - self._service_time)
+                self._release()
+        finally:
+            self._clients[client] -= 1
+            if not self._clients[client]:
+                del self._clients[client]
+
+    def status(self) -> dict:
+        return {
+            "active": self.active,
+            "queued": self.queued,
+            "max_active": self.max_active,
+            "max_queued": self.max_queued,
+            "rejected": self.rejected,
+        }
@@ -0,0 +1,89 @@
+import re
+import unicodedata
+from dataclasses import dataclass, field
+from typing import Any, Dict, FrozenSet, Literal
+
+
+@dataclass(frozen=True)
+class Alphabet:
+    """The letters a dictionary is spelled with and how text maps onto them.
+
+    ``normalize`` lowercases text, applies Unicode ``form`` and then ``fold``,
+    which maps characters players type interchangeably onto one letter (for
+    example accented vowels in Spanish). Characters outside ``letters`` are
+    dropped from racks and words containing them are not indexed.
+    """
+
+    name: str
+    letters: str
+    form: Literal["NFC", "NFD", "NFKC", "NFKD"] = "NFC"
+    fold: Dict[str, str] = field(default_factory=dict)
+    letter_set: FrozenSet[str] = field(init=False, repr=False, compare=False)
+    positions: Dict[str, int] = field(init=False, repr=False, compare=False)
+    _table: Dict[int, Any] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # Derived lookups, computed once per alphabet
+        object.__setattr__(self, "letter_set", frozenset(self.letters))
+        object.__setattr__(
+            self, "positions", {letter: i for i, letter in enumerate(self.letters)}
+        )
+        object.__setattr__(self, "_table", str.maketrans(self.fold))
+
+    def __hash__(self) -> int:
+        return hash(self.name)
+
+    def __len__(self) -> int:
+        return len(self.letters)
+
+    def normalize(self, text: str) -> str:
+        """Lowercase, Unicode-normalize and fold ``text``."""
+        text = text.lower()
+        if not text.isascii():
+            text = unicodedata.normalize(self.form, text)
+        return text.translate(self._table) if self.fold else text
+
+    def clean(self, text: str) -> str:
+        """Normalize ``text`` and drop every character outside the alphabet."""
+        if self is ENGLISH:
+            # Hot path: the historical ASCII-only behaviour
+            return _NON_ENGLISH.sub("", text).lower()
+        letters = self.letter_set
+        return "".join(char for char in self.normalize(text) if char in letters)
+
+    def spells(self, word: str) -> bool:
+        """Return whether ``word`` only uses letters of this alphabet."""
+        return bool(word) and self.letter_set.issuperset(word)
+
+
+_NON_ENGLISH = re.compile(r"[^a-zA-Z]")
+
+_LATIN = "abcdefghijklmnopqrstuvwxyz"
+
+ENGLISH = Alphabet("english", _LATIN)
+
+# Accents are ignored in Spanish word games, but ñ is a letter of its own
+SPANISH = Alphabet(
+    "spanish",
+    "abcdefghijklmnñopqrstuvwxyz",
+    fold={"á": "a", "é": "e", "í": "i", "ó": "o", "ú": "u", "ü": "u"},
+)
+
+GERMAN = Alphabet("german", _LATIN + "äöüß")
+
+# Danish and Norwegian
+NORDIC = Alphabet("nordic", _LATIN + "æøå")
+
+SWEDISH = Alphabet("swedish", _LATIN + "åäö")
+
+ALPHABETS: Dict[str, Alphabet] = {
+    alphabet.name: alphabet for alphabet in (ENGLISH, SPANISH, GERMAN, NORDIC, SWEDISH)
+}
+
+
+def get_alphabet(name: str) -> Alphabet:
+    """Look up an alphabet by name."""
+    try:
+        return ALPHABETS[name]
+    except KeyError:
+        raise ValueError(f"Unknown alphabet: {name}")
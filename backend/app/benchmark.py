@@ -0,0 +1,129 @@
+"""Solver latency benchmark for long racks.
+
+Measures ``/solve`` and ``/anagrams`` solver latency at increasing rack sizes
+up to ``Config.MAX_LETTERS`` (or ``--max-letters``). Each size is timed on
+random racks drawn with English letter frequencies and on a worst-case rack:
+the letter bank that unlocks the most dictionary words, built greedily by
+always adding the letter copy the most words need next::
+
+    python benchmark.py --max-letters 60 --runs 20
+"""
+
+import argparse
+import random
+import statistics
+import sys
+import time
+from collections import Counter
+from contextlib import redirect_stdout
+from typing import Callable, Dict, Iterable, List
+
+from config import Config, DictionaryType
+from engine import WordSolver
+from index import ALPHABET
+
+
+def worst_case_rack(words: Iterable[str], size: int) -> str:
+    """Return the ``size``-letter bank that covers the most words, greedily."""
+    # needed[letter][k] = number of words using ``letter`` more than k times
+    needed: Dict[str, Counter] = {letter: Counter() for letter in ALPHABET}
+    for word in words:
+        for letter, count in Counter(word).items():
+            if letter in needed:
+                for k in range(count):
+                    needed[letter][k] += 1
+
+    rack: Counter = Counter()
+    for _ in range(size):
+        letter = max(ALPHABET, key=lambda letter: needed[letter][rack[letter]])
+        rack[letter] += 1
+    return "".join(sorted(rack.elements()))
+
+
+def random_rack(words: List[str], size: int, rng: random.Random) -> str:
+    """Return a rack drawn with the dictionary's letter frequencies."""
+    frequencies = Counter("".join(words))
+    letters = [letter for letter in ALPHABET if frequencies[letter]]
+    weights = [frequencies[letter] for letter in letters]
+    return "".join(rng.choices(letters, weights, k=size))  # nosec B311
+
+
+def time_call(func: Callable[[], List[str]], runs: int) -> List[float]:
+    """Return the latencies of ``runs`` calls in milliseconds."""
+    latencies = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        func()
+        latencies.append((time.perf_counter() - started) * 1000)
+    return latencies
+
+
+def run_benchmark(
+    max_letters: int, runs: int, config_type=None, seed: int = 0
+) -> List[Dict]:
+    """Benchmark every rack size from 10 letters up to ``max_letters``."""
+    with redirect_stdout(sys.stderr):
+        engine = WordSolver(config_type).load()
+    words = sorted(engine.snapshot.words)
+    rng = random.Random(seed)  # nosec B311
+
+    sizes = sorted({*range(10, max_letters + 1, 10), max_letters})
+    rows = []
+    for size in sizes:
+        racks = {
+            "random": [random_rack(words, size, rng) for _ in range(runs)],
+            "worst": [worst_case_rack(words, size)] * runs,
+        }
+        for kind, rack_list in racks.items():
+            for name, solver in (
+                ("solve", engine.solve),
+                ("anagrams", engine.anagrams),
+            ):
+                pending = iter(rack_list)
+                counts: List[int] = []
+
+                def call() -> List[str]:
+                    result: List[str] = solver(next(pending), 3)
+                    counts.append(len(result))
+                    return result
+
+                latencies = time_call(call, runs)
+                rows.append(
+                    {
+                        "letters": size,
+                        "rack": kind,
+                        "endpoint": name,
+                        "words": max(counts),
+                        "p50_ms": round(statistics.median(latencies), 2),
+                        "max_ms": round(max(latencies), 2),
+                    }
+                )
+    return rows
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark long-rack solving")
+    parser.add_argument("--max-letters", type=int, default=Config.MAX_LETTERS)
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument(
+        "--dictionary",
+        type=DictionaryType,
+        default=Config.DICTIONARY_TYPE,
+        help="Dictionary type to benchmark (default: $WORDMIXR_DICTIONARY)",
+    )
+    args = parser.parse_args(argv)
+
+    rows = run_benchmark(args.max_letters, args.runs, args.dictionary)
+    print(
+        f"{'letters':>7} {'rack':>6} {'endpoint':>8} {'words':>6} {'p50 ms':>8} {'max ms':>8}"
+    )
+    for row in rows:
+        print(
+            f"{row['letters']:>7} {row['rack']:>6} {row['endpoint']:>8} "
+            f"{row['words']:>6} {row['p50_ms']:>8} {row['max_ms']:>8}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
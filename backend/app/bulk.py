@@ -0,0 +1,221 @@
+"""Command-line bulk solver for offline pipelines.
+
+Reads one rack per line from a file or stdin, solves the racks across all
+cores and writes one result per input line, in input order, as JSON lines
+(the same objects ``/solve`` and ``/anagrams`` return) or CSV::
+
+    python bulk.py racks.txt --output results.jsonl
+    cat racks.txt | python bulk.py --format csv --mode anagrams > results.csv
+
+The dictionary and its index are loaded once in the parent process and
+inherited by the forked workers (or attached from ``WORDMIXR_SHARED_INDEX``
+when configured). Input is read in chunks and only a bounded number of chunks
+is in flight at a time, so memory use does not grow with the input size.
+"""
+
+import argparse
+import csv
+import json
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from contextlib import redirect_stdout
+from itertools import islice
+from typing import IO, Any, Deque, Dict, Iterable, Iterator, List, Optional
+
+from config import Config, DictionaryType
+from engine import WordSolver
+from solver import DictionarySnapshot, load_snapshot
+from utils import format_error_response, format_response, validate_letters
+
+# Engine used by pool workers; set in the parent before forking so workers
+# inherit it, or loaded by the pool initializer otherwise
+_engine: Optional[WordSolver] = None
+
+
+def _load(config_type: Optional[DictionaryType]) -> DictionarySnapshot:
+    # Loading prints status messages; keep them out of results on stdout
+    with redirect_stdout(sys.stderr):
+        if Config.SHARED_INDEX_PATH:
+            from shared_index import load_shared_snapshot
+
+            return load_shared_snapshot(Config.SHARED_INDEX_PATH, config_type)
+        return load_snapshot(config_type)
+
+
+def _init_worker(config_type: Optional[DictionaryType]) -> None:
+    global _engine
+    if _engine is None:
+        _engine = WordSolver.from_snapshot(_load(config_type))
+
+
+def solve_racks(racks: List[str], mode: str, min_length: int) -> List[Dict[str, Any]]:
+    """Solve a chunk of racks, returning one API-style response per rack."""
+    if _engine is None:
+        raise RuntimeError("Bulk solver has no dictionary loaded")
+    alphabet = _engine.snapshot.alphabet
+    solve = _engine.solve if mode == "solve" else _engine.anagrams
+    results = []
+    for rack in racks:
+        validation = validate_letters(rack, alphabet)
+        if not validation["valid"]:
+            results.append(format_error_response(validation["errors"]))
+            continue
+        letters = validation["cleaned"]
+        results.append(format_response(solve(letters, min_length), letters))
+    return results
+
+
+def _chunks(lines: Iterable[str], size: int) -> Iterator[List[str]]:
+    racks = (line.strip() for line in lines)
+    while True:
+        chunk = list(islice(racks, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def bulk_solve(
+    lines: Iterable[str],
+    mode: str = "solve",
+    min_length: int = 3,
+    config_type: Optional[DictionaryType] = None,
+    workers: Optional[int] = None,
+    chunk_size: int = 256,
+) -> Iterator[Dict[str, Any]]:
+    """Yield a result for every input line, in input order.
+
+    At most ``4 * workers`` chunks are queued at once, which bounds memory
+    regardless of how many lines ``lines`` produces.
+    """
+    global _engine
+    _engine = WordSolver.from_snapshot(_load(config_type))
+
+    workers = workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_worker, initargs=(config_type,)
+    ) as pool:
+        window = 4 * workers
+        pending: Deque[Future] = deque()
+        for chunk in _chunks(lines, chunk_size):
+            pending.append(pool.submit(solve_racks, chunk, mode, min_length))
+            if len(pending) >= window:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+
+
+class ProgressReporter:
+    """Print throughput to stderr at most every ``interval`` seconds."""
+
+    def __init__(self, stream: IO[str], interval: float = 2.0):
+        self.stream = stream
+        self.interval = interval
+        self.started = time.time()
+        self.last_report = self.started
+        self.count = 0
+        self.errors = 0
+
+    def update(self, result: Dict[str, Any]) -> None:
+        self.count += 1
+        if not result["success"]:
+            self.errors += 1
+        now = time.time()
+        if self.interval > 0 and now - self.last_report >= self.interval:
+            self.last_report = now
+            self.report()
+
+    def report(self, final: bool = False) -> None:
+        elapsed = max(time.time() - self.started, 1e-9)
+        prefix = "Solved" if final else "Progress:"
+        self.stream.write(
+            f"{prefix} {self.count} racks ({self.errors} invalid) in "
+            f"{elapsed:.1f}s, {self.count / elapsed:.0f} racks/s\n"
+        )
+        self.stream.flush()
+
+
+def write_results(
+    results: Iterable[Dict[str, Any]],
+    output: IO[str],
+    output_format: str = "jsonl",
+    progress: Optional[ProgressReporter] = None,
+) -> None:
+    """Stream results to ``output`` as JSON lines or CSV."""
+    writer = None
+    if output_format == "csv":
+        writer = csv.writer(output)
+        writer.writerow(["letters", "word_count", "words", "errors"])
+    for result in results:
+        if writer is not None:
+            writer.writerow(
+                [
+                    result.get("input_letters", ""),
+                    len(result["words"]),
+                    " ".join(result["words"]),
+                    "; ".join(result.get("errors", [])),
+                ]
+            )
+        else:
+            output.write(json.dumps(result, separators=(",", ":")) + "\n")
+        if progress is not None:
+            progress.update(result)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Solve racks in bulk")
+    parser.add_argument(
+        "input", nargs="?", default="-", help="File with one rack per line (- = stdin)"
+    )
+    parser.add_argument("--output", default="-", help="Output file (- = stdout)")
+    parser.add_argument("--format", choices=["jsonl", "csv"], default="jsonl")
+    parser.add_argument("--mode", choices=["solve", "anagrams"], default="solve")
+    parser.add_argument("--min-length", type=int, default=3)
+    parser.add_argument(
+        "--dictionary",
+        type=DictionaryType,
+        default=Config.DICTIONARY_TYPE,
+        help="Dictionary type to solve with (default: $WORDMIXR_DICTIONARY)",
+    )
+    parser.add_argument(
+        "--workers", type=int, default=None, help="Worker processes (default: CPUs)"
+    )
+    parser.add_argument("--chunk-size", type=int, default=256)
+    parser.add_argument(
+        "--progress-interval",
+        type=float,
+        default=2.0,
+        help="Seconds between progress reports on stderr (0 = final only)",
+    )
+    args = parser.parse_args(argv)
+
+    source = sys.stdin if args.input == "-" else open(args.input, "r", encoding="utf-8")
+    output = (
+        sys.stdout
+        if args.output == "-"
+        else open(args.output, "w", encoding="utf-8", newline="")
+    )
+    progress = ProgressReporter(sys.stderr, args.progress_interval)
+    try:
+        results = bulk_solve(
+            source,
+            args.mode,
+            args.min_length,
+            args.dictionary,
+            args.workers,
+            args.chunk_size,
+        )
+        write_results(results, output, args.format, progress)
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        if output is not sys.stdout:
+            output.close()
+    progress.report(final=True)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
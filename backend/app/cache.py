@@ -0,0 +1,448 @@
+import logging
+import socket
+import sqlite3
+import threading
+import time
+import zlib
+from collections import Counter, OrderedDict
+from typing import IO, Any, Iterable, List, Optional, Set, Tuple
+from urllib.parse import urlparse
+
+logger = logging.getLogger(__name__)
+
+
+def encode_words(words: List[str]) -> bytes:
+    """Serialize a result list compactly: newline-joined and zlib-compressed."""
+    if not words:
+        return b""
+    return zlib.compress("\n".join(words).encode("utf-8"))
+
+
+def decode_words(data: bytes) -> List[str]:
+    if not data:
+        return []
+    return zlib.decompress(data).decode("utf-8").split("\n")
+
+
+class CacheBackend:
+    """Interface shared by the solver result caches.
+
+    Keys come from ``make_key`` and start with the dictionary version they
+    were computed against, so swapping in a new dictionary implicitly
+    invalidates every older entry; ``purge`` drops those stale entries
+    eagerly. ``shared`` caches are also used by other workers and later
+    restarts, which may serve other versions, so the app leaves their stale
+    entries to expire instead. ``ttl`` is in seconds, 0 meaning entries
+    never expire.
+    """
+
+    name = "base"
+    shared = False
+
+    def __init__(self, ttl: float = 0):
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(version: str, kind: str, letters: str, min_length: int) -> tuple:
+        """Build a cache key; letter order does not affect solver results."""
+        return (version, kind, "".join(sorted(letters)), min_length)
+
+    @staticmethod
+    def affected_by(key: tuple, word: str) -> bool:
+        """Return whether adding or removing ``word`` changes a cached result."""
+        _, kind, letters, min_length = key
+        if len(word) < min_length or len(word) > len(letters):
+            return False
+        if kind == "anagrams":
+            return bool("".join(sorted(word)) == letters)
+        return Counter(word) <= Counter(letters)
+
+    def _expires_at(self) -> float:
+        return time.time() + self.ttl if self.ttl > 0 else 0.0
+
+    def _count(self, words: Optional[List[str]]) -> Optional[List[str]]:
+        if words is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return words
+
+    def get(self, key: tuple) -> Optional[List[str]]:
+        raise NotImplementedError
+
+    def set(self, key: tuple, words: List[str]) -> None:
+        raise NotImplementedError
+
+    @staticmethod
+    def _kept(keep_version: Optional[str], keep_versions: Iterable[str]) -> Set[str]:
+        return {*keep_versions, *([keep_version] if keep_version else [])}
+
+    def purge(
+        self, keep_version: Optional[str] = None, keep_versions: Iterable[str] = ()
+    ) -> int:
+        """Drop entries computed against any other version; return the count."""
+        raise NotImplementedError
+
+    def invalidate_word(
+        self, version: str, word: str, new_version: Optional[str] = None
+    ) -> int:
+        """Drop the ``version`` entries whose result depends on ``word``.
+
+        With ``new_version`` (the version of the edited word list) the other
+        entries are carried over to it instead and the affected ones are left
+        out. Shared caches copy rather than move them, since other workers
+        may still be serving ``version``. Returns the entries not carried.
+        """
+        raise NotImplementedError
+
+    def size(self) -> Optional[int]:
+        return None
+
+    def stats(self) -> dict:
+        return {
+            "backend": self.name,
+            "size": self.size(),
+            "ttl": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+    def close(self) -> None:
+        pass
+
+
+class ResultCache(CacheBackend):
+    """Thread-safe in-process LRU cache for solver results."""
+
+    name = "memory"
+
+    def __init__(self, maxsize: int = 4096, ttl: float = 0):
+        super().__init__(ttl)
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[tuple, Tuple[float, List[str]]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: tuple) -> Optional[List[str]]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] and entry[0] <= time.time():
+                del self._entries[key]
+                entry = None
+            if entry is None:
+                return self._count(None)
+            self._entries.move_to_end(key)
+            return self._count(entry[1])
+
+    def set(self, key: tuple, words: List[str]) -> None:
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (self._expires_at(), words)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def _drop(self, stale: List[tuple]) -> int:
+        for key in stale:
+            del self._entries[key]
+        return len(stale)
+
+    def purge(
+        self, keep_version: Optional[str] = None, keep_versions: Iterable[str] = ()
+    ) -> int:
+        keep = self._kept(keep_version, keep_versions)
+        with self._lock:
+            return self._drop([key for key in self._entries if key[0] not in keep])
+
+    def invalidate_word(
+        self, version: str, word: str, new_version: Optional[str] = None
+    ) -> int:
+        with self._lock:
+            keys = [key for key in self._entries if key[0] == version]
+            stale = [key for key in keys if self.affected_by(key, word)]
+            if new_version is not None:
+                # Only this process used the old entries, so move them
+                for key in keys:
+                    if key not in stale:
+                        self._entries[(new_version, *key[1:])] = self._entries.pop(key)
+            return self._drop(stale)
+
+    def size(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> dict:
+        return {**super().stats(), "maxsize": self.maxsize}
+
+
+class SQLiteResultCache(CacheBackend):
+    """Result cache in a local SQLite file, shared by workers and restarts.
+
+    WAL mode lets every worker process read while one writes.
+    """
+
+    name = "sqlite"
+    shared = True
+
+    def __init__(self, path: str, ttl: float = 0):
+        super().__init__(ttl)
+        self.path = path
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, timeout=5, check_same_thread=False)
+        with self._lock, self._db:
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS results ("
+                " version TEXT, kind TEXT, letters TEXT, min_length INTEGER,"
+                " words BLOB, expires_at REAL,"
+                " PRIMARY KEY (version, kind, letters, min_length))"
+            )
+
+    def _execute(self, sql: str, params: Iterable = ()) -> Tuple[list, int]:
+        """Run one statement, returning its rows and affected row count."""
+        try:
+            with self._lock, self._db:
+                cursor = self._db.execute(sql, tuple(params))
+                return cursor.fetchall(), cursor.rowcount
+        except sqlite3.Error as e:
+            # A cache failure must never fail the request
+            logger.warning(f"Result cache error: {e}")
+            return [], 0
+
+    def get(self, key: tuple) -> Optional[List[str]]:
+        rows, _ = self._execute(
+            "SELECT words FROM results WHERE version = ? AND kind = ?"
+            " AND letters = ? AND min_length = ?"
+            " AND (expires_at = 0 OR expires_at > ?)",
+            (*key, time.time()),
+        )
+        return self._count(decode_words(rows[0][0]) if rows else None)
+
+    def set(self, key: tuple, words: List[str]) -> None:
+        self._execute(
+            "INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?, ?)",
+            (*key, encode_words(words), self._expires_at()),
+        )
+
+    def purge(
+        self, keep_version: Optional[str] = None, keep_versions: Iterable[str] = ()
+    ) -> int:
+        keep = sorted(self._kept(keep_version, keep_versions))
+        placeholders = ", ".join("?" * len(keep))
+        sql = f"DELETE FROM results WHERE version NOT IN ({placeholders})"  # nosec B608
+        _, deleted = self._execute(
+            f"{sql} OR (expires_at != 0 AND expires_at <= ?)", (*keep, time.time())
+        )
+        return deleted
+
+    def invalidate_word(
+        self, version: str, word: str, new_version: Optional[str] = None
+    ) -> int:
+        rows, _ = self._execute(
+            "SELECT version, kind, letters, min_length FROM results"
+            " WHERE version = ? AND min_length <= ? AND length(letters) >= ?",
+            (version, len(word), len(word)),
+        )
+        stale = [key for key in map(tuple, rows) if self.affected_by(key, word)]
+        if new_version is not None:
+            self._execute(
+                "INSERT OR REPLACE INTO results SELECT ?, kind, letters,"
+                " min_length, words, expires_at FROM results WHERE version = ?",
+                (new_version, version),
+            )
+            version = new_version
+        for key in stale:
+            self._execute(
+                "DELETE FROM results WHERE version = ? AND kind = ?"
+                " AND letters = ? AND min_length = ?",
+                (version, *key[1:]),
+            )
+        return len(stale)
+
+    def size(self) -> Optional[int]:
+        rows, _ = self._execute("SELECT count(*) FROM results")
+        return int(rows[0][0]) if rows else None
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
+
+
+class RedisResultCache(CacheBackend):
+    """Result cache on any server speaking the Redis protocol (RESP).
+
+    Uses a minimal built-in client for GET/SET/DEL/SCAN, so no extra
+    dependency is needed. Connection errors count as misses and the client
+    reconnects on the next call.
+    """
+
+    name = "redis"
+    shared = True
+
+    def __init__(self, url: str, ttl: float = 0, prefix: str = "wordmixr"):
+        super().__init__(ttl)
+        parsed = urlparse(url)
+        self.host = parsed.hostname or "localhost"
+        self.port = parsed.port or 6379
+        self.password = parsed.password
+        self.db = int(parsed.path.lstrip("/") or 0)
+        self.prefix = prefix
+        self._lock = threading.Lock()
+        self._sock: Optional[socket.socket] = None
+        self._reader: Optional[IO[bytes]] = None
+
+    # -- RESP client -------------------------------------------------------
+
+    def _connect(self) -> None:
+        self._sock = socket.create_connection((self.host, self.port), timeout=2)
+        self._reader = self._sock.makefile("rb")
+        if self.password:
+            self._send("AUTH", self.password)
+        if self.db:
+            self._send("SELECT", str(self.db))
+
+    def _read_reply(self):
+        if self._reader is None:
+            raise ConnectionError("Not connected to cache server")
+        line = self._reader.readline()
+        if not line:
+            raise ConnectionError("Connection closed by cache server")
+        kind, payload = line[:1], line[1:-2]
+        if kind == b"+":
+            return payload.decode()
+        if kind == b"-":
+            raise RuntimeError(payload.decode())
+        if kind == b":":
+            return int(payload)
+        if kind == b"$":
+            length = int(payload)
+            if length < 0:
+                return None
+            data = self._reader.read(length + 2)
+            return data[:-2]
+        if kind == b"*":
+            count = int(payload)
+            return None if count < 0 else [self._read_reply() for _ in range(count)]
+        raise ConnectionError(f"Unexpected reply from cache server: {line!r}")
+
+    def _send(self, *args):
+        parts = [f"*{len(args)}\r\n".encode()]
+        for arg in args:
+            data = arg if isinstance(arg, bytes) else str(arg).encode("utf-8")
+            parts.append(b"$%d\r\n%s\r\n" % (len(data), data))
+        if self._sock is None:
+            raise ConnectionError("Not connected to cache server")
+        self._sock.sendall(b"".join(parts))
+        return self._read_reply()
+
+    def _command(self, *args):
+        with self._lock:
+            try:
+                if self._sock is None:
+                    self._connect()
+                return self._send(*args)
+            except (OSError, ConnectionError, RuntimeError) as e:
+                logger.warning(f"Result cache error: {e}")
+                self._disconnect()
+                return None
+
+    def _disconnect(self) -> None:
+        if self._sock is not None:
+            try:
+                self._sock.close()
+            except OSError:
+                pass
+        self._sock = None
+        self._reader = None
+
+    # -- cache interface ---------------------------------------------------
+
+    def _redis_key(self, key: tuple) -> str:
+        version, kind, letters, min_length = key
+        return f"{self.prefix}:{version}:{kind}:{min_length}:{letters}"
+
+    def _parse_key(self, redis_key: bytes) -> tuple:
+        _, version, kind, min_length, letters = redis_key.decode().split(":")
+        return (version, kind, letters, int(min_length))
+
+    def _scan(self, pattern: str) -> List[bytes]:
+        keys: List[bytes] = []
+        cursor = "0"
+        while True:
+            reply = self._command("SCAN", cursor, "MATCH", pattern, "COUNT", 1000)
+            if not reply:
+                return keys
+            cursor, batch = reply[0].decode(), reply[1]
+            keys.extend(batch)
+            if cursor == "0":
+                return keys
+
+    def _delete(self, keys: List[bytes]) -> int:
+        deleted = 0
+        for start in range(0, len(keys), 500):
+            deleted += self._command("DEL", *keys[start : start + 500]) or 0
+        return deleted
+
+    def get(self, key: tuple) -> Optional[List[str]]:
+        data = self._command("GET", self._redis_key(key))
+        return self._count(decode_words(data) if data is not None else None)
+
+    def _store(self, key: tuple, data: bytes) -> None:
+        args: List[Any] = ["SET", self._redis_key(key), data]
+        if self.ttl > 0:
+            args += ["PX", int(self.ttl * 1000)]
+        self._command(*args)
+
+    def set(self, key: tuple, words: List[str]) -> None:
+        self._store(key, encode_words(words))
+
+    def purge(
+        self, keep_version: Optional[str] = None, keep_versions: Iterable[str] = ()
+    ) -> int:
+        keep = tuple(
+            f"{self.prefix}:{version}:".encode()
+            for version in self._kept(keep_version, keep_versions)
+        )
+        stale = [
+            key for key in self._scan(f"{self.prefix}:*") if not key.startswith(keep)
+        ]
+        return self._delete(stale)
+
+    def invalidate_word(
+        self, version: str, word: str, new_version: Optional[str] = None
+    ) -> int:
+        keys = [
+            self._parse_key(key) for key in self._scan(f"{self.prefix}:{version}:*")
+        ]
+        stale = [key for key in keys if self.affected_by(key, word)]
+        if new_version is None:
+            return self._delete([self._redis_key(key).encode() for key in stale])
+        for key in keys:
+            if key in stale:
+                continue
+            data = self._command("GET", self._redis_key(key))
+            if data is not None:
+                self._store((new_version, *key[1:]), data)
+        return len(stale)
+
+    def close(self) -> None:
+        with self._lock:
+            self._disconnect()
+
+
+def create_result_cache(
+    backend: str = "memory",
+    maxsize: int = 4096,
+    ttl: float = 0,
+    path: str = "",
+    url: str = "",
+) -> CacheBackend:
+    """Create the configured result cache backend."""
+    if backend == "memory":
+        return ResultCache(maxsize, ttl)
+    if backend == "sqlite":
+        return SQLiteResultCache(path or "wordmixr-cache.sqlite3", ttl)
+    if backend == "redis":
+        return RedisResultCache(url or "redis://localhost:6379/0", ttl)
+    raise ValueError(f"Unknown result cache backend: {backend}")
@@ -1,6 +1,8 @@
 import os
 from enum import Enum
-from typing import Dict
+from typing import Dict, Optional
+
+from alphabet import ENGLISH, Alphabet, get_alphabet
 
 
 class DictionaryType(Enum):
@@ -13,6 +15,11 @@ class DictionaryType(Enum):
     SCOWL_LARGE = "scowl_large"  # 126k words - comprehensive but curated
     COMPREHENSIVE = "comprehensive"
     AUTO = "auto"  # Try SCOWL Medium first, then others
+    # Non-English word lists (not bundled; provide the file to enable)
+    SPANISH = "spanish"
+    GERMAN = "german"
+    NORWEGIAN = "norwegian"
+    SWEDISH = "swedish"
 
 
 class Config:
@@ -21,6 +28,149 @@ class Config:
     # Dictionary configuration
     DICTIONARY_TYPE = DictionaryType(os.getenv("WORDMIXR_DICTIONARY", "scowl_large"))
 
+    # Extra dictionaries kept loaded next to the default one and selectable per
+    # request with ``?dictionary=`` (comma-separated types, e.g. "google_10k")
+    RESIDENT_DICTIONARIES = [
+        DictionaryType(name.strip())
+        for name in os.getenv("WORDMIXR_DICTIONARIES", "").split(",")
+        if name.strip()
+    ]
+
+    # Record for every word the smallest bundled list (Google 10k, SCOWL
+    # Medium, SCOWL Large) containing it, for ``annotate=tier`` and ``max_tier``
+    WORD_TIERS = os.getenv("WORDMIXR_WORD_TIERS", "true").lower() in (
+        "1",
+        "true",
+        "yes",
+    )
+
+    # Longest rack accepted by the API. Solving cost is bounded by dictionary
+    # size, so long letter banks (e.g. whole phrases) are fine; see
+    # ``python benchmark.py`` for latency at a given limit.
+    MAX_LETTERS = int(os.getenv("WORDMIXR_MAX_LETTERS", "20"))
+
+    # Most words a single ``POST /check`` request may validate
+    MAX_CHECK_WORDS = int(os.getenv("WORDMIXR_MAX_CHECK_WORDS", "5000"))
+
+    # Largest board side accepted by ``/grid`` (boards are up to N x N)
+    MAX_GRID_SIZE = int(os.getenv("WORDMIXR_MAX_GRID_SIZE", "8"))
+
+    # Build the typo-tolerant lookup index for ``/suggest`` in the background
+    # as soon as a dictionary is loaded, instead of on the first request. Off
+    # by default with a shared index, where every worker would otherwise hold
+    # its own copy of an index few requests use
+    FUZZY_PREBUILD = os.getenv(
+        "WORDMIXR_FUZZY_PREBUILD",
+        "false" if os.getenv("WORDMIXR_SHARED_INDEX") else "true",
+    ).lower() in ("1", "true", "yes")
+
+    # Most guesses ``/wordle`` scores by expected information per request;
+    # larger candidate sets are sampled evenly down to this many
+    WORDLE_GUESS_POOL = int(os.getenv("WORDMIXR_WORDLE_GUESS_POOL", "500"))
+
+    # Search budget for one ``/ladder`` request: the most words it may visit
+    # and how long it may run before giving up, so far-apart or disconnected
+    # pairs cannot tie up a worker
+    LADDER_MAX_NODES = int(os.getenv("WORDMIXR_LADDER_MAX_NODES", "50000"))
+    LADDER_TIME_LIMIT_MS = int(os.getenv("WORDMIXR_LADDER_TIME_LIMIT_MS", "250"))
+
+    # Admission control for solver endpoints: requests solving at once per
+    # worker, requests allowed to wait for a slot, and how long they may wait
+    # before being turned away with 503 and ``Retry-After``
+    MAX_ACTIVE_SOLVES = int(os.getenv("WORDMIXR_MAX_ACTIVE_SOLVES", "4"))
+    MAX_QUEUED_SOLVES = int(os.getenv("WORDMIXR_MAX_QUEUED_SOLVES", "32"))
+    QUEUE_TIMEOUT_MS = int(os.getenv("WORDMIXR_QUEUE_TIMEOUT_MS", "1000"))
+
+    # Most solver requests one client address may have running or waiting;
+    # more are answered with 429 (0 disables the limit)
+    MAX_SOLVES_PER_CLIENT = int(os.getenv("WORDMIXR_MAX_SOLVES_PER_CLIENT", "8"))
+
+    # Time budget for one solver request, waiting for a slot included, and
+    # per-endpoint overrides (e.g. "grid=5000,check=10000")
+    REQUEST_DEADLINE_MS = int(os.getenv("WORDMIXR_REQUEST_DEADLINE_MS", "5000"))
+    ENDPOINT_DEADLINES_MS = {
+        name.strip(): int(ms)
+        for name, _, ms in (
+            item.partition("=")
+            for item in os.getenv("WORDMIXR_ENDPOINT_DEADLINES_MS", "").split(",")
+            if item.strip()
+        )
+    }
+
+    # Fraction of ``/solve``, ``/anagrams``, ``/grid`` and ``/generate``
+    # requests logged as JSON lines (endpoint, rack length - the largest rack
+    # size for ``/generate`` - result count, latency, dictionary);
+    # 0 turns request logging off. Records are written by a background
+    # thread, and dropped rather than queued beyond REQUEST_LOG_QUEUE_SIZE.
+    REQUEST_LOG_SAMPLE_RATE = float(
+        os.getenv("WORDMIXR_REQUEST_LOG_SAMPLE_RATE", "0.01")
+    )
+    REQUEST_LOG_QUEUE_SIZE = int(os.getenv("WORDMIXR_REQUEST_LOG_QUEUE_SIZE", "10000"))
+
+    # Admin endpoints are disabled unless a token is configured
+    ADMIN_TOKEN = os.getenv("WORDMIXR_ADMIN_TOKEN", "")
+
+    # Directory where profiler stats are written (defaults to the working dir)
+    PROFILE_DIR = os.getenv("WORDMIXR_PROFILE_DIR", ".")
+
+    # Solver result cache: "memory" (per worker), "sqlite" (local file shared
+    # by workers and restarts) or "redis" (any Redis-protocol server)
+    RESULT_CACHE_BACKEND = os.getenv("WORDMIXR_RESULT_CACHE", "memory").lower()
+
+    # Maximum number of solver results kept in the in-process result cache
+    RESULT_CACHE_SIZE = int(os.getenv("WORDMIXR_RESULT_CACHE_SIZE", "4096"))
+
+    # Seconds before a cached result expires (0 keeps results until purged).
+    # The shared backends are never purged, so this also bounds how long
+    # results of replaced dictionaries stay in them
+    RESULT_CACHE_TTL = float(os.getenv("WORDMIXR_RESULT_CACHE_TTL", "86400"))
+
+    # SQLite file for the "sqlite" backend and server URL for "redis"
+    RESULT_CACHE_PATH = os.getenv(
+        "WORDMIXR_RESULT_CACHE_PATH", "wordmixr-cache.sqlite3"
+    )
+    RESULT_CACHE_URL = os.getenv(
+        "WORDMIXR_RESULT_CACHE_URL", "redis://localhost:6379/0"
+    )
+
+    # Seconds browsers and CDNs may reuse a ``/solve`` or ``/anagrams`` result
+    # without revalidating it (0 makes them always revalidate with the ETag).
+    # Keep it short when dictionaries are edited or reloaded while serving.
+    HTTP_CACHE_MAX_AGE = int(os.getenv("WORDMIXR_HTTP_CACHE_MAX_AGE", "300"))
+
+    # Smallest ``/solve`` or ``/anagrams`` body compressed for clients that
+    # accept it (0 disables compression)
+    COMPRESS_MIN_BYTES = int(os.getenv("WORDMIXR_COMPRESS_MIN_BYTES", "1024"))
+
+    # Compression effort: low levels give most of the size reduction for a
+    # fraction of the CPU time of the defaults
+    GZIP_LEVEL = int(os.getenv("WORDMIXR_GZIP_LEVEL", "1"))
+    BROTLI_QUALITY = int(os.getenv("WORDMIXR_BROTLI_QUALITY", "4"))
+
+    # Seconds between dictionary file change checks (0 disables the watcher)
+    DICTIONARY_WATCH_INTERVAL = float(os.getenv("WORDMIXR_WATCH_INTERVAL", "0"))
+
+    # Serve from the Google 10k list while the configured dictionary loads in
+    # the background, so new instances accept traffic immediately
+    FAST_START = os.getenv("WORDMIXR_FAST_START", "false").lower() in (
+        "1",
+        "true",
+        "yes",
+    )
+
+    # File recording words added to or removed from the base dictionary
+    # ("+word" / "-word" lines). Edits are kept in memory only when unset.
+    OVERLAY_FILE = os.getenv("WORDMIXR_OVERLAY_FILE", "")
+
+    # Warm-cache artifact (built with ``python warmer.py``) loaded into the
+    # result cache at startup, before the app reports ready
+    WARM_CACHE_PATH = os.getenv("WORDMIXR_WARM_CACHE", "")
+
+    # Memory-mapped index file shared by all worker processes. The first worker
+    # builds it, the others attach read-only. Each worker builds its own index
+    # in memory when unset.
+    SHARED_INDEX_PATH = os.getenv("WORDMIXR_SHARED_INDEX", "")
+
     # Dictionary file mappings
     DICTIONARY_FILES: Dict[DictionaryType, list] = {
         DictionaryType.GOOGLE_10K: [
@@ -43,29 +193,86 @@ class Config:
             "/app/words_alpha.txt",
             "app/words_alpha.txt",
         ],
+        DictionaryType.SPANISH: [
+            "spanish.txt",
+            "/app/spanish.txt",
+            "app/spanish.txt",
+        ],
+        DictionaryType.GERMAN: [
+            "german.txt",
+            "/app/german.txt",
+            "app/german.txt",
+        ],
+        DictionaryType.NORWEGIAN: [
+            "norwegian.txt",
+            "/app/norwegian.txt",
+            "app/norwegian.txt",
+        ],
+        DictionaryType.SWEDISH: [
+            "swedish.txt",
+            "/app/swedish.txt",
+            "app/swedish.txt",
+        ],
         DictionaryType.AUTO: [],  # Will use multiple in priority order
     }
 
+    # Alphabet (letters and normalization rules) of each non-English dictionary
+    DICTIONARY_ALPHABETS: Dict[DictionaryType, str] = {
+        DictionaryType.SPANISH: "spanish",
+        DictionaryType.GERMAN: "german",
+        DictionaryType.NORWEGIAN: "nordic",
+        DictionaryType.SWEDISH: "swedish",
+    }
+
+    # Types tried by AUTO: SCOWL Large first (best for games), then Medium,
+    # then Google 10k, then comprehensive
+    AUTO_PRIORITY = (
+        DictionaryType.SCOWL_LARGE,
+        DictionaryType.SCOWL_MEDIUM,
+        DictionaryType.GOOGLE_10K,
+        DictionaryType.COMPREHENSIVE,
+    )
+
     @classmethod
-    def get_dictionary_paths(cls) -> list:
+    def get_dictionary_paths(cls, dict_type: Optional[DictionaryType] = None) -> list:
         """Get dictionary file paths in priority order"""
-        if cls.DICTIONARY_TYPE == DictionaryType.AUTO:
-            # Try SCOWL Large first (best for games), then Medium, then Google 10k, then comprehensive
-            return (
-                cls.DICTIONARY_FILES[DictionaryType.SCOWL_LARGE]
-                + cls.DICTIONARY_FILES[DictionaryType.SCOWL_MEDIUM]
-                + cls.DICTIONARY_FILES[DictionaryType.GOOGLE_10K]
-                + cls.DICTIONARY_FILES[DictionaryType.COMPREHENSIVE]
-            )
+        dict_type = dict_type or cls.DICTIONARY_TYPE
+        if dict_type == DictionaryType.AUTO:
+            return [
+                path
+                for auto in cls.AUTO_PRIORITY
+                for path in cls.DICTIONARY_FILES[auto]
+            ]
         else:
-            return cls.DICTIONARY_FILES[cls.DICTIONARY_TYPE]
+            return cls.DICTIONARY_FILES[dict_type]
+
+    @classmethod
+    def resolve_dictionary_type(
+        cls, dict_type: Optional[DictionaryType] = None
+    ) -> DictionaryType:
+        """Get the dictionary type actually loaded, resolving AUTO to the first
+        type in ``AUTO_PRIORITY`` whose file exists"""
+        dict_type = dict_type or cls.DICTIONARY_TYPE
+        if dict_type == DictionaryType.AUTO:
+            for auto in cls.AUTO_PRIORITY:
+                if any(os.path.exists(path) for path in cls.DICTIONARY_FILES[auto]):
+                    return auto
+        return dict_type
+
+    @classmethod
+    def get_alphabet(cls, dict_type: Optional[DictionaryType] = None) -> Alphabet:
+        """Get the alphabet a dictionary type is spelled with"""
+        dict_type = dict_type or cls.DICTIONARY_TYPE
+        name = cls.DICTIONARY_ALPHABETS.get(dict_type)
+        return get_alphabet(name) if name else ENGLISH
 
     @classmethod
-    def get_dictionary_info(cls) -> dict:
+    def get_dictionary_info(cls, dict_type: Optional[DictionaryType] = None) -> dict:
         """Get information about current dictionary configuration"""
+        dict_type = dict_type or cls.DICTIONARY_TYPE
         return {
-            "type": cls.DICTIONARY_TYPE.value,
-            "description": cls._get_dictionary_description(cls.DICTIONARY_TYPE),
+            "type": dict_type.value,
+            "description": cls._get_dictionary_description(dict_type),
         }
 
     @classmethod
@@ -77,5 +284,9 @@ class Config:
             DictionaryType.SCOWL_LARGE: "SCOWL Large: 126k curated words (perfect for word games, includes 'ache' and 'gird')",
             DictionaryType.COMPREHENSIVE: "Comprehensive English dictionary (370k+ words, includes obscure terms)",
             DictionaryType.AUTO: "Auto-select: SCOWL Large preferred, with intelligent fallbacks",
+            DictionaryType.SPANISH: "Spanish word list (spanish.txt); accents folded, ñ kept as a letter",
+            DictionaryType.GERMAN: "German word list (german.txt) with ä, ö, ü and ß letters",
+            DictionaryType.NORWEGIAN: "Norwegian word list (norwegian.txt) with æ, ø and å letters",
+            DictionaryType.SWEDISH: "Swedish word list (swedish.txt) with å, ä and ö letters",
         }
         return descriptions.get(dict_type, "Unknown dictionary type")
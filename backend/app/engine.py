@@ -0,0 +1,376 @@
+"""Embeddable solver engine.
+
+``WordSolver`` owns one immutable dictionary snapshot - the word store and
+every index built over it - and answers solve and anagram queries against
+it. The API, the tests and the offline tools all go through it::
+
+    solver = WordSolver(DictionaryType.GOOGLE_10K)  # nothing loaded yet
+    solver.solve("beach")                           # loads, then solves
+    solver.batch(["beach", "tac"], mode="anagrams")
+
+An engine never changes once built: editing words returns a new engine that
+reuses the indexes built so far, and a server swaps whole engines to reload.
+A thread holding an engine keeps a consistent view for as long as it needs,
+and any number of engines can live in one process.
+"""
+
+import threading
+from bisect import bisect_left
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from admission import checkpoint
+from alphabet import ENGLISH
+from config import DictionaryType
+from fuzzy import FuzzyIndex
+from generator import load_word_ranks
+from ladder import LadderGraph, LadderResult
+from solver import (
+    DictionarySnapshot,
+    build_snapshot,
+    check_words,
+    find_completions,
+    find_grid_words,
+    find_hook_words,
+    find_tiered_words,
+    find_valid_words,
+    get_anagrams,
+    is_playable,
+    load_snapshot,
+    playable_words,
+)
+from wordle import WordleIndex
+
+
+class WordSolver:
+    """Solve queries against one dictionary, loading it on first use.
+
+    By default the dictionary is loaded like the server loads it
+    (``load_snapshot``); pass ``loader`` to build it some other way, or use
+    ``from_snapshot``/``from_words`` for an engine that is ready immediately.
+    """
+
+    def __init__(
+        self,
+        config_type: Optional[DictionaryType] = None,
+        tier: str = "full",
+        loader: Optional[Callable[[], DictionarySnapshot]] = None,
+    ):
+        self._loader = loader or (lambda: load_snapshot(config_type, tier=tier))
+        self._snapshot: Optional[DictionarySnapshot] = None
+        self._sorted: Optional[Tuple[List[str], Dict[int, List[str]]]] = None
+        self._wordle: Dict[int, WordleIndex] = {}
+        self._ladders: Dict[int, LadderGraph] = {}
+        self._fuzzy: Optional[FuzzyIndex] = None
+        self._lock = threading.Lock()
+        # Separate lock so a slow fuzzy build does not hold up other indexes
+        self._fuzzy_lock = threading.Lock()
+
+    @classmethod
+    def from_snapshot(cls, snapshot: DictionarySnapshot) -> "WordSolver":
+        """Wrap an already built snapshot."""
+        engine = cls(loader=lambda: snapshot)
+        engine._snapshot = snapshot
+        return engine
+
+    @classmethod
+    def from_words(
+        cls, words: Iterable[str], dictionary_type: str = "scowl_large"
+    ) -> "WordSolver":
+        """Build an engine over an in-memory word list, lazily."""
+        word_set = set(words)
+        info = {"filepath": "memory", "size": len(word_set), "type": dictionary_type}
+        return cls(loader=lambda: build_snapshot(word_set, info))
+
+    @property
+    def loaded(self) -> bool:
+        return self._snapshot is not None
+
+    @property
+    def snapshot(self) -> DictionarySnapshot:
+        """The dictionary snapshot, built on first access."""
+        snapshot = self._snapshot
+        if snapshot is None:
+            with self._lock:
+                # Another thread may have finished loading while we waited
+                if self._snapshot is None:
+                    self._snapshot = self._loader()
+                snapshot = self._snapshot
+        return snapshot
+
+    def _sorted_lists(self) -> Tuple[List[str], Dict[int, List[str]]]:
+        sorted_lists = self._sorted
+        if sorted_lists is None:
+            snapshot = self.snapshot
+            with self._lock:
+                if self._sorted is None:
+                    words = playable_words(snapshot)
+                    by_length: Dict[int, List[str]] = {}
+                    for word in words:
+                        by_length.setdefault(len(word), []).append(word)
+                    self._sorted = (words, by_length)
+                sorted_lists = self._sorted
+        return sorted_lists
+
+    @property
+    def sorted_words(self) -> List[str]:
+        """Playable words in sorted order for prefix search, built on first use."""
+        return self._sorted_lists()[0]
+
+    @property
+    def words_by_length(self) -> Dict[int, List[str]]:
+        """``sorted_words`` split by word length, built on first use."""
+        return self._sorted_lists()[1]
+
+    def wordle_index(self, length: int) -> WordleIndex:
+        """The Wordle index for words of ``length`` letters, built on first use."""
+        index = self._wordle.get(length)
+        if index is None:
+            words = self.words_by_length.get(length)
+            if not words:
+                raise ValueError(f"No {length}-letter words in the dictionary")
+            alphabet = self.snapshot.alphabet
+            with self._lock:
+                if length not in self._wordle:
+                    self._wordle[length] = WordleIndex(words, alphabet)
+                index = self._wordle[length]
+        return index
+
+    def ladder_graph(self, length: int) -> LadderGraph:
+        """The word ladder graph for words of ``length`` letters, built on first use."""
+        graph = self._ladders.get(length)
+        if graph is None:
+            words = self.words_by_length.get(length)
+            if not words:
+                raise ValueError(f"No {length}-letter words in the dictionary")
+            with self._lock:
+                if length not in self._ladders:
+                    self._ladders[length] = LadderGraph(words)
+                graph = self._ladders[length]
+        return graph
+
+    @property
+    def fuzzy_index(self) -> FuzzyIndex:
+        """The typo-tolerant lookup index, built on first use.
+
+        Waiting for another thread's build and the build itself both stop at
+        the caller's deadline; a build cut short is not kept.
+        """
+        index = self._fuzzy
+        if index is None:
+            words, alphabet = self.sorted_words, self.snapshot.alphabet
+            # Frequency ranks come from the English Google 10k list
+            ranks = load_word_ranks() if alphabet is ENGLISH else {}
+            while not self._fuzzy_lock.acquire(timeout=0.05):
+                checkpoint()
+            try:
+                if self._fuzzy is None:
+                    self._fuzzy = FuzzyIndex(words, alphabet.letters, ranks)
+                index = self._fuzzy
+            finally:
+                self._fuzzy_lock.release()
+        return index
+
+    @property
+    def has_fuzzy_index(self) -> bool:
+        """Whether the fuzzy lookup index has been built."""
+        return self._fuzzy is not None
+
+    def load(self) -> "WordSolver":
+        """Build the dictionary now instead of on first use."""
+        self.snapshot
+        return self
+
+    def solve(
+        self, letters: str, min_length: int = 3, max_tier: Optional[str] = None
+    ) -> List[str]:
+        """Return all words formable from ``letters``, shortest first.
+
+        ``max_tier`` keeps only words from that word list tier or a smaller
+        one (see ``solve_tiered``).
+        """
+        if max_tier:
+            return self.solve_tiered(letters, min_length, max_tier)[0]
+        snapshot = self.snapshot
+        words: List[str] = find_valid_words(
+            snapshot.alphabet.clean(letters),
+            snapshot.index,
+            min_length,
+            snapshot.dictionary_type,
+        )
+        return words
+
+    def solve_tiered(
+        self, letters: str, min_length: int = 3, max_tier: Optional[str] = None
+    ) -> Tuple[List[str], Dict[str, str]]:
+        """Return ``solve`` results and each word's word list tier."""
+        snapshot = self.snapshot
+        return find_tiered_words(
+            snapshot.alphabet.clean(letters), snapshot.index, min_length, max_tier
+        )
+
+    def hooks(
+        self,
+        letters: str,
+        anchors: List[Tuple[str, Optional[int]]],
+        min_length: int = 3,
+    ) -> Tuple[List[str], Dict[str, List[str]]]:
+        """Return words using the rack plus exactly one anchor letter.
+
+        ``anchors`` holds (letter, position) pairs from ``parse_anchors``;
+        each word comes with the anchors it can be played through.
+        """
+        snapshot = self.snapshot
+        return find_hook_words(
+            snapshot.alphabet.clean(letters), anchors, snapshot.index, min_length
+        )
+
+    def anagrams(self, letters: str, min_length: int = 3) -> List[str]:
+        """Return all words using exactly the letters in ``letters``."""
+        snapshot = self.snapshot
+        words: List[str] = get_anagrams(
+            snapshot.alphabet.clean(letters),
+            snapshot.index,
+            min_length,
+            snapshot.dictionary_type,
+        )
+        return words
+
+    def batch(
+        self, racks: Iterable[str], mode: str = "solve", min_length: int = 3
+    ) -> List[List[str]]:
+        """Solve many racks, in input order."""
+        if mode not in ("solve", "anagrams"):
+            raise ValueError(f"Unknown batch mode: {mode}")
+        solve = self.solve if mode == "solve" else self.anagrams
+        return [solve(rack, min_length) for rack in racks]
+
+    def grid(self, rows: List[str], min_length: int = 3) -> List[str]:
+        """Return all words traceable through adjacent cells of a board."""
+        alphabet = self.snapshot.alphabet
+        rows = [alphabet.clean(row) for row in rows]
+        return find_grid_words(rows, self.sorted_words, min_length)
+
+    def wordle(
+        self,
+        feedback: Sequence[Tuple[str, int]],
+        length: int = 5,
+        limit: int = 10,
+        pool: int = 500,
+    ) -> Tuple[List[str], List[Tuple[str, float]]]:
+        """Return the words consistent with Wordle feedback and the best guesses.
+
+        ``feedback`` holds (guess, pattern) pairs from ``wordle.parse_feedback``.
+        """
+        index = self.wordle_index(length)
+        ids = index.candidates(feedback)
+        return [index.words[i] for i in ids], index.rank(ids, limit, pool)
+
+    def ladder(
+        self,
+        start: str,
+        end: str,
+        max_nodes: int = 50000,
+        time_limit: float = 0.25,
+    ) -> LadderResult:
+        """Return a shortest word ladder from ``start`` to ``end``.
+
+        Both words must have the same length and be in the dictionary; the
+        search stops after ``max_nodes`` words or ``time_limit`` seconds.
+        """
+        alphabet = self.snapshot.alphabet
+        start, end = alphabet.clean(start), alphabet.clean(end)
+        if len(start) != len(end):
+            raise ValueError("Start and end words must have the same length")
+        graph = self.ladder_graph(len(start))
+        return graph.find(start, end, max_nodes, time_limit)
+
+    def suggest(
+        self, word: str, max_distance: int = 2, limit: int = 10
+    ) -> List[Tuple[str, int]]:
+        """Return dictionary words within ``max_distance`` edits of ``word``."""
+        word = self.snapshot.alphabet.clean(word)
+        return self.fuzzy_index.lookup(word, max_distance, limit)
+
+    def complete(
+        self, prefix: str, letters: str, min_length: int = 3, limit: int = 10
+    ) -> List[str]:
+        """Return up to ``limit`` rack-buildable words starting with ``prefix``."""
+        alphabet = self.snapshot.alphabet
+        return find_completions(
+            alphabet.clean(prefix),
+            alphabet.clean(letters),
+            self.words_by_length,
+            min_length,
+            limit,
+        )
+
+    def check(self, words: Iterable[str], min_length: int = 3) -> List[Dict]:
+        """Return dictionary membership and quality status for each word."""
+        return check_words(words, self.snapshot, min_length)
+
+    def with_word(self, word: str) -> "WordSolver":
+        """Return an engine whose dictionary also contains ``word``."""
+        snapshot = self.snapshot
+        updated = snapshot.with_word(word)
+        return self if updated is snapshot else self._edited(updated, word, True)
+
+    def without_word(self, word: str) -> "WordSolver":
+        """Return an engine whose dictionary no longer contains ``word``."""
+        snapshot = self.snapshot
+        updated = snapshot.without_word(word)
+        return self if updated is snapshot else self._edited(updated, word, False)
+
+    def _edited(
+        self, snapshot: DictionarySnapshot, word: str, added: bool
+    ) -> "WordSolver":
+        """Return an engine for ``snapshot`` that reuses this engine's indexes.
+
+        ``snapshot`` is this dictionary with ``word`` added or removed. The
+        sorted word lists take the change directly; the Wordle index and
+        ladder graph of the edited word's length are dropped and rebuilt on
+        next use, those of other lengths are kept. A built fuzzy index is
+        copied with the word's deletions merged in or taken out.
+        """
+        engine = WordSolver.from_snapshot(snapshot)
+        with self._lock:
+            sorted_lists = self._sorted
+            wordle, ladders = dict(self._wordle), dict(self._ladders)
+        fuzzy = self._fuzzy
+        if not is_playable(word, snapshot):
+            # Not in the sorted lists, so nothing derived from them changes
+            engine._sorted, engine._wordle, engine._ladders = (
+                sorted_lists,
+                wordle,
+                ladders,
+            )
+            engine._fuzzy = fuzzy
+            return engine
+        if fuzzy is not None:
+            if added:
+                engine._fuzzy = fuzzy.with_word(word)
+            else:
+                engine._fuzzy = fuzzy.without_word(word)
+        if sorted_lists is not None:
+            words, by_length = sorted_lists
+            by_length = dict(by_length)
+            bucket = _edit_sorted(by_length.get(len(word), []), word, added)
+            if bucket:
+                by_length[len(word)] = bucket
+            else:
+                by_length.pop(len(word), None)
+            engine._sorted = (_edit_sorted(words, word, added), by_length)
+        wordle.pop(len(word), None)
+        ladders.pop(len(word), None)
+        engine._wordle, engine._ladders = wordle, ladders
+        return engine
+
+
+def _edit_sorted(words: List[str], word: str, added: bool) -> List[str]:
+    """Return a copy of the sorted list ``words`` with ``word`` added or removed."""
+    i = bisect_left(words, word)
+    present = i < len(words) and words[i] == word
+    if added and not present:
+        return words[:i] + [word] + words[i:]
+    if not added and present:
+        return words[:i] + words[i + 1 :]
+    return words
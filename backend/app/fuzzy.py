@@ -0,0 +1,189 @@
+"""Typo-tolerant word lookup with a symmetric-delete index.
+
+Two words are within one edit (insertion, deletion, substitution or
+transposition of adjacent letters) exactly when deleting at most one letter
+from each gives a common string. ``FuzzyIndex`` stores every word's
+one-letter deletions, so a distance-1 lookup is a handful of searches; for
+distance 2 it looks up each distance-1 edit of the query the same way, which
+reaches every word two edits away without storing the far larger set of
+two-letter deletions.
+
+Deletions are not kept as strings: each is reduced to a 32-bit hash and
+stored with its word id in two flat arrays sorted by hash, about eight bytes
+per deletion. Hash collisions only add candidates, and every candidate is
+checked with a real edit distance before it is returned.
+
+An index is not changed in place: ``with_word`` and ``without_word`` return a
+copy with one word's deletions merged in or taken out, which is much cheaper
+than building the index again after a single dictionary edit.
+"""
+
+from array import array
+from bisect import bisect_left, bisect_right
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+from admission import checkpoint
+
+# Ranks words missing from the frequency list after all ranked words
+UNRANKED = 1 << 30
+
+
+def _deletes(word: str) -> Set[str]:
+    """Return ``word`` and every string it gives with one letter removed."""
+    return {word, *(word[:i] + word[i + 1 :] for i in range(len(word)))}
+
+
+def _edits(word: str, letters: str) -> Set[str]:
+    """Return every string one edit away from ``word`` using ``letters``."""
+    splits = [(word[:i], word[i:]) for i in range(len(word) + 1)]
+    edits = {a + b[1:] for a, b in splits if b}
+    edits |= {a + b[1] + b[0] + b[2:] for a, b in splits if len(b) > 1}
+    edits |= {a + c + b[1:] for a, b in splits if b for c in letters}
+    edits |= {a + c + b for a, b in splits for c in letters}
+    return edits
+
+
+def edit_distance(a: str, b: str, limit: int) -> int:
+    """Return the edit distance, counting adjacent transpositions as one edit.
+
+    Any distance above ``limit`` is reported as ``limit + 1``.
+    """
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    previous: Optional[List[int]] = None
+    row = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        current = [i] + [0] * len(b)
+        for j in range(1, len(b) + 1):
+            cost = a[i - 1] != b[j - 1]
+            current[j] = min(current[j - 1] + 1, row[j] + 1, row[j - 1] + cost)
+            if (
+                previous is not None
+                and j > 1
+                and a[i - 1] == b[j - 2]
+                and a[i - 2] == b[j - 1]
+            ):
+                current[j] = min(current[j], previous[j - 2] + 1)
+        if min(current) > limit:
+            return limit + 1
+        previous, row = row, current
+    return min(row[-1], limit + 1)
+
+
+def _key(text: str) -> int:
+    return hash(text) & 0xFFFFFFFF
+
+
+class FuzzyIndex:
+    """Symmetric-delete index over a word list for edit-distance lookups."""
+
+    def __init__(
+        self, words: Sequence[str], letters: str, ranks: Optional[Dict[str, int]] = None
+    ):
+        self.words = list(words)
+        self.letters = letters
+        self.ranks = ranks or {}
+        # Ids of removed words stay taken so the other ids remain valid
+        self.removed = 0
+        # Word ids sorted by the hash of each of their deletions
+        entries: List[int] = []
+        for wid, word in enumerate(self.words):
+            if not wid % 1024:
+                checkpoint()
+            entries.extend(_key(deleted) << 32 | wid for deleted in _deletes(word))
+        entries.sort()
+        checkpoint()
+        self.keys = array("I", (entry >> 32 for entry in entries))
+        self.ids = array("I", (entry & 0xFFFFFFFF for entry in entries))
+
+    def __len__(self) -> int:
+        return len(self.words) - self.removed
+
+    def _copy(self) -> "FuzzyIndex":
+        index = FuzzyIndex.__new__(FuzzyIndex)
+        index.words, index.letters, index.ranks = (
+            list(self.words),
+            self.letters,
+            self.ranks,
+        )
+        index.removed = self.removed
+        index.keys, index.ids = self.keys[:], self.ids[:]
+        return index
+
+    def _find(self, word: str) -> Optional[int]:
+        """Return the id of ``word``, or ``None`` if it is not indexed."""
+        key = _key(word)
+        lo = bisect_left(self.keys, key)
+        for wid in self.ids[lo : bisect_right(self.keys, key, lo)]:
+            if self.words[wid] == word:
+                return wid
+        return None
+
+    def with_word(self, word: str) -> "FuzzyIndex":
+        """Return an index that also finds ``word``."""
+        if self._find(word) is not None:
+            return self
+        index = self._copy()
+        wid = len(index.words)
+        index.words.append(word)
+        for deleted in _deletes(word):
+            # The new id is the largest, so it goes after its key's other ids
+            at = bisect_right(index.keys, _key(deleted))
+            index.keys.insert(at, _key(deleted))
+            index.ids.insert(at, wid)
+        return index
+
+    def without_word(self, word: str) -> "FuzzyIndex":
+        """Return an index that no longer finds ``word``."""
+        wid = self._find(word)
+        if wid is None:
+            return self
+        index = self._copy()
+        index.words[wid] = ""
+        index.removed += 1
+        for deleted in _deletes(word):
+            key = _key(deleted)
+            lo = bisect_left(index.keys, key)
+            at = lo + index.ids[lo : bisect_right(index.keys, key, lo)].index(wid)
+            del index.keys[at]
+            del index.ids[at]
+        return index
+
+    @property
+    def nbytes(self) -> int:
+        return len(self.keys) * self.keys.itemsize + len(self.ids) * self.ids.itemsize
+
+    def _candidates(self, variants: Iterable[str]) -> Set[int]:
+        """Return ids of words sharing a one-letter deletion with a variant."""
+        keys, ids = self.keys, self.ids
+        found: Set[int] = set()
+        for key in {
+            _key(deleted) for variant in variants for deleted in _deletes(variant)
+        }:
+            lo = bisect_left(keys, key)
+            if lo < len(keys) and keys[lo] == key:
+                found.update(ids[lo : bisect_right(keys, key, lo)])
+        return found
+
+    def lookup(
+        self, word: str, max_distance: int = 2, limit: int = 10
+    ) -> List[Tuple[str, int]]:
+        """Return up to ``limit`` (word, distance) suggestions for ``word``.
+
+        Closer words come first, then more frequent ones (by ``ranks``), then
+        alphabetical order. The word itself is included when it is known.
+        """
+        variants = {word}
+        if max_distance >= 2:
+            variants |= _edits(word, self.letters)
+        suggestions: List[Tuple[int, int, str]] = []
+        for n, wid in enumerate(self._candidates(variants)):
+            if not n % 256:
+                checkpoint()
+            candidate = self.words[wid]
+            distance = edit_distance(word, candidate, max_distance)
+            if distance <= max_distance:
+                rank = self.ranks.get(candidate, UNRANKED)
+                suggestions.append((distance, rank, candidate))
+        suggestions.sort()
+        return [(candidate, distance) for distance, _, candidate in suggestions[:limit]]
@@ -0,0 +1,286 @@
+"""Puzzle generator: find letter wheels whose solutions fit a level design.
+
+A Word Cookies style level is a rack of 5-8 letters, a set of common words
+formed from it and at least one pangram (a word using every letter). Rather
+than guessing racks and solving each one, the generator starts from the
+anagram classes of common words - every pangram class is a candidate rack -
+and assembles each rack's solutions from the classes of its sub-multisets.
+Sub-multiset enumeration is memoized, so racks sharing letters reuse each
+other's work.
+
+Word commonness comes from the Google 10k list, which is ordered by
+frequency: a word's rank is its line number there.
+
+    python generator.py --min-words 8 --max-words 15 --limit 5
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import threading
+import time
+from collections import Counter, OrderedDict
+from contextlib import redirect_stdout
+from dataclasses import asdict, dataclass, field
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
+
+from admission import checkpoint, remaining
+from config import Config, DictionaryType
+from solver import DictionarySnapshot, is_valid_word, load_snapshot
+
+
+def load_word_ranks() -> Dict[str, int]:
+    """Return each word's frequency rank (0 = most common)."""
+    for filepath in Config.get_dictionary_paths(DictionaryType.GOOGLE_10K):
+        if os.path.exists(filepath):
+            ranks: Dict[str, int] = {}
+            with open(filepath, "r", encoding="utf-8") as f:
+                for word in f:
+                    word = word.strip().lower()
+                    if word and word not in ranks:
+                        ranks[word] = len(ranks)
+            return ranks
+    return {}
+
+
+@dataclass
+class PuzzleConstraints:
+    """What a generated level must look like.
+
+    ``length_bounds`` maps a word length to the (min, max) number of
+    solution words of that length.
+    """
+
+    min_letters: int = 5
+    max_letters: int = 8
+    min_words: int = 8
+    max_words: int = 15
+    min_word_length: int = 3
+    max_rank: int = 10000
+    min_pangrams: int = 1
+    max_pangrams: int = 1
+    length_bounds: Dict[int, Tuple[int, int]] = field(default_factory=dict)
+
+    def accepts(self, words: List[str], pangrams: List[str]) -> bool:
+        if not self.min_words <= len(words) <= self.max_words:
+            return False
+        if not self.min_pangrams <= len(pangrams) <= self.max_pangrams:
+            return False
+        if self.length_bounds:
+            lengths = Counter(len(word) for word in words)
+            for length, (low, high) in self.length_bounds.items():
+                if not low <= lengths[length] <= high:
+                    return False
+        return True
+
+
+def parse_length_bounds(spec: str) -> Dict[int, Tuple[int, int]]:
+    """Parse "3:2-6,4:1-5" into {3: (2, 6), 4: (1, 5)}."""
+    bounds: Dict[int, Tuple[int, int]] = {}
+    for part in filter(None, (part.strip() for part in spec.split(","))):
+        length, _, span = part.partition(":")
+        low, _, high = span.partition("-")
+        try:
+            bounds[int(length)] = (int(low), int(high or low))
+        except ValueError:
+            raise ValueError(f"Invalid length bound {part!r}; expected L:MIN-MAX")
+    return bounds
+
+
+class PuzzleGenerator:
+    """Generate racks meeting ``PuzzleConstraints`` from one dictionary."""
+
+    # Anagram class maps kept for the most recently used cutoffs
+    CLASS_CACHE_SIZE = 8
+
+    def __init__(self, snapshot: DictionarySnapshot, ranks: Dict[str, int]):
+        self.snapshot = snapshot
+        self.ranks = ranks
+        # Common words grouped by anagram class, built per frequency cutoff
+        self._classes: "OrderedDict[Tuple[int, int], Dict[str, List[str]]]" = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    def classes(self, max_rank: int, min_length: int) -> Dict[str, List[str]]:
+        """Map sorted signatures to the common words spelled by them."""
+        # Every cutoff past the last ranked word selects the same words
+        key = (min(max_rank, len(self.ranks)), min_length)
+        with self._lock:
+            cached = self._classes.get(key)
+            if cached is not None:
+                self._classes.move_to_end(key)
+                return cached
+            classes: Dict[str, List[str]] = {}
+            dict_type = self.snapshot.dictionary_type
+            for word, rank in self.ranks.items():
+                if (
+                    rank < max_rank
+                    and word.isalpha()
+                    and word in self.snapshot.words
+                    and is_valid_word(word, min_length, dict_type)
+                ):
+                    classes.setdefault("".join(sorted(word)), []).append(word)
+            self._classes[key] = classes
+            if len(self._classes) > self.CLASS_CACHE_SIZE:
+                self._classes.popitem(last=False)
+            return classes
+
+    @staticmethod
+    @lru_cache(maxsize=65536)
+    def sub_multisets(signature: str) -> FrozenSet[str]:
+        """Return every sub-multiset of a sorted signature, itself included."""
+        subsets = {signature}
+        for i in range(len(signature)):
+            # Dropping the first of a run of equal letters is enough
+            if i and signature[i] == signature[i - 1]:
+                continue
+            subsets |= PuzzleGenerator.sub_multisets(signature[:i] + signature[i + 1 :])
+        return frozenset(subsets)
+
+    def candidates(
+        self, constraints: PuzzleConstraints, seed: Optional[int] = None
+    ) -> List[str]:
+        """Pangram classes in the allowed rack sizes, most common first."""
+        classes = self.classes(constraints.max_rank, constraints.min_word_length)
+        racks = [
+            signature
+            for signature in classes
+            if constraints.min_letters <= len(signature) <= constraints.max_letters
+        ]
+        if seed is not None:
+            random.Random(seed).shuffle(racks)  # nosec B311
+        else:
+            racks.sort(key=lambda sig: min(self.ranks[w] for w in classes[sig]))
+        return racks
+
+    def solve(self, rack: str, constraints: PuzzleConstraints) -> List[str]:
+        """Common words formable from ``rack``, shortest first."""
+        classes = self.classes(constraints.max_rank, constraints.min_word_length)
+        words = [
+            word
+            for subset in self.sub_multisets(rack)
+            if len(subset) >= constraints.min_word_length
+            for word in classes.get(subset, ())
+        ]
+        words.sort(key=lambda word: (len(word), word))
+        return words
+
+    def generate(
+        self,
+        constraints: PuzzleConstraints,
+        limit: int = 10,
+        time_budget: float = 1.0,
+        seed: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """Find up to ``limit`` puzzles within ``time_budget`` seconds.
+
+        Building the anagram classes for a new cutoff counts against the
+        budget too, and a running request's deadline shortens it so the
+        search returns what it found instead of failing.
+        """
+        started = time.monotonic()
+        left = remaining()
+        if left is not None:
+            time_budget = min(time_budget, left)
+        deadline = started + time_budget
+        puzzles: List[Dict[str, Any]] = []
+        examined = 0
+        timed_out = False
+        for rack in self.candidates(constraints, seed):
+            if time.monotonic() > deadline:
+                timed_out = True
+                break
+            checkpoint()
+            examined += 1
+            puzzle = self._puzzle(rack, constraints)
+            if puzzle is not None:
+                puzzles.append(puzzle)
+                if len(puzzles) >= limit:
+                    break
+        return {
+            "puzzles": puzzles,
+            "examined": examined,
+            "timed_out": timed_out,
+            "elapsed_ms": round((time.monotonic() - started) * 1000, 1),
+            "constraints": asdict(constraints),
+        }
+
+    def _puzzle(
+        self, rack: str, constraints: PuzzleConstraints
+    ) -> Optional[Dict[str, Any]]:
+        """Return the puzzle for ``rack``, or ``None`` if it is not acceptable."""
+        words = self.solve(rack, constraints)
+        pangrams = [word for word in words if len(word) == len(rack)]
+        if not constraints.accepts(words, pangrams):
+            return None
+        return {
+            "letters": rack,
+            "word_count": len(words),
+            "words": words,
+            "pangrams": pangrams,
+            "length_distribution": dict(sorted(Counter(map(len, words)).items())),
+        }
+
+
+def main(argv=None) -> int:
+    defaults = PuzzleConstraints()
+    parser = argparse.ArgumentParser(description="Generate WordMixr puzzles")
+    for name in (
+        "min_letters",
+        "max_letters",
+        "min_words",
+        "max_words",
+        "min_word_length",
+        "max_rank",
+        "min_pangrams",
+        "max_pangrams",
+    ):
+        parser.add_argument(
+            f"--{name.replace('_', '-')}", type=int, default=getattr(defaults, name)
+        )
+    parser.add_argument(
+        "--lengths", default="", help='Words per length, e.g. "3:2-6,4:1-5"'
+    )
+    parser.add_argument("--limit", type=int, default=10)
+    parser.add_argument("--time-budget", type=float, default=10.0, help="Seconds")
+    parser.add_argument("--seed", type=int, default=None, help="Shuffle candidates")
+    parser.add_argument(
+        "--dictionary",
+        type=DictionaryType,
+        default=Config.DICTIONARY_TYPE,
+        help="Dictionary type to solve with (default: $WORDMIXR_DICTIONARY)",
+    )
+    args = parser.parse_args(argv)
+
+    constraints = PuzzleConstraints(
+        args.min_letters,
+        args.max_letters,
+        args.min_words,
+        args.max_words,
+        args.min_word_length,
+        args.max_rank,
+        args.min_pangrams,
+        args.max_pangrams,
+        parse_length_bounds(args.lengths),
+    )
+    # Loading prints status messages; keep them out of the puzzles on stdout
+    with redirect_stdout(sys.stderr):
+        snapshot = load_snapshot(args.dictionary)
+    generator = PuzzleGenerator(snapshot, load_word_ranks())
+    result = generator.generate(constraints, args.limit, args.time_budget, args.seed)
+    for puzzle in result["puzzles"]:
+        print(json.dumps(puzzle))
+    print(
+        f"{len(result['puzzles'])} puzzles from {result['examined']} racks "
+        f"in {result['elapsed_ms']}ms",
+        file=sys.stderr,
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,597 @@
+import copy
+import hashlib
+from array import array
+from bisect import bisect_left
+from collections.abc import Set
+from functools import reduce
+from heapq import merge
+from itertools import compress, repeat
+from operator import and_, eq, not_, or_
+from typing import Callable, Dict, FrozenSet, Iterable, Iterator, List, Optional, Tuple
+
+from admission import checkpoint
+from alphabet import ENGLISH, Alphabet
+
+ALPHABET = ENGLISH.letters
+
+# Bundled word lists, smallest first. Bit ``i`` of a word's tier bits is set
+# when list ``i`` contains the word; its tier is the smallest such list.
+TIER_NAMES = ("common", "medium", "large")
+# Tier of words found in none of the bundled lists
+EXTENDED_TIER = "extended"
+_TIER_LABELS = [
+    next((name for i, name in enumerate(TIER_NAMES) if bits >> i & 1), EXTENDED_TIER)
+    for bits in range(1 << len(TIER_NAMES))
+]
+
+
+def tier_names(word_tiers: Dict[str, int]) -> Dict[str, str]:
+    """Map words to tier names, given their tier bits."""
+    return dict(zip(word_tiers, map(_TIER_LABELS.__getitem__, word_tiers.values())))
+
+
+def tier_mask(max_tier: str) -> int:
+    """Return the tier bits of every tier up to and including ``max_tier``."""
+    if max_tier == EXTENDED_TIER:
+        return 0
+    try:
+        return (2 << TIER_NAMES.index(max_tier)) - 1
+    except ValueError:
+        raise ValueError(f"Unknown word tier: {max_tier}")
+
+
+# Bit 63 of a class mask flags classes that repeat some letter more often
+# than the packed levels cover; their full letter counts live in
+# ``WordIndex.deep``
+DEEP_FLAG = 1 << 63
+
+
+def _packed_levels(alphabet: Alphabet) -> int:
+    """Number of letter-count levels that fit in one 63-bit class mask."""
+    levels = min(2, 63 // len(alphabet))
+    if levels < 1:
+        raise ValueError(f"Alphabet {alphabet.name} has too many letters to index")
+    return levels
+
+
+def _signature_levels(letters: str, positions: Dict[str, int], width: int) -> int:
+    """Return the full level mask for a string of letters."""
+    levels = 0
+    seen: Dict[str, int] = {}
+    for char in letters:
+        position = positions.get(char)
+        if position is None:
+            continue
+        level = seen.get(char, 0)
+        levels |= 1 << (level * width + position)
+        seen[char] = level + 1
+    return levels
+
+
+def dictionary_version(words: Iterable[str]) -> str:
+    """Return a short content hash identifying a word list."""
+    digest = hashlib.sha256()
+    for word in sorted(words):
+        digest.update(word.encode("utf-8"))
+        digest.update(b"\n")
+    return digest.hexdigest()[:16]
+
+
+def _level_mask(signature: str, bit: Callable[[str], int], level: int) -> int:
+    """Return the letters occurring at least ``level`` times in a sorted signature."""
+    # In a sorted signature a letter repeats ``level`` times exactly when it
+    # equals the character ``level - 1`` positions further on
+    if level == 1:
+        return reduce(or_, map(bit, signature), 0)
+    repeated = compress(signature, map(eq, signature, signature[level - 1 :]))
+    return reduce(or_, map(bit, repeated), 0)
+
+
+class SortedWordList(Set):
+    """Read-only word set stored as one sorted byte blob plus offsets.
+
+    Membership is a binary search that decodes only the probed words, so the
+    list can live in a shared memory mapping without creating a Python string
+    per word in every process. Set operations such as ``words | {"new"}``
+    return a regular ``frozenset``; ``with_word``/``without_word`` instead
+    return a copy that shares the blob and records the change in a small
+    overlay of added (``extra``) and removed (``hidden``) words, as
+    ``WordIndex`` does. Indexing and ``bisect`` work on the blob's words.
+    """
+
+    def __init__(self, blob, offsets):
+        self.blob = blob
+        self.offsets = offsets
+        # Words added after the build
+        self.extra: FrozenSet[str] = frozenset()
+        # Blob words removed after the build
+        self.hidden: FrozenSet[str] = frozenset()
+
+    @classmethod
+    def build(cls, words: Iterable[str]) -> "SortedWordList":
+        blob = bytearray()
+        offsets = array("I", [0])
+        for word in sorted(set(words)):
+            blob += word.encode("utf-8")
+            offsets.append(len(blob))
+        return cls(bytes(blob), offsets)
+
+    @classmethod
+    def _from_iterable(cls, iterable):
+        return frozenset(iterable)
+
+    @property
+    def stored(self) -> int:
+        """Number of words in the blob, removed ones included."""
+        return len(self.offsets) - 1
+
+    def __len__(self) -> int:
+        return self.stored - len(self.hidden) + len(self.extra)
+
+    def __getitem__(self, i: int) -> str:
+        return str(self.blob[self.offsets[i] : self.offsets[i + 1]], "utf-8")
+
+    def __iter__(self) -> Iterator[str]:
+        stored = (self[i] for i in range(self.stored))
+        if not self.extra and not self.hidden:
+            return stored
+        hidden = self.hidden
+        return merge(
+            (word for word in stored if word not in hidden), sorted(self.extra)
+        )
+
+    def _stores(self, word: str) -> bool:
+        # Sorting by code point matches sorting the UTF-8 encoded bytes
+        i = bisect_left(self, word, 0, self.stored)
+        return i < self.stored and self[i] == word
+
+    def __contains__(self, word: object) -> bool:
+        if not isinstance(word, str):
+            return False
+        if word in self.extra:
+            return True
+        return word not in self.hidden and self._stores(word)
+
+    def contains_many(self, words: Iterable[str]) -> FrozenSet[str]:
+        """Return the members among ``words`` in one sorted pass.
+
+        Candidates are probed in order, each search starting where the last
+        one ended, so a large batch narrows the range as it goes.
+        """
+        found = set()
+        lo = 0
+        for word in sorted(set(words)):
+            lo = bisect_left(self, word, lo, self.stored)
+            if lo == self.stored:
+                break
+            if self[lo] == word:
+                found.add(word)
+        return frozenset((found - self.hidden) | (self.extra & set(words)))
+
+    def _edited(
+        self, extra: FrozenSet[str], hidden: FrozenSet[str]
+    ) -> "SortedWordList":
+        edited = copy.copy(self)
+        edited.extra = extra
+        edited.hidden = hidden
+        return edited
+
+    def with_word(self, word: str) -> "SortedWordList":
+        """Return a copy that also contains ``word``, sharing the blob."""
+        if word in self:
+            return self
+        if word in self.hidden:
+            return self._edited(self.extra, self.hidden - {word})
+        return self._edited(self.extra | {word}, self.hidden)
+
+    def without_word(self, word: str) -> "SortedWordList":
+        """Return a copy without ``word``, sharing the blob."""
+        if word not in self:
+            return self
+        if word in self.extra:
+            return self._edited(self.extra - {word}, self.hidden)
+        return self._edited(self.extra, self.hidden | {word})
+
+    __hash__ = Set._hash
+
+
+class WordIndex:
+    """Immutable anagram-class index over a dictionary word list.
+
+    Words with the same letters (the same sorted signature) share one anagram
+    class. Classes are ordered by word length so every length bucket is a
+    contiguous range of class ids.
+
+    Letter multisets are encoded as level masks: with an alphabet of ``W``
+    letters, bit ``k * W + i`` is set when letter ``i`` occurs more than ``k``
+    times. A word fits a rack exactly when its level mask is a subset of the
+    rack's. The first levels of every class (two for alphabets of up to 31
+    letters, one for larger ones) are packed into one 64-bit ``masks`` entry,
+    so the solver rejects almost every class with a single integer test run
+    entirely in C; the rare classes repeating a letter more often keep their
+    full level mask in ``deep``.
+
+    All per-class data lives in flat arrays and one byte blob holding the
+    words themselves, which keeps the index compact and cheap to rebuild.
+    Optionally every word also carries tier bits (see ``TIER_NAMES``) in
+    ``tiers``, stored in blob order with ``word_starts`` giving each class's
+    first word, so a run of classes yields its tiers with one slice.
+    Individual words are added or removed without touching those arrays:
+    ``with_word``/``without_word`` return a copy that shares them and records
+    the change in a small per-length overlay (``extra``) or a set of hidden
+    base words (``hidden``).
+    """
+
+    def __init__(
+        self,
+        masks: array,
+        deep: Dict[int, int],
+        starts: array,
+        blob: bytes,
+        length_starts: array,
+        word_count: int,
+        dictionary_type: str,
+        alphabet: Alphabet = ENGLISH,
+        tiers: Optional[bytes] = None,
+        word_starts: Optional[array] = None,
+    ):
+        self.masks = masks
+        self.deep = deep
+        self.starts = starts
+        self.blob = blob
+        self.length_starts = length_starts
+        self.word_count = word_count
+        self.dictionary_type = dictionary_type
+        self.alphabet = alphabet
+        self.tiers = tiers
+        self.word_starts = word_starts
+        self._positions = alphabet.positions
+        self._width = len(alphabet)
+        self._packed_bits = _packed_levels(alphabet) * self._width
+        self.max_length = len(length_starts) - 2
+        # Words added after the build, keyed by length: (level mask, word)
+        self.extra: Dict[int, Tuple[Tuple[int, str], ...]] = {}
+        # Base words removed after the build
+        self.hidden: FrozenSet[str] = frozenset()
+        # True when the arrays are mapped from a shared index file
+        self.shared = False
+
+    @classmethod
+    def build(
+        cls,
+        words: Iterable[str],
+        dictionary_type: str = "scowl_large",
+        keep: Optional[Callable[[str], bool]] = None,
+        alphabet: Alphabet = ENGLISH,
+        tiers: Optional[Callable[[str], int]] = None,
+    ) -> "WordIndex":
+        """Build an index over ``words``, skipping words rejected by ``keep``.
+
+        ``tiers`` returns the tier bits to record for a word.
+        """
+        letters = alphabet.letter_set
+        classes: dict = {}
+        for word in words:
+            # Words with characters outside the alphabet can never be formed
+            # from cleaned input letters
+            if not word or not letters.issuperset(word):
+                continue
+            if keep is not None and not keep(word):
+                continue
+            classes.setdefault("".join(sorted(word)), []).append(word)
+
+        signatures = sorted(classes, key=lambda sig: (len(sig), sig))
+        max_length = len(signatures[-1]) if signatures else 0
+
+        masks = array("Q")
+        deep: Dict[int, int] = {}
+        starts = array("I", [0])
+        blob = bytearray()
+        width = len(alphabet)
+        packed = _packed_levels(alphabet)
+        bit = {letter: 1 << i for i, letter in enumerate(alphabet.letters)}.__getitem__
+        word_count = 0
+        tier_bits = bytearray()
+        word_starts = array("I", [0])
+
+        for cid, signature in enumerate(signatures):
+            mask = 0
+            for level in range(1, packed + 1):
+                mask |= _level_mask(signature, bit, level) << ((level - 1) * width)
+            # Some letter occurs more than ``packed`` times
+            if any(map(eq, signature, signature[packed:])):
+                deep[cid] = _signature_levels(signature, alphabet.positions, width)
+                mask |= DEEP_FLAG
+            masks.append(mask)
+
+            members = sorted(classes[signature])
+            word_count += len(members)
+            # Every word ends in "\n" so runs of classes decode in one slice
+            blob += "".join(word + "\n" for word in members).encode("utf-8")
+            starts.append(len(blob))
+            if tiers is not None:
+                tier_bits += bytes(map(tiers, members))
+                word_starts.append(word_count)
+
+        # Length bucket L spans class ids [length_starts[L], length_starts[L + 1])
+        lengths = [len(signature) for signature in signatures]
+        length_starts = array(
+            "I", [bisect_left(lengths, length) for length in range(max_length + 2)]
+        )
+
+        return cls(
+            masks,
+            deep,
+            starts,
+            bytes(blob),
+            length_starts,
+            word_count,
+            dictionary_type,
+            alphabet,
+            bytes(tier_bits) if tiers is not None else None,
+            word_starts if tiers is not None else None,
+        )
+
+    def __len__(self) -> int:
+        return self.word_count
+
+    def _signature_levels(self, letters: str) -> int:
+        """Return the full level mask for a string of letters."""
+        return _signature_levels(letters, self._positions, self._width)
+
+    def _rack_mask(self, levels: int) -> int:
+        """Pack the first levels of a rack the same way class masks are."""
+        bits = self._packed_bits
+        packed = levels & ((1 << bits) - 1)
+        if levels >> bits:
+            packed |= DEEP_FLAG
+        return packed
+
+    def _class_range(self, min_length: int, max_length: int) -> range:
+        """Return the class ids holding words of the given length range."""
+        min_length = max(min_length, 1)
+        max_length = min(max_length, self.max_length)
+        if min_length > max_length:
+            return range(0)
+        return range(self.length_starts[min_length], self.length_starts[max_length + 1])
+
+    def _run_words(self, first: int, last: int) -> List[str]:
+        """Return the words of the contiguous classes ``first..last``."""
+        start, end = self.starts[first], self.starts[last + 1]
+        # ``str`` accepts bytes and memoryviews alike
+        return str(self.blob[start : end - 1], "utf-8").split("\n")
+
+    def _class_words(self, cid: int) -> List[str]:
+        return self._run_words(cid, cid)
+
+    @property
+    def has_tiers(self) -> bool:
+        return self.tiers is not None and self.word_starts is not None
+
+    @property
+    def nbytes(self) -> int:
+        """Approximate size of the index's flat arrays in bytes."""
+        return (
+            len(self.masks) * 8
+            + len(self.starts) * 4
+            + len(self.length_starts) * 4
+            + len(self.blob)
+            + len(self.tiers or b"")
+            + len(self.word_starts or ()) * 4
+        )
+
+    def _derive(
+        self,
+        extra: Dict[int, Tuple[Tuple[int, str], ...]],
+        hidden: FrozenSet[str],
+        word_count: int,
+    ) -> "WordIndex":
+        """Return a copy sharing the base arrays with a different overlay."""
+        derived = copy.copy(self)
+        derived.extra = extra
+        derived.hidden = hidden
+        derived.word_count = word_count
+        return derived
+
+    def _base_anagrams(self, letters: str, levels: int) -> List[str]:
+        """Return the base anagram class for ``letters``, ignoring the overlay."""
+        classes = self._class_range(len(letters), len(letters))
+        masks = self.masks[classes.start : classes.stop]
+        rack = self._rack_mask(levels)
+        for cid in compress(classes, map(eq, masks, repeat(rack))):
+            if cid in self.deep and self.deep[cid] != levels:
+                continue
+            return self._class_words(cid)
+        return []
+
+    def __contains__(self, word: object) -> bool:
+        if not isinstance(word, str) or word in self.hidden:
+            return False
+        if any(extra == word for _, extra in self.extra.get(len(word), ())):
+            return True
+        return word in self._base_anagrams(word, self._signature_levels(word))
+
+    def with_word(self, word: str) -> "WordIndex":
+        """Return a copy of the index that also contains ``word``.
+
+        The cost depends on the number of edits so far, not on the size of
+        the dictionary.
+        """
+        if not self.alphabet.spells(word):
+            raise ValueError(f"Word contains letters outside the alphabet: {word!r}")
+        if word in self.hidden:
+            return self._derive(self.extra, self.hidden - {word}, self.word_count + 1)
+        if word in self:
+            return self
+        extra = dict(self.extra)
+        entry = (self._signature_levels(word), word)
+        extra[len(word)] = extra.get(len(word), ()) + (entry,)
+        return self._derive(extra, self.hidden, self.word_count + 1)
+
+    def without_word(self, word: str) -> "WordIndex":
+        """Return a copy of the index that no longer contains ``word``."""
+        if word not in self:
+            return self
+        bucket = self.extra.get(len(word), ())
+        if any(extra == word for _, extra in bucket):
+            extra = dict(self.extra)
+            remaining = tuple(entry for entry in bucket if entry[1] != word)
+            if remaining:
+                extra[len(word)] = remaining
+            else:
+                del extra[len(word)]
+            return self._derive(extra, self.hidden, self.word_count - 1)
+        return self._derive(self.extra, self.hidden | {word}, self.word_count - 1)
+
+    def find_words(self, letters: str, min_length: int = 3) -> List[str]:
+        """Return all words formable from ``letters``, shortest first.
+
+        The cost is bounded by the size of the dictionary, not by the number
+        of letter combinations in the rack, so long racks stay fast.
+        """
+        levels = self._signature_levels(letters)
+        not_rack = repeat(~self._rack_mask(levels))
+
+        words: List[str] = []
+        for length in range(max(min_length, 1), len(letters) + 1):
+            checkpoint()
+            # Decode runs of adjacent matching classes with a single slice;
+            # for long racks most classes match and runs get long
+            bucket: List[str] = []
+            for first, last in self._matching_runs(length, levels, not_rack):
+                bucket += self._run_words(first, last)
+
+            if self.hidden:
+                bucket = [word for word in bucket if word not in self.hidden]
+            for word_levels, word in self.extra.get(length, ()):
+                if not word_levels & ~levels:
+                    bucket.append(word)
+
+            # Classes are ordered by signature, so only sort within the length
+            bucket.sort()
+            words += bucket
+        return words
+
+    def find_hook_words(
+        self, letters: str, anchors: str, min_length: int = 3
+    ) -> Dict[str, str]:
+        """Map each word formable from ``letters`` plus exactly one of
+        ``anchors`` to the anchor letter it needs, shortest words first.
+
+        All anchors share one scan: the rack gets one copy of every anchor
+        letter, and a matching class uses a single anchor exactly when its
+        level mask has one bit the plain rack lacks.
+        """
+        rack = self._signature_levels(letters)
+        combined = letters + "".join(sorted(set(anchors)))
+        levels = self._signature_levels(combined)
+        not_rack = repeat(~self._rack_mask(levels))
+        width, alphabet, deep, masks = self._width, self.alphabet, self.deep, self.masks
+
+        def anchor(word_levels: int) -> Optional[str]:
+            extra = word_levels & ~rack
+            if not extra or extra & (extra - 1):
+                return None
+            return alphabet.letters[(extra.bit_length() - 1) % width]
+
+        hooks: List[Tuple[str, str]] = []
+        for length in range(max(min_length, 1), len(combined) + 1):
+            checkpoint()
+            for first, last in self._matching_runs(length, levels, not_rack):
+                for cid in range(first, last + 1):
+                    letter = anchor(deep.get(cid, masks[cid]))
+                    if letter is not None:
+                        hooks += ((word, letter) for word in self._class_words(cid))
+            for word_levels, word in self.extra.get(length, ()):
+                letter = anchor(word_levels)
+                if letter is not None and not word_levels & ~levels:
+                    hooks.append((word, letter))
+
+        hooks.sort(key=lambda hook: (len(hook[0]), hook[0]))
+        return {word: letter for word, letter in hooks if word not in self.hidden}
+
+    def find_tiered_words(
+        self, letters: str, min_length: int = 3, mask: int = 0
+    ) -> Tuple[List[str], Dict[str, int]]:
+        """Return ``find_words`` results and the tier bits of each word.
+
+        With a ``mask`` (see ``tier_mask``), only words in one of the masked
+        tiers are returned. Tier bits are sliced per run alongside the words,
+        so this is the same scan as ``find_words``.
+        """
+        if self.tiers is None or self.word_starts is None:
+            raise ValueError("This index has no word tiers")
+        tiers, word_starts = self.tiers, self.word_starts
+        levels = self._signature_levels(letters)
+        not_rack = repeat(~self._rack_mask(levels))
+
+        words: List[str] = []
+        word_tiers: Dict[str, int] = {}
+        for length in range(max(min_length, 1), len(letters) + 1):
+            checkpoint()
+            bucket: List[str] = []
+            for first, last in self._matching_runs(length, levels, not_rack):
+                run = self._run_words(first, last)
+                bits = tiers[word_starts[first] : word_starts[last + 1]]
+                if mask:
+                    keep = list(map(and_, bits, repeat(mask)))
+                    run = list(compress(run, keep))
+                    bits = bytes(compress(bits, keep))
+                bucket += run
+                word_tiers.update(zip(run, bits))
+
+            if self.hidden:
+                bucket = [word for word in bucket if word not in self.hidden]
+            if not mask:
+                # Words added after the build are in none of the bundled lists
+                for word_levels, word in self.extra.get(length, ()):
+                    if not word_levels & ~levels:
+                        bucket.append(word)
+                        word_tiers[word] = 0
+
+            bucket.sort()
+            words += bucket
+        for word in self.hidden:
+            word_tiers.pop(word, None)
+        return words, word_tiers
+
+    def _matching_runs(
+        self, length: int, levels: int, not_rack: Iterator[int]
+    ) -> Iterator[Tuple[int, int]]:
+        """Yield the ``(first, last)`` runs of ``length``-letter classes that fit."""
+        classes = self._class_range(length, length)
+        masks = self.masks[classes.start : classes.stop]
+        deep = self.deep
+
+        # Keep classes whose packed mask is a subset of the rack's. Without
+        # DEEP_FLAG in the rack this also rejects every deep class.
+        candidates = compress(classes, map(not_, map(and_, masks, not_rack)))
+
+        first = last = -2
+        for cid in candidates:
+            if cid in deep and deep[cid] & ~levels:
+                continue
+            if cid != last + 1:
+                if first >= 0:
+                    yield first, last
+                first = cid
+            last = cid
+        if first >= 0:
+            yield first, last
+
+    def find_anagrams(self, letters: str, min_length: int = 3) -> List[str]:
+        """Return all words using exactly the letters in ``letters``."""
+        if len(letters) < min_length:
+            return []
+        levels = self._signature_levels(letters)
+        anagrams = self._base_anagrams(letters, levels)
+
+        if self.hidden:
+            anagrams = [word for word in anagrams if word not in self.hidden]
+        extra = self.extra.get(len(letters), ())
+        if extra:
+            anagrams = sorted(
+                anagrams
+                + [word for word_levels, word in extra if word_levels == levels]
+            )
+        return anagrams
@@ -0,0 +1,135 @@
+"""Word ladders: shortest chains of words that change one letter at a time.
+
+``LadderGraph`` holds the words of one length. Two words are neighbours when
+they match the same wildcard pattern, such as "c?ld" for "cold" and "cord",
+so the graph is stored as buckets of word ids keyed by pattern instead of as
+explicit edges. ``find`` runs a bidirectional breadth-first search that
+always grows the smaller side by one whole layer, and gives up once it has
+visited ``max_nodes`` words or run for ``time_limit`` seconds.
+"""
+
+import time
+from dataclasses import dataclass
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+from admission import checkpoint
+
+# Stands in for the changed letter in a bucket pattern
+WILDCARD = "?"
+
+# Search outcomes
+FOUND = "found"
+UNREACHABLE = "unreachable"
+NODE_LIMIT = "node_limit"
+TIME_LIMIT = "time_limit"
+
+
+@dataclass(frozen=True)
+class LadderResult:
+    """A ladder search outcome and how many words it visited."""
+
+    status: str
+    path: List[str]
+    explored: int
+
+    @property
+    def found(self) -> bool:
+        return self.status == FOUND
+
+
+class LadderGraph:
+    """Words of one length linked by single-letter changes."""
+
+    def __init__(self, words: Sequence[str]):
+        if not words:
+            raise ValueError("No words to index")
+        self.words = list(words)
+        self.length = len(self.words[0])
+        self.ids = {word: wid for wid, word in enumerate(self.words)}
+        buckets: Dict[str, List[int]] = {}
+        for wid, word in enumerate(self.words):
+            for pattern in self._patterns(word):
+                buckets.setdefault(pattern, []).append(wid)
+        # Patterns matching a single word link nothing
+        self.buckets: Dict[str, Tuple[int, ...]] = {
+            pattern: tuple(ids) for pattern, ids in buckets.items() if len(ids) > 1
+        }
+
+    def __len__(self) -> int:
+        return len(self.words)
+
+    def __contains__(self, word: object) -> bool:
+        return word in self.ids
+
+    def _patterns(self, word: str) -> Iterator[str]:
+        for i in range(len(word)):
+            yield word[:i] + WILDCARD + word[i + 1 :]
+
+    def neighbours(self, wid: int) -> Iterator[int]:
+        """Yield the ids of words one letter away from word ``wid``."""
+        for pattern in self._patterns(self.words[wid]):
+            for other in self.buckets.get(pattern, ()):
+                if other != wid:
+                    yield other
+
+    def _path(self, meeting: int, parents: Dict[int, Optional[int]]) -> List[str]:
+        """Return the words from ``meeting`` back to the root of ``parents``."""
+        path: List[str] = []
+        node: Optional[int] = meeting
+        while node is not None:
+            path.append(self.words[node])
+            node = parents[node]
+        return path
+
+    def find(
+        self,
+        start: str,
+        end: str,
+        max_nodes: int = 50000,
+        time_limit: float = 0.25,
+    ) -> LadderResult:
+        """Return a shortest ladder from ``start`` to ``end``, both in the graph.
+
+        Each layer is expanded from the side with the smaller frontier. A
+        word first reached from one side that the other side has already
+        visited closes the shortest ladder, since every word the other side
+        knows sits on its newest layer or has had all its neighbours seen.
+        """
+        for word in (start, end):
+            if word not in self.ids:
+                raise ValueError(f"{word!r} is not a {self.length}-letter word")
+        if start == end:
+            return LadderResult(FOUND, [start], 1)
+
+        deadline = time.monotonic() + time_limit
+        source, target = self.ids[start], self.ids[end]
+        parents: Tuple[Dict[int, Optional[int]], ...] = (
+            {source: None},
+            {target: None},
+        )
+        frontiers = [[source], [target]]
+        while frontiers[0] and frontiers[1]:
+            side = 0 if len(frontiers[0]) <= len(frontiers[1]) else 1
+            seen, other = parents[side], parents[1 - side]
+            layer: List[int] = []
+            for wid in frontiers[side]:
+                explored = len(seen) + len(other)
+                if explored > max_nodes:
+                    return LadderResult(NODE_LIMIT, [], explored)
+                if time.monotonic() > deadline:
+                    return LadderResult(TIME_LIMIT, [], explored)
+                checkpoint()
+                for nid in self.neighbours(wid):
+                    if nid in seen:
+                        continue
+                    seen[nid] = wid
+                    if nid in other:
+                        # Walk back to this side's root and on to the other's
+                        path = self._path(nid, seen)[::-1]
+                        path += self._path(nid, other)[1:]
+                        if side == 1:
+                            path.reverse()
+                        return LadderResult(FOUND, path, len(seen) + len(other))
+                    layer.append(nid)
+            frontiers[side] = layer
+        return LadderResult(UNREACHABLE, [], len(parents[0]) + len(parents[1]))
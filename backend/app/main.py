@@ -1,52 +1,436 @@
+import asyncio
 import logging
+import math
+import os
+import secrets
+import threading
+import time
 from contextlib import asynccontextmanager
+from typing import Any, Callable, Dict, List, Literal, Optional, Tuple
 
-from config import Config
-from fastapi import FastAPI, HTTPException, Query
+from admission import AdmissionController, Cancelled, Deadline, RequestRejected
+from alphabet import ENGLISH
+from cache import CacheBackend, ResultCache, create_result_cache
+from config import Config, DictionaryType
+from engine import WordSolver
+from fastapi import (
+    BackgroundTasks,
+    Depends,
+    FastAPI,
+    Header,
+    HTTPException,
+    Query,
+    Request,
+    Response,
+)
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
-from solver import find_valid_words, get_anagrams, load_dictionary
-from utils import format_error_response, format_response, validate_letters
+from fastapi.responses import JSONResponse
+from generator import (
+    PuzzleConstraints,
+    PuzzleGenerator,
+    load_word_ranks,
+    parse_length_bounds,
+)
+from profiler import solver_profiler
+from pydantic import BaseModel, Field
+from registry import DictionaryRegistry
+from request_log import RequestLog
+from responses import json_response
+from shared_index import load_shared_snapshot
+from solver import (
+    DictionarySnapshot,
+    build_snapshot,
+    load_dictionary,
+    load_snapshot,
+    parse_anchors,
+    save_overlay,
+)
+from utils import (
+    format_error_response,
+    format_response,
+    make_etag,
+    matching_etag,
+    process_memory,
+    validate_grid,
+    validate_letters,
+)
+from warmer import load_warm_cache
+from wordle import parse_feedback
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# Global dictionary and metadata - loaded at startup
-DICTIONARY = None
-DICTIONARY_INFO = None
+# Solver engine for the configured dictionary - built at startup and replaced
+# atomically on reload. Handlers read it once and use that engine (and its
+# immutable snapshot) for the whole request.
+ENGINE: Optional[WordSolver] = None
+
+
+def _current_snapshot() -> Optional[DictionarySnapshot]:
+    engine = ENGINE
+    return engine.snapshot if engine is not None else None
+
+
+def _create_result_cache() -> CacheBackend:
+    """Create the configured result cache, falling back to memory on error."""
+    try:
+        return create_result_cache(
+            Config.RESULT_CACHE_BACKEND,
+            maxsize=Config.RESULT_CACHE_SIZE,
+            ttl=Config.RESULT_CACHE_TTL,
+            path=Config.RESULT_CACHE_PATH,
+            url=Config.RESULT_CACHE_URL,
+        )
+    except Exception as e:
+        logger.error(
+            f"Failed to create {Config.RESULT_CACHE_BACKEND} result cache: {e}"
+        )
+        return ResultCache(Config.RESULT_CACHE_SIZE, Config.RESULT_CACHE_TTL)
+
+
+# Solver results keyed by dictionary version
+RESULT_CACHE = _create_result_cache()
+
+
+def _create_admission() -> AdmissionController:
+    return AdmissionController(
+        Config.MAX_ACTIVE_SOLVES,
+        Config.MAX_QUEUED_SOLVES,
+        Config.QUEUE_TIMEOUT_MS / 1000,
+        Config.MAX_SOLVES_PER_CLIENT,
+    )
+
+
+def _create_request_log() -> RequestLog:
+    return RequestLog(Config.REQUEST_LOG_SAMPLE_RATE, Config.REQUEST_LOG_QUEUE_SIZE)
+
+
+# Sampled per-request records (endpoint, rack length, results, latency),
+# written by a background thread; started and stopped with the app
+REQUEST_LOG = _create_request_log()
+
+# Limits how many solver requests run at once and how many may wait; rebuilt
+# at startup so it belongs to the serving event loop
+ADMISSION = _create_admission()
+
+# Extra dictionaries (``WORDMIXR_DICTIONARIES``) resident next to ENGINE and
+# selectable per request
+REGISTRY = DictionaryRegistry()
+
+# Dictionary reload bookkeeping. The lock also serialises single-word edits
+# so an edit can never be lost to a concurrent reload.
+RELOAD_STATUS: Dict[str, Any] = {"state": "idle", "error": None}
+_reload_lock = threading.Lock()
+
+# Background fuzzy index builds: one thread at most, building for the served
+# engine under a deadline that is cancelled once that engine is replaced
+_fuzzy_build_lock = threading.Lock()
+_fuzzy_build: Optional[Tuple[WordSolver, Deadline]] = None
+_fuzzy_builder: Optional[threading.Thread] = None
+
+# Puzzle generator for the current snapshot, rebuilt when the snapshot changes
+_puzzle_generator: Optional[PuzzleGenerator] = None
+
+
+def _load_snapshot(
+    config_type: Optional[DictionaryType] = None, tier: str = "full"
+) -> DictionarySnapshot:
+    """Load a snapshot, attaching to the shared index file when configured."""
+    if Config.SHARED_INDEX_PATH and tier == "full":
+        return load_shared_snapshot(Config.SHARED_INDEX_PATH, config_type, tier=tier)
+    return load_snapshot(config_type, tier=tier)
+
+
+def _load_resident_dictionaries() -> None:
+    """Load the extra resident dictionaries, sharing words between them."""
+    for dict_type in Config.RESIDENT_DICTIONARIES:
+        if dict_type == Config.resolve_dictionary_type() or REGISTRY.get(
+            dict_type.value
+        ):
+            continue
+        try:
+            # Word edits and the shared index file apply to the default
+            # dictionary only
+            words, info = load_dictionary(dict_type)
+            engine = REGISTRY.register(
+                dict_type.value, build_snapshot(words, info), _current_snapshot()
+            )
+        except Exception as e:
+            logger.error(f"Failed to load resident dictionary {dict_type.value}: {e}")
+            continue
+        logger.info(
+            f"Resident dictionary {dict_type.value}: "
+            f"{engine.snapshot.info['filepath']} ({engine.snapshot.info['size']} words)"
+        )
+
+
+def _primary_name(snapshot: DictionarySnapshot) -> str:
+    """Dictionary type name the default snapshot answers to."""
+    if snapshot.tier == "fast":
+        # Stand-in for the configured dictionary while it loads
+        return Config.resolve_dictionary_type().value
+    configured = str(
+        snapshot.info.get("config", {}).get("type", Config.DICTIONARY_TYPE.value)
+    )
+    if configured == DictionaryType.AUTO.value:
+        # Answer to the type "auto" picked, which requests can name
+        return snapshot.dictionary_type
+    return configured
+
+
+def _select_engine(dictionary: Optional[DictionaryType]) -> WordSolver:
+    """Return the engine a request asked for, the default one if none."""
+    engine = ENGINE
+    if engine is None:
+        raise HTTPException(status_code=500, detail="Dictionary not loaded")
+    snapshot = engine.snapshot
+    if dictionary is None or dictionary.value == _primary_name(snapshot):
+        return engine
+    selected = REGISTRY.get(dictionary.value)
+    if selected is not None:
+        return selected
+    if dictionary in Config.RESIDENT_DICTIONARIES:
+        raise HTTPException(
+            status_code=503, detail=f"Dictionary {dictionary.value} is still loading"
+        )
+    available = [_primary_name(snapshot), *REGISTRY.names()]
+    raise HTTPException(
+        status_code=400,
+        detail=f"Dictionary {dictionary.value} is not loaded "
+        f"(available: {', '.join(available)})",
+    )
+
+
+def _build_fuzzy_indexes() -> None:
+    """Build the served engine's fuzzy index, following engine swaps."""
+    global _fuzzy_build, _fuzzy_builder
+    while True:
+        with _fuzzy_build_lock:
+            engine = ENGINE
+            if engine is None or engine.has_fuzzy_index:
+                _fuzzy_build = _fuzzy_builder = None
+                return
+            build = Deadline(math.inf)
+            _fuzzy_build = (engine, build)
+        try:
+            build.run(lambda: engine.fuzzy_index)
+        except Cancelled:
+            # The engine was replaced; go on with the one now served
+            continue
+        except Exception as e:
+            logger.error(f"Failed to build the fuzzy index: {e}")
+            with _fuzzy_build_lock:
+                _fuzzy_build = _fuzzy_builder = None
+            return
+
+
+def _prebuild_fuzzy_index(engine: WordSolver) -> None:
+    """Build the served engine's fuzzy lookup index in the background.
+
+    A single thread does the building. A build for an engine that has since
+    been replaced is cancelled and the thread moves on to the new one, so a
+    burst of edits or reloads cannot pile up builds.
+    """
+    global _fuzzy_builder
+    with _fuzzy_build_lock:
+        if _fuzzy_build is not None and _fuzzy_build[0] is not engine:
+            _fuzzy_build[1].cancel()
+        if (
+            not Config.FUZZY_PREBUILD
+            or engine.has_fuzzy_index
+            or _fuzzy_builder is not None
+        ):
+            return
+        _fuzzy_builder = threading.Thread(
+            target=_build_fuzzy_indexes, name="fuzzy-index", daemon=True
+        )
+        _fuzzy_builder.start()
+
+
+def _warm_result_cache(snapshot: DictionarySnapshot) -> None:
+    """Preload the warm-cache artifact for a snapshot about to be served."""
+    if not Config.WARM_CACHE_PATH or snapshot.tier != "full":
+        return
+    try:
+        loaded = load_warm_cache(
+            Config.WARM_CACHE_PATH,
+            RESULT_CACHE,
+            snapshot.version,
+            snapshot.content_version,
+            snapshot.added | snapshot.removed,
+        )
+    except Exception as e:
+        logger.error(f"Failed to load warm cache {Config.WARM_CACHE_PATH}: {e}")
+        return
+    if loaded:
+        logger.info(f"Loaded {loaded} warm cache results")
+    else:
+        logger.warning(
+            f"Warm cache {Config.WARM_CACHE_PATH} does not match dictionary "
+            f"version {snapshot.version}; skipped"
+        )
+
+
+def _purge_result_cache(snapshot: DictionarySnapshot) -> None:
+    """Drop cached results of word lists this process no longer serves.
+
+    Shared caches are left alone: other workers may still serve those
+    versions and, while this one serves the fast tier, they hold the full
+    dictionary's results. Their stale entries expire with the TTL.
+    """
+    if RESULT_CACHE.shared or snapshot.tier != "full":
+        return
+    RESULT_CACHE.purge(snapshot.content_version, REGISTRY.versions())
+
+
+def reload_dictionary(
+    config_type: Optional[DictionaryType] = None,
+) -> DictionarySnapshot:
+    """Build a new dictionary snapshot and swap it in.
+
+    The dictionary and its index are built off to the side; the swap itself is
+    a single reference assignment, so in-flight requests finish on the old
+    snapshot and new requests see the new one.
+    """
+    global ENGINE
+    if not _reload_lock.acquire(blocking=False):
+        raise RuntimeError("A dictionary reload is already in progress")
+    try:
+        RELOAD_STATUS.update(state="running", started_at=time.time(), error=None)
+        snapshot = REGISTRY.share(_load_snapshot(config_type))
+        _warm_result_cache(snapshot)
+        previous = _current_snapshot()
+        ENGINE = WordSolver.from_snapshot(snapshot)
+        _prebuild_fuzzy_index(ENGINE)
+        _purge_result_cache(snapshot)
+        RELOAD_STATUS.update(
+            state="idle", finished_at=time.time(), version=snapshot.version
+        )
+        logger.info(
+            f"Reloaded dictionary {snapshot.info['filepath']} "
+            f"({snapshot.info['size']} words, version {snapshot.version}, "
+            f"previous {previous.version if previous else 'none'})"
+        )
+        return snapshot
+    except Exception as e:
+        RELOAD_STATUS.update(state="failed", finished_at=time.time(), error=str(e))
+        raise
+    finally:
+        _reload_lock.release()
+
+
+def _run_reload(config_type: Optional[DictionaryType] = None) -> None:
+    """Run a reload in the background, logging instead of raising."""
+    try:
+        reload_dictionary(config_type)
+    except Exception as e:
+        logger.error(f"Dictionary reload failed: {e}")
+
+
+def _snapshot_config_type(snapshot: DictionarySnapshot) -> Optional[DictionaryType]:
+    """Return the configured dictionary type a snapshot was loaded for."""
+    try:
+        return DictionaryType(snapshot.info["config"]["type"])
+    except (KeyError, ValueError):
+        return None
+
+
+def _file_mtime(path: str) -> Optional[float]:
+    try:
+        return os.stat(path).st_mtime
+    except OSError:
+        return None
+
+
+async def _watch_dictionary_file(interval: float) -> None:
+    """Reload the dictionary whenever its source file changes on disk."""
+    snapshot = _current_snapshot()
+    last_mtime = _file_mtime(snapshot.info["filepath"]) if snapshot else None
+    while True:
+        await asyncio.sleep(interval)
+        snapshot = _current_snapshot()
+        if snapshot is None:
+            continue
+        mtime = _file_mtime(snapshot.info["filepath"])
+        if mtime is not None and mtime != last_mtime:
+            last_mtime = mtime
+            logger.info(f"Dictionary file {snapshot.info['filepath']} changed")
+            await asyncio.to_thread(_run_reload, _snapshot_config_type(snapshot))
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Load the dictionary when the app starts."""
-    global DICTIONARY, DICTIONARY_INFO
+    global ENGINE, ADMISSION, REQUEST_LOG
+    ADMISSION = _create_admission()
+    REQUEST_LOG = _create_request_log()
+    REQUEST_LOG.start()
     logger.info("Loading word dictionary...")
     logger.info(
         f"Dictionary configuration: {Config.get_dictionary_info()['description']}"
     )
 
-    # Load dictionary using configuration system
+    # With fast start, serve the small Google 10k list right away and load the
+    # configured dictionary in the background; the swap is a normal reload
+    fast_start = (
+        Config.FAST_START and Config.DICTIONARY_TYPE != DictionaryType.GOOGLE_10K
+    )
+
+    # Load dictionary and build its index using configuration system
     try:
-        DICTIONARY, DICTIONARY_INFO = load_dictionary()
-        logger.info(f"Successfully loaded {DICTIONARY_INFO['type']} dictionary")
+        if fast_start:
+            snapshot = _load_snapshot(DictionaryType.GOOGLE_10K, tier="fast")
+        else:
+            snapshot = _load_snapshot()
+        logger.info(f"Successfully loaded {snapshot.info['type']} dictionary")
         logger.info(
-            f"Dictionary: {DICTIONARY_INFO['filepath']} ({DICTIONARY_INFO['size']} words)"
+            f"Dictionary: {snapshot.info['filepath']} ({snapshot.info['size']} words)"
         )
     except Exception as e:
         logger.error(f"Failed to load dictionary: {e}")
-        DICTIONARY = set()
-        DICTIONARY_INFO = {
-            "filepath": "none",
-            "size": 0,
-            "type": "error",
-            "config": {"type": "unknown", "description": "Failed to load"},
-        }
+        snapshot = build_snapshot(
+            set(),
+            {
+                "filepath": "none",
+                "size": 0,
+                "type": "error",
+                "config": {"type": "unknown", "description": "Failed to load"},
+            },
+            tier="error",
+        )
+    ENGINE = WordSolver.from_snapshot(snapshot)
+    _prebuild_fuzzy_index(ENGINE)
+    if not fast_start:
+        _load_resident_dictionaries()
+    _purge_result_cache(snapshot)
+    _warm_result_cache(snapshot)
+
+    background = []
+    if fast_start:
+        logger.info("Fast start: loading the configured dictionary in the background")
+        background.append(
+            asyncio.create_task(asyncio.to_thread(_run_reload, Config.DICTIONARY_TYPE))
+        )
+        background.append(
+            asyncio.create_task(asyncio.to_thread(_load_resident_dictionaries))
+        )
+    if Config.DICTIONARY_WATCH_INTERVAL > 0:
+        background.append(
+            asyncio.create_task(
+                _watch_dictionary_file(Config.DICTIONARY_WATCH_INTERVAL)
+            )
+        )
 
     yield
 
-    # Cleanup (if needed)
-    DICTIONARY = None
-    DICTIONARY_INFO = None
+    # Cleanup
+    for task in background:
+        task.cancel()
+    REQUEST_LOG.stop()
+    ENGINE = None
+    REGISTRY.clear()
 
 
 # Initialize FastAPI app
@@ -76,6 +460,95 @@ async def _unused_startup_placeholder():
     pass
 
 
+def _set_dictionary_headers(response: Response, snapshot: DictionarySnapshot):
+    """Report which dictionary answered the request."""
+    response.headers["X-Dictionary-Tier"] = snapshot.tier
+    response.headers["X-Dictionary-Type"] = snapshot.dictionary_type
+
+
+def _conditional_response(
+    response: Response,
+    if_none_match: Optional[str],
+    snapshot: DictionarySnapshot,
+    *query: Any,
+) -> Optional[Response]:
+    """Set caching headers for a solver result; 304 if the client has it.
+
+    Results depend only on the exact word list and the canonical query, so
+    the ETag is derived from those and checked before any solving happens.
+    """
+    etag = make_etag(snapshot.dictionary_type, snapshot.content_version, *query)
+    response.headers["ETag"] = etag
+    # Results from the stand-in dictionary are replaced once the full one loads
+    if Config.HTTP_CACHE_MAX_AGE > 0 and snapshot.tier == "full":
+        response.headers["Cache-Control"] = (
+            f"public, max-age={Config.HTTP_CACHE_MAX_AGE}"
+        )
+    else:
+        response.headers["Cache-Control"] = "no-cache"
+    matched = matching_etag(if_none_match, etag)
+    if matched is None:
+        return None
+    # Confirm the copy the client holds, compressed or not
+    response.headers["ETag"] = matched
+    if Config.COMPRESS_MIN_BYTES > 0:
+        response.headers["Vary"] = "Accept-Encoding"
+    return Response(status_code=304, headers=dict(response.headers))
+
+
+@app.exception_handler(RequestRejected)
+async def request_rejected_handler(request: Request, exc: RequestRejected):
+    """Shed load quickly: 429 for a client over its share, 503 otherwise."""
+    status_code = 429 if exc.reason == "client_limit" else 503
+    return JSONResponse(
+        status_code=status_code,
+        content={"success": False, "detail": _REJECTION_DETAILS[exc.reason]},
+        headers={"Retry-After": str(max(exc.retry_after, ADMISSION.retry_after()))},
+    )
+
+
+_REJECTION_DETAILS = {
+    "overloaded": "Server is busy, please retry later",
+    "client_limit": "Too many requests in flight from this client",
+    "deadline": "Request took too long to solve",
+    "cancelled": "Request was cancelled",
+}
+
+
+async def _run_solver(
+    request: Request, endpoint: str, func: Callable[..., Any], *args: Any
+) -> Any:
+    """Run solver work under admission control and the endpoint's deadline.
+
+    The work runs in a worker thread so the event loop keeps answering (and
+    shedding) other requests meanwhile, and cancels the work through its
+    deadline if the client disconnects before it finishes.
+    """
+    seconds = Config.ENDPOINT_DEADLINES_MS.get(endpoint, Config.REQUEST_DEADLINE_MS)
+    deadline = Deadline(seconds / 1000)
+    client = request.client.host if request.client else ""
+    async with ADMISSION.slot(client, deadline.remaining()):
+        work = asyncio.ensure_future(
+            run_in_threadpool(deadline.run, solver_profiler.call, func, *args)
+        )
+        while not work.done():
+            await asyncio.wait({work}, timeout=0.05)
+            if not work.done() and await request.is_disconnected():
+                deadline.cancel()
+        return work.result()
+
+
+def require_admin(x_admin_token: Optional[str] = Header(None)):
+    """Reject requests that do not carry the configured admin token."""
+    if not Config.ADMIN_TOKEN:
+        # Admin endpoints are hidden entirely when no token is configured
+        raise HTTPException(status_code=404, detail="Not Found")
+    if not x_admin_token or not secrets.compare_digest(
+        x_admin_token, Config.ADMIN_TOKEN
+    ):
+        raise HTTPException(status_code=403, detail="Invalid admin token")
+
+
 @app.get("/")
 async def root():
     """Root endpoint with API information."""
@@ -85,16 +558,37 @@ async def root():
         "endpoints": {
             "/solve": "GET - Solve word puzzles with scrambled letters",
             "/anagrams": "GET - Find anagrams using all letters exactly once",
+            "/generate": "GET - Generate puzzle racks matching level constraints",
+            "/hooks": "GET - Find plays using the rack plus one board letter",
+            "/grid": "GET - Find words traceable through a letter grid",
+            "/wordle": "GET - Filter Wordle answers by feedback and rank guesses",
+            "/suggest": "GET - Suggest dictionary words for a misspelled word",
+            "/ladder": "GET - Find a shortest word ladder between two words",
+            "/complete": "GET - Suggest rack-buildable words for a prefix",
+            "/check": "POST - Check many words against the dictionary at once",
         },
     }
 
 
 @app.get("/solve")
 async def solve_puzzle(
+    request: Request,
+    response: Response,
     letters: str = Query("", description="Scrambled letters to solve"),
     min_word_length: int = Query(
         3, description="Minimum word length to include in results", ge=1, le=10
     ),
+    dictionary: Optional[DictionaryType] = Query(
+        None, description="Resident dictionary to use (default: the configured one)"
+    ),
+    annotate: Optional[Literal["tier"]] = Query(
+        None, description='"tier" tags each word with its word list tier'
+    ),
+    max_tier: Optional[Literal["common", "medium", "large", "extended"]] = Query(
+        None, description="Only include words from this tier or a smaller one"
+    ),
+    if_none_match: Optional[str] = Header(None),
+    accept_encoding: Optional[str] = Header(None),
 ):
     """
     Solve word puzzles by finding all valid words that can be formed from the given letters.
@@ -102,37 +596,91 @@ async def solve_puzzle(
     Args:
         letters: String of letters to use for forming words
         min_word_length: Minimum length of words to include (default: 3)
+        dictionary: Resident dictionary to solve with (default: configured one)
+        annotate: "tier" adds a ``tiers`` map from each word to the smallest
+            bundled list containing it (common, medium, large or extended)
+        max_tier: Only include words from this tier or a smaller one
+        if_none_match: ETag of a copy the client already has
+        accept_encoding: Content codings the client accepts
 
     Returns:
-        JSON response with list of valid words
+        JSON response with list of valid words, or 304 when the client's
+        copy (``If-None-Match``) is still current
     """
-    if DICTIONARY is None:
-        raise HTTPException(status_code=500, detail="Dictionary not loaded")
+    started = time.perf_counter()
+    engine = _select_engine(dictionary)
+    snapshot = engine.snapshot
+    _set_dictionary_headers(response, snapshot)
 
     # Validate input
-    validation = validate_letters(letters)
+    validation = validate_letters(letters, snapshot.alphabet)
     if not validation["valid"]:
         return format_error_response(validation["errors"])
 
     cleaned_letters = validation["cleaned"]
+    tiered = annotate is not None or max_tier is not None
+    if tiered and not snapshot.index.has_tiers:
+        raise HTTPException(
+            status_code=400, detail="Word tiers are not available for this dictionary"
+        )
+
+    not_modified = _conditional_response(
+        response,
+        if_none_match,
+        snapshot,
+        "solve",
+        cleaned_letters,
+        min_word_length,
+        annotate,
+        max_tier,
+    )
+    if not_modified is not None:
+        return not_modified
 
     try:
         # Find valid words with minimum length filter
-        dict_type = (
-            DICTIONARY_INFO.get("type", "scowl_large")
-            if DICTIONARY_INFO
-            else "scowl_large"
-        )
-        valid_words = find_valid_words(
-            cleaned_letters, DICTIONARY, min_word_length, dict_type
+        kind = f"solve-{max_tier}" if max_tier else "solve"
+        cache_key = ResultCache.make_key(
+            snapshot.content_version, kind, cleaned_letters, min_word_length
         )
+        # Tier labels come out of the solver scan itself and are not cached
+        valid_words = None if annotate else RESULT_CACHE.get(cache_key)
+        cached = valid_words is not None
+        tiers: Optional[Dict[str, str]] = None
+        if valid_words is None:
+            if tiered:
+                valid_words, word_tiers = await _run_solver(
+                    request,
+                    "solve",
+                    engine.solve_tiered,
+                    cleaned_letters,
+                    min_word_length,
+                    max_tier,
+                )
+                if annotate:
+                    tiers = word_tiers
+            else:
+                valid_words = await _run_solver(
+                    request, "solve", engine.solve, cleaned_letters, min_word_length
+                )
+            RESULT_CACHE.set(cache_key, valid_words)
 
-        logger.info(
-            f"Found {len(valid_words)} words for letters: {cleaned_letters} (min length: {min_word_length})"
+        result = format_response(valid_words, cleaned_letters)
+        if tiers is not None:
+            result["tiers"] = tiers
+        body = json_response(result, dict(response.headers), accept_encoding)
+        REQUEST_LOG.log(
+            "solve",
+            len(cleaned_letters),
+            len(valid_words),
+            (time.perf_counter() - started) * 1000,
+            snapshot.dictionary_type,
+            cached,
         )
+        return body
 
-        return format_response(valid_words, cleaned_letters)
-
+    except RequestRejected:
+        raise
     except Exception as e:
         logger.error(f"Error solving puzzle: {e}")
         raise HTTPException(status_code=500, detail="Internal server error")
@@ -140,10 +688,17 @@ async def solve_puzzle(
 
 @app.get("/anagrams")
 async def find_anagrams(
+    request: Request,
+    response: Response,
     letters: str = Query("", description="Letters to find anagrams for"),
     min_word_length: int = Query(
         3, description="Minimum word length to include in results", ge=1, le=10
     ),
+    dictionary: Optional[DictionaryType] = Query(
+        None, description="Resident dictionary to use (default: the configured one)"
+    ),
+    if_none_match: Optional[str] = Header(None),
+    accept_encoding: Optional[str] = Header(None),
 ):
     """
     Find anagrams - words that use all the given letters exactly once.
@@ -151,62 +706,738 @@ async def find_anagrams(
     Args:
         letters: String of letters to find anagrams for
         min_word_length: Minimum length of words to include (default: 3)
+        dictionary: Resident dictionary to search (default: configured one)
+        if_none_match: ETag of a copy the client already has
+        accept_encoding: Content codings the client accepts
 
     Returns:
-        JSON response with list of anagrams
+        JSON response with list of anagrams, or 304 when the client's copy
+        (``If-None-Match``) is still current
     """
-    if DICTIONARY is None:
-        raise HTTPException(status_code=500, detail="Dictionary not loaded")
+    started = time.perf_counter()
+    engine = _select_engine(dictionary)
+    snapshot = engine.snapshot
+    _set_dictionary_headers(response, snapshot)
 
     # Validate input
-    validation = validate_letters(letters)
+    validation = validate_letters(letters, snapshot.alphabet)
     if not validation["valid"]:
         return format_error_response(validation["errors"])
 
     cleaned_letters = validation["cleaned"]
 
+    not_modified = _conditional_response(
+        response, if_none_match, snapshot, "anagrams", cleaned_letters, min_word_length
+    )
+    if not_modified is not None:
+        return not_modified
+
     try:
         # Find anagrams with minimum length filter
-        dict_type = (
-            DICTIONARY_INFO.get("type", "scowl_large")
-            if DICTIONARY_INFO
-            else "scowl_large"
+        cache_key = ResultCache.make_key(
+            snapshot.content_version, "anagrams", cleaned_letters, min_word_length
         )
-        anagrams = get_anagrams(cleaned_letters, DICTIONARY, min_word_length, dict_type)
+        anagrams = RESULT_CACHE.get(cache_key)
+        cached = anagrams is not None
+        if anagrams is None:
+            anagrams = await _run_solver(
+                request, "anagrams", engine.anagrams, cleaned_letters, min_word_length
+            )
+            RESULT_CACHE.set(cache_key, anagrams)
 
-        logger.info(
-            f"Found {len(anagrams)} anagrams for letters: {cleaned_letters} (min length: {min_word_length})"
+        body = json_response(
+            format_response(anagrams, cleaned_letters),
+            dict(response.headers),
+            accept_encoding,
         )
+        REQUEST_LOG.log(
+            "anagrams",
+            len(cleaned_letters),
+            len(anagrams),
+            (time.perf_counter() - started) * 1000,
+            snapshot.dictionary_type,
+            cached,
+        )
+        return body
 
-        return format_response(anagrams, cleaned_letters)
-
+    except RequestRejected:
+        raise
     except Exception as e:
         logger.error(f"Error finding anagrams: {e}")
         raise HTTPException(status_code=500, detail="Internal server error")
 
 
+@app.get("/hooks")
+async def find_hooks(
+    request: Request,
+    response: Response,
+    letters: str = Query("", description="Letters on the rack"),
+    anchors: str = Query(
+        "", description='Board letters to play through, e.g. "e,s@0,t@-1"'
+    ),
+    min_word_length: int = Query(
+        3, description="Minimum word length to include in results", ge=1, le=10
+    ),
+    dictionary: Optional[DictionaryType] = Query(
+        None, description="Resident dictionary to use (default: the configured one)"
+    ),
+):
+    """
+    Find hook plays: words formed from the rack plus exactly one board letter.
+
+    Args:
+        letters: Letters on the rack
+        anchors: Comma-separated board letters; ``LETTER@INDEX`` pins the
+            letter to that index of the word (negative counts from the end)
+        min_word_length: Minimum length of words to include (default: 3)
+        dictionary: Resident dictionary to search (default: configured one)
+
+    Returns:
+        JSON response with the words and, in ``anchors``, the anchors each
+        word can be played through
+    """
+    engine = _select_engine(dictionary)
+    snapshot = engine.snapshot
+    _set_dictionary_headers(response, snapshot)
+
+    validation = validate_letters(letters, snapshot.alphabet)
+    if not validation["valid"]:
+        return format_error_response(validation["errors"])
+    try:
+        parsed = parse_anchors(anchors, snapshot.alphabet)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if not parsed:
+        raise HTTPException(status_code=400, detail="At least one anchor is required")
+
+    cleaned_letters = validation["cleaned"]
+    words, used = await _run_solver(
+        request, "hooks", engine.hooks, cleaned_letters, parsed, min_word_length
+    )
+    result = format_response(words, cleaned_letters)
+    result["anchors"] = used
+    return result
+
+
+@app.get("/grid")
+async def solve_grid(
+    request: Request,
+    response: Response,
+    board: str = Query(
+        "", description='Board rows separated by commas, e.g. "cat,ore,dog"'
+    ),
+    min_word_length: int = Query(
+        3, description="Minimum word length to include in results", ge=1, le=10
+    ),
+    dictionary: Optional[DictionaryType] = Query(
+        None, description="Resident dictionary to use (default: the configured one)"
+    ),
+):
+    """
+    Find every word traceable through adjacent cells of a letter grid.
+
+    Args:
+        board: Rows of letters separated by commas; all rows the same length
+        min_word_length: Minimum length of words to include (default: 3)
+        dictionary: Resident dictionary to search (default: configured one)
+
+    Returns:
+        JSON response with the words found, shortest first
+    """
+    started = time.perf_counter()
+    engine = _select_engine(dictionary)
+    snapshot = engine.snapshot
+    _set_dictionary_headers(response, snapshot)
+
+    validation = validate_grid(board, snapshot.alphabet)
+    if not validation["valid"]:
+        return format_error_response(validation["errors"])
+
+    rows = validation["rows"]
+    words = await _run_solver(request, "grid", engine.grid, rows, min_word_length)
+    REQUEST_LOG.log(
+        "grid",
+        sum(map(len, rows)),
+        len(words),
+        (time.perf_counter() - started) * 1000,
+        snapshot.dictionary_type,
+    )
+    return format_response(words, ",".join(rows))
+
+
+@app.get("/wordle")
+async def solve_wordle(
+    request: Request,
+    response: Response,
+    guesses: str = Query(
+        "", description='Guesses with feedback, e.g. "crane:bygbb,slate:gbbyb"'
+    ),
+    length: Optional[int] = Query(
+        None,
+        description="Word length (default: the guesses' length, or 5)",
+        ge=2,
+        le=10,
+    ),
+    limit: int = Query(10, description="Maximum guesses to suggest", ge=1, le=50),
+    dictionary: Optional[DictionaryType] = Query(
+        None, description="Resident dictionary to use (default: the configured one)"
+    ),
+):
+    """
+    Narrow down a Wordle-style answer and suggest the next guesses.
+
+    Args:
+        guesses: Comma-separated GUESS:MARKS pairs, one mark per letter:
+            g (green), y (yellow) or b (grey)
+        length: Answer length (default: length of the guesses, else 5)
+        limit: Maximum number of suggested guesses (default: 10)
+        dictionary: Resident dictionary to search (default: configured one)
+
+    Returns:
+        JSON response with every word consistent with the feedback and the
+        suggested guesses ranked by expected information in bits
+    """
+    engine = _select_engine(dictionary)
+    snapshot = engine.snapshot
+    _set_dictionary_headers(response, snapshot)
+
+    try:
+        feedback = parse_feedback(guesses, snapshot.alphabet)
+        word_length = length or (len(feedback[0][0]) if feedback else 5)
+        candidates, suggestions = await _run_solver(
+            request,
+            "wordle",
+            engine.wordle,
+            feedback,
+            word_length,
+            limit,
+            Config.WORDLE_GUESS_POOL,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    return {
+        "success": True,
+        "length": word_length,
+        "candidate_count": len(candidates),
+        "candidates": candidates,
+        "suggestions": [
+            {"word": word, "entropy": round(bits, 3)} for word, bits in suggestions
+        ],
+    }
+
+
+@app.get("/suggest")
+async def suggest_words(
+    request: Request,
+    response: Response,
+    word: str = Query("", description="Word to look up, typos allowed", max_length=64),
+    max_distance: int = Query(
+        2, description="Most edits a suggestion may be away", ge=1, le=2
+    ),
+    limit: int = Query(10, description="Maximum suggestions to return", ge=1, le=50),
+    dictionary: Optional[DictionaryType] = Query(
+        None, description="Resident dictionary to use (default: the configured one)"
+    ),
+):
+    """
+    Suggest dictionary words close to a possibly misspelled word.
+
+    Args:
+        word: Word as typed
+        max_distance: Most edits (insertions, deletions, substitutions or
+            adjacent swaps) between the word and a suggestion (1 or 2)
+        limit: Maximum number of suggestions (default: 10)
+        dictionary: Resident dictionary to search (default: configured one)
+
+    Returns:
+        JSON response with suggestions ordered by distance, then word
+        frequency where known
+    """
+    engine = _select_engine(dictionary)
+    snapshot = engine.snapshot
+    _set_dictionary_headers(response, snapshot)
+
+    cleaned = snapshot.alphabet.clean(word)
+    if not cleaned:
+        raise HTTPException(status_code=400, detail="Word parameter is required")
+
+    suggestions = await _run_solver(
+        request, "suggest", engine.suggest, cleaned, max_distance, limit
+    )
+    return {
+        "success": True,
+        "word": cleaned,
+        "found": any(distance == 0 for _, distance in suggestions),
+        "suggestions": [
+            {"word": suggestion, "distance": distance}
+            for suggestion, distance in suggestions
+        ],
+    }
+
+
+@app.get("/ladder")
+async def solve_ladder(
+    request: Request,
+    response: Response,
+    start: str = Query("", description="First word of the ladder", max_length=32),
+    end: str = Query("", description="Last word of the ladder", max_length=32),
+    dictionary: Optional[DictionaryType] = Query(
+        None, description="Resident dictionary to use (default: the configured one)"
+    ),
+):
+    """
+    Find a shortest word ladder, changing one letter per step.
+
+    Args:
+        start: Word to start from
+        end: Word to reach; must have the same length as ``start``
+        dictionary: Resident dictionary to search (default: configured one)
+
+    Returns:
+        JSON response with the ladder, or ``found: false`` and a ``status``
+        of "unreachable", "node_limit" or "time_limit"
+    """
+    engine = _select_engine(dictionary)
+    snapshot = engine.snapshot
+    _set_dictionary_headers(response, snapshot)
+
+    if not snapshot.alphabet.clean(start) or not snapshot.alphabet.clean(end):
+        raise HTTPException(
+            status_code=400, detail="Start and end parameters are required"
+        )
+
+    try:
+        result = await _run_solver(
+            request,
+            "ladder",
+            engine.ladder,
+            start,
+            end,
+            Config.LADDER_MAX_NODES,
+            Config.LADDER_TIME_LIMIT_MS / 1000,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    return {
+        "success": True,
+        "found": result.found,
+        "status": result.status,
+        "steps": len(result.path) - 1 if result.found else None,
+        "path": result.path,
+        "explored": result.explored,
+    }
+
+
+@app.get("/complete")
+async def complete_prefix(
+    request: Request,
+    response: Response,
+    prefix: str = Query("", description="Start of the word being built"),
+    letters: str = Query("", description="Letters on the rack"),
+    min_word_length: int = Query(
+        3, description="Minimum word length to include in results", ge=1, le=10
+    ),
+    limit: int = Query(10, description="Maximum suggestions to return", ge=1, le=100),
+    dictionary: Optional[DictionaryType] = Query(
+        None, description="Resident dictionary to use (default: the configured one)"
+    ),
+):
+    """
+    Suggest words starting with a prefix that can be built from the rack.
+
+    Args:
+        prefix: Letters the player has selected so far
+        letters: Letters available on the rack, prefix letters included
+        min_word_length: Minimum length of words to include (default: 3)
+        limit: Maximum number of suggestions (default: 10)
+        dictionary: Resident dictionary to search (default: configured one)
+
+    Returns:
+        JSON response with up to ``limit`` words, shortest first
+    """
+    engine = _select_engine(dictionary)
+    snapshot = engine.snapshot
+    _set_dictionary_headers(response, snapshot)
+
+    validation = validate_letters(letters, snapshot.alphabet)
+    if not validation["valid"]:
+        return format_error_response(validation["errors"])
+
+    cleaned_letters = validation["cleaned"]
+    cleaned_prefix = snapshot.alphabet.clean(prefix)
+    words = await _run_solver(
+        request,
+        "complete",
+        engine.complete,
+        cleaned_prefix,
+        cleaned_letters,
+        min_word_length,
+        limit,
+    )
+    result = format_response(words, cleaned_letters)
+    result["prefix"] = cleaned_prefix
+    return result
+
+
+class CheckRequest(BaseModel):
+    """Body of ``POST /check``."""
+
+    words: List[str] = Field(
+        ..., description="Words to check", max_length=Config.MAX_CHECK_WORDS
+    )
+    min_word_length: int = Field(
+        3, description="Minimum length of a playable word", ge=1, le=10
+    )
+    dictionary: Optional[DictionaryType] = Field(
+        None, description="Resident dictionary to use (default: the configured one)"
+    )
+
+
+@app.post("/check")
+async def check_words(body: CheckRequest, request: Request, response: Response):
+    """
+    Check whether words are in the dictionary, many at a time.
+
+    Args:
+        body: Words to check, the minimum playable length and optionally
+            a resident dictionary
+
+    Returns:
+        Per-word ``valid`` (in the word list) and ``playable`` (also passes
+        the quality filter, so ``/solve`` would return it), in input order
+    """
+    engine = _select_engine(body.dictionary)
+    snapshot = engine.snapshot
+    _set_dictionary_headers(response, snapshot)
+
+    results = await _run_solver(
+        request, "check", engine.check, body.words, body.min_word_length
+    )
+    return {
+        "results": results,
+        "count": len(results),
+        "valid_count": sum(1 for result in results if result["valid"]),
+        "playable_count": sum(1 for result in results if result["playable"]),
+        "dictionary_type": snapshot.dictionary_type,
+    }
+
+
+def _get_puzzle_generator(snapshot: DictionarySnapshot) -> PuzzleGenerator:
+    global _puzzle_generator
+    generator = _puzzle_generator
+    if generator is None or generator.snapshot is not snapshot:
+        generator = PuzzleGenerator(snapshot, load_word_ranks())
+        _puzzle_generator = generator
+    return generator
+
+
+@app.get("/generate")
+async def generate_puzzles(
+    request: Request,
+    min_letters: int = Query(5, description="Minimum rack size", ge=3, le=12),
+    max_letters: int = Query(8, description="Maximum rack size", ge=3, le=12),
+    min_words: int = Query(8, description="Minimum number of solution words", ge=1),
+    max_words: int = Query(15, description="Maximum number of solution words", ge=1),
+    min_word_length: int = Query(
+        3, description="Minimum word length to include in solutions", ge=1, le=10
+    ),
+    max_rank: int = Query(
+        10000,
+        description="Only count words this common (frequency rank)",
+        ge=1,
+        le=10000,
+    ),
+    min_pangrams: int = Query(1, description="Minimum words using every letter", ge=0),
+    max_pangrams: int = Query(1, description="Maximum words using every letter", ge=0),
+    lengths: str = Query(
+        "", description='Words per length as "L:MIN-MAX,...", e.g. "3:2-6,4:1-5"'
+    ),
+    limit: int = Query(10, description="Maximum puzzles to return", ge=1, le=100),
+    time_budget_ms: int = Query(
+        500, description="Time budget for the search in milliseconds", ge=10, le=10000
+    ),
+    seed: Optional[int] = Query(None, description="Shuffle candidates with a seed"),
+):
+    """
+    Generate letter racks whose solutions fit the given level constraints.
+
+    Candidate racks come from pangram classes of common words; the search
+    stops after ``limit`` puzzles or when the time budget (or the request
+    deadline) runs out.
+    """
+    started = time.perf_counter()
+    snapshot = _current_snapshot()
+    if snapshot is None:
+        raise HTTPException(status_code=500, detail="Dictionary not loaded")
+    try:
+        length_bounds = parse_length_bounds(lengths)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    constraints = PuzzleConstraints(
+        min_letters,
+        max_letters,
+        min_words,
+        max_words,
+        min_word_length,
+        max_rank,
+        min_pangrams,
+        max_pangrams,
+        length_bounds,
+    )
+    result = await _run_solver(
+        request,
+        "generate",
+        _get_puzzle_generator(snapshot).generate,
+        constraints,
+        limit,
+        time_budget_ms / 1000,
+        seed,
+    )
+    REQUEST_LOG.log(
+        "generate",
+        max_letters,
+        len(result["puzzles"]),
+        (time.perf_counter() - started) * 1000,
+        snapshot.dictionary_type,
+    )
+    return {"success": True, **result}
+
+
+def _is_ready(snapshot: Optional[DictionarySnapshot]) -> bool:
+    """Ready once the configured (full tier) dictionary is serving."""
+    return snapshot is not None and snapshot.tier == "full"
+
+
 @app.get("/health")
 async def health_check():
     """Health check endpoint with dictionary configuration info."""
+    snapshot = _current_snapshot()
+    primary = _primary_name(snapshot) if snapshot else Config.DICTIONARY_TYPE.value
     return {
         "status": "healthy",
-        "dictionary_loaded": DICTIONARY is not None,
-        "dictionary_size": len(DICTIONARY) if DICTIONARY else 0,
-        "dictionary_info": DICTIONARY_INFO if DICTIONARY_INFO else {},
+        "live": True,
+        "ready": _is_ready(snapshot),
+        "dictionary_tier": snapshot.tier if snapshot else None,
+        "dictionary_loaded": snapshot is not None,
+        "dictionary_size": len(snapshot.words) if snapshot else 0,
+        "dictionary_info": snapshot.info if snapshot else {},
+        "dictionary_version": snapshot.version if snapshot else None,
+        "dictionary_revision": snapshot.revision if snapshot else None,
+        "result_cache": RESULT_CACHE.stats(),
+        "admission": ADMISSION.status(),
+        "memory": {
+            "pid": os.getpid(),
+            "process": process_memory(),
+            "index_bytes": snapshot.index.nbytes if snapshot else 0,
+            "index_shared": snapshot.index.shared if snapshot else False,
+            "dictionaries": REGISTRY.memory(primary, snapshot),
+        },
         "configuration": {
             "dictionary_type": Config.DICTIONARY_TYPE.value,
             "environment_var": "WORDMIXR_DICTIONARY",
-            "available_types": [
-                "google_10k",
-                "scowl_medium",
-                "scowl_large",
-                "comprehensive",
-                "auto",
-            ],
+            "available_types": [t.value for t in DictionaryType],
+            "resident_dictionaries": [primary, *REGISTRY.names()],
         },
     }
 
 
+@app.get("/health/live")
+async def liveness_check():
+    """Liveness probe: the process is up and serving requests."""
+    return {"live": True}
+
+
+@app.get("/health/ready")
+async def readiness_check(response: Response):
+    """Readiness probe: 503 until the configured dictionary is serving."""
+    snapshot = _current_snapshot()
+    ready = _is_ready(snapshot)
+    if not ready:
+        response.status_code = 503
+    return {
+        "ready": ready,
+        "dictionary_tier": snapshot.tier if snapshot else None,
+        "reload": RELOAD_STATUS["state"],
+    }
+
+
+@app.post("/admin/profile", dependencies=[Depends(require_admin)])
+async def start_profiling(
+    requests: int = Query(
+        0, description="Profile the next N solver calls", ge=0, le=100000
+    ),
+    sample_rate: float = Query(
+        0.0, description="Fraction of solver calls to profile", ge=0.0, le=1.0
+    ),
+):
+    """Arm the solver profiler for the next N calls and/or a sampled fraction."""
+    if requests == 0 and sample_rate == 0.0:
+        raise HTTPException(
+            status_code=400, detail="Specify requests and/or sample_rate"
+        )
+    solver_profiler.arm(requests=requests, sample_rate=sample_rate)
+    logger.info(f"Solver profiling armed: {solver_profiler.status()}")
+    return solver_profiler.status()
+
+
+@app.get("/admin/profile", dependencies=[Depends(require_admin)])
+async def get_profile(
+    sort: str = Query("cumulative", description="pstats sort key"),
+    limit: int = Query(30, description="Number of functions to report", ge=1),
+    dump: bool = Query(False, description="Also write stats to the profile dir"),
+):
+    """Return aggregated profiler stats, optionally writing them to disk."""
+    try:
+        report = solver_profiler.report(sort=sort, limit=limit)
+    except KeyError:
+        raise HTTPException(status_code=400, detail=f"Unknown sort key: {sort}")
+    result: Dict[str, Any] = {"status": solver_profiler.status(), "stats": report}
+    if dump:
+        result["path"] = solver_profiler.dump(Config.PROFILE_DIR)
+    return result
+
+
+@app.delete("/admin/profile", dependencies=[Depends(require_admin)])
+async def reset_profile():
+    """Disarm the profiler and discard collected stats."""
+    solver_profiler.reset()
+    return solver_profiler.status()
+
+
+@app.post("/admin/reload", status_code=202, dependencies=[Depends(require_admin)])
+async def trigger_reload(
+    background_tasks: BackgroundTasks,
+    dictionary: Optional[DictionaryType] = Query(
+        None, description="Dictionary type to switch to (default: current)"
+    ),
+):
+    """Rebuild the dictionary and its index in the background, then swap it in."""
+    if _reload_lock.locked():
+        raise HTTPException(
+            status_code=409, detail="A dictionary reload is already in progress"
+        )
+    snapshot = _current_snapshot()
+    if dictionary is None and snapshot is not None:
+        dictionary = _snapshot_config_type(snapshot)
+    background_tasks.add_task(_run_reload, dictionary)
+    return {
+        "status": "accepted",
+        "dictionary_type": dictionary.value if dictionary else None,
+        "current_version": snapshot.version if snapshot else None,
+    }
+
+
+@app.get("/admin/reload", dependencies=[Depends(require_admin)])
+async def reload_status():
+    """Report the state of the most recent dictionary reload."""
+    snapshot = _current_snapshot()
+    return {
+        **RELOAD_STATUS,
+        "current_version": snapshot.version if snapshot else None,
+    }
+
+
+def edit_word(word: str, add: bool) -> Dict[str, Any]:
+    """Add or remove one word and swap in the updated snapshot.
+
+    Edits are rejected while the fast tier is serving: the full dictionary
+    is still loading and an edit to the stand-in would not carry over.
+    """
+    global ENGINE
+    current = _current_snapshot()
+    if current is not None and current.tier == "fast":
+        raise HTTPException(
+            status_code=503,
+            detail="Word edits are unavailable until the full dictionary is loaded",
+        )
+    alphabet = current.alphabet if current is not None else ENGLISH
+    normalized = alphabet.normalize(word.strip())
+    if len(normalized) < 2:
+        raise HTTPException(
+            status_code=400, detail="Words must be at least 2 letters long"
+        )
+    # Words already in the list may be removed whatever they contain, e.g.
+    # SCOWL's possessives with an apostrophe
+    listed = not add and current is not None and normalized in current.words
+    if not listed and not alphabet.spells(normalized):
+        raise HTTPException(
+            status_code=400,
+            detail=f"Words may only use letters of the {alphabet.name} alphabet",
+        )
+    if not _reload_lock.acquire(blocking=False):
+        raise HTTPException(
+            status_code=409, detail="A dictionary reload is already in progress"
+        )
+    try:
+        engine = ENGINE
+        if engine is None:
+            raise HTTPException(status_code=500, detail="Dictionary not loaded")
+        snapshot = engine.snapshot
+        try:
+            # The new engine keeps the indexes the current one has built
+            if add:
+                edited = engine.with_word(normalized)
+            else:
+                edited = engine.without_word(normalized)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        updated = edited.snapshot
+
+        invalidated = 0
+        if updated is not snapshot:
+            if Config.OVERLAY_FILE:
+                save_overlay(Config.OVERLAY_FILE, updated.added, updated.removed)
+            ENGINE = edited
+            _prebuild_fuzzy_index(ENGINE)
+            # Results are keyed by the exact word list, so a solve still running
+            # on the old snapshot cannot store them where the new one looks
+            invalidated = RESULT_CACHE.invalidate_word(
+                snapshot.content_version, normalized, updated.content_version
+            )
+            logger.info(
+                f"{'Added' if add else 'Removed'} word '{normalized}' "
+                f"(revision {updated.revision}, {invalidated} cached results dropped)"
+            )
+        return {
+            "word": normalized,
+            "changed": updated is not snapshot,
+            "in_dictionary": normalized in updated.words,
+            "revision": updated.revision,
+            "invalidated_results": invalidated,
+        }
+    finally:
+        _reload_lock.release()
+
+
+@app.put("/admin/words/{word}", dependencies=[Depends(require_admin)])
+def add_word(word: str):
+    """Add a single word to the active dictionary."""
+    return edit_word(word, add=True)
+
+
+@app.delete("/admin/words/{word}", dependencies=[Depends(require_admin)])
+def remove_word(word: str):
+    """Remove a single word from the active dictionary."""
+    return edit_word(word, add=False)
+
+
+@app.get("/admin/words", dependencies=[Depends(require_admin)])
+async def list_word_edits():
+    """List the words added to and removed from the base dictionary."""
+    snapshot = _current_snapshot()
+    if snapshot is None:
+        raise HTTPException(status_code=500, detail="Dictionary not loaded")
+    return {
+        "added": sorted(snapshot.added),
+        "removed": sorted(snapshot.removed),
+        "revision": snapshot.revision,
+        "overlay_file": Config.OVERLAY_FILE or None,
+    }
+
+
 if __name__ == "__main__":
     import uvicorn
 
@@ -0,0 +1,127 @@
+import cProfile
+import io
+import os
+import pstats
+import random
+import threading
+import time
+from typing import Any, Callable, Optional
+
+
+class SolverProfiler:
+    """On-demand cProfile wrapper for the solver hot path.
+
+    The profiler is armed for the next N calls and/or a sampled fraction of
+    calls. While disarmed, ``call`` is a single attribute check followed by
+    the plain function call, so it is safe to leave in production.
+    """
+
+    def __init__(self) -> None:
+        self.active = False
+        self._lock = threading.Lock()
+        self._remaining = 0
+        self._sample_rate = 0.0
+        self._stats: Optional[pstats.Stats] = None
+        self._profiled_calls = 0
+        self._armed_at: Optional[float] = None
+
+    def arm(self, requests: int = 0, sample_rate: float = 0.0) -> None:
+        """Profile the next ``requests`` calls and/or a ``sample_rate`` fraction."""
+        if requests < 0:
+            raise ValueError("requests must be non-negative")
+        if not 0.0 <= sample_rate <= 1.0:
+            raise ValueError("sample_rate must be between 0 and 1")
+        with self._lock:
+            self._remaining = requests
+            self._sample_rate = sample_rate
+            self._armed_at = time.time()
+            self.active = requests > 0 or sample_rate > 0.0
+
+    def disarm(self) -> None:
+        """Stop profiling new calls; collected stats are kept."""
+        with self._lock:
+            self.active = False
+            self._remaining = 0
+            self._sample_rate = 0.0
+
+    def reset(self) -> None:
+        """Disarm and discard all collected stats."""
+        self.disarm()
+        with self._lock:
+            self._stats = None
+            self._profiled_calls = 0
+            self._armed_at = None
+
+    def _claim(self) -> bool:
+        """Decide whether the current call should be profiled."""
+        with self._lock:
+            if self._remaining > 0:
+                self._remaining -= 1
+                if self._remaining == 0 and self._sample_rate == 0.0:
+                    self.active = False
+                return True
+            if self._sample_rate == 0.0:
+                return False
+            # Sampling only decides which calls are profiled
+            return random.random() < self._sample_rate  # nosec B311
+
+    def call(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """Call ``func``, profiling it if the profiler is armed."""
+        if not self.active or not self._claim():
+            return func(*args, **kwargs)
+
+        profile = cProfile.Profile()
+        try:
+            profile.enable()
+        except ValueError:
+            # Another profiler is already running on this interpreter
+            return func(*args, **kwargs)
+        try:
+            return func(*args, **kwargs)
+        finally:
+            profile.disable()
+            with self._lock:
+                if self._stats is None:
+                    self._stats = pstats.Stats(profile)
+                else:
+                    self._stats.add(profile)
+                self._profiled_calls += 1
+
+    def status(self) -> dict:
+        """Return the current profiler state."""
+        return {
+            "active": self.active,
+            "remaining_requests": self._remaining,
+            "sample_rate": self._sample_rate,
+            "profiled_calls": self._profiled_calls,
+            "armed_at": self._armed_at,
+        }
+
+    def report(self, sort: str = "cumulative", limit: int = 30) -> str:
+        """Return the aggregated stats as ``pstats`` text output."""
+        with self._lock:
+            if self._stats is None:
+                return ""
+            stream = io.StringIO()
+            self._stats.stream = stream  # type: ignore[attr-defined]
+            self._stats.sort_stats(sort).print_stats(limit)
+            return stream.getvalue()
+
+    def dump(self, directory: str) -> Optional[str]:
+        """Write the aggregated stats in ``pstats`` format and return the path.
+
+        The file can be loaded with ``pstats``, ``snakeviz`` or converted to a
+        flame graph with ``flameprof``.
+        """
+        with self._lock:
+            if self._stats is None:
+                return None
+            os.makedirs(directory, exist_ok=True)
+            filename = time.strftime("wordmixr-%Y%m%d-%H%M%S.pstats")
+            path = os.path.join(directory, filename)
+            self._stats.dump_stats(path)
+            return path
+
+
+# Process-wide profiler shared by the API endpoints
+solver_profiler = SolverProfiler()
@@ -0,0 +1,132 @@
+"""Resident dictionaries served side by side.
+
+The configured dictionary (``WORDMIXR_DICTIONARY``) is the default; the
+dictionaries listed in ``WORDMIXR_DICTIONARIES`` stay loaded next to it so
+requests can pick one with ``?dictionary=`` (an "easy" Google 10k mode and a
+"hard" SCOWL Large mode from one deployment). Every dictionary keeps its own
+index and quality filtering. The word lists overlap heavily, so a newly
+registered snapshot reuses the string objects of words the other resident
+dictionaries already hold instead of keeping its own copies.
+"""
+
+import sys
+import threading
+from dataclasses import replace
+from typing import Any, Collection, Dict, Iterable, List, Optional, Tuple
+
+from engine import WordSolver
+from solver import DictionarySnapshot
+
+
+def share_words(
+    snapshot: DictionarySnapshot, others: Iterable[DictionarySnapshot]
+) -> DictionarySnapshot:
+    """Return ``snapshot`` with words shared with ``others`` deduplicated."""
+    pool: Dict[str, str] = {}
+    for other in others:
+        # Memory-mapped word lists have no string objects to share
+        if isinstance(other.words, frozenset):
+            pool.update((word, word) for word in other.words if word not in pool)
+    if not pool or not isinstance(snapshot.words, frozenset):
+        return snapshot
+    words = frozenset(pool.get(word, word) for word in snapshot.words)
+    return replace(snapshot, words=words)
+
+
+def word_memory(
+    snapshot: DictionarySnapshot, others: Iterable[DictionarySnapshot]
+) -> Dict[str, int]:
+    """Estimate the bytes a snapshot's word list holds beyond ``others``."""
+    words: Collection[str] = snapshot.words
+    if not isinstance(words, frozenset):
+        return {"word_bytes": 0, "shared_words": 0}
+    shared_ids = {
+        id(word)
+        for other in others
+        if other is not snapshot and isinstance(other.words, frozenset)
+        for word in other.words
+    }
+    own = [word for word in words if id(word) not in shared_ids]
+    return {
+        "word_bytes": sys.getsizeof(words) + sum(map(sys.getsizeof, own)),
+        "shared_words": len(words) - len(own),
+    }
+
+
+class DictionaryRegistry:
+    """Resident solver engines keyed by dictionary type value.
+
+    Lookups are lock-free: registering replaces the whole mapping, so a
+    request always sees a consistent set of engines.
+    """
+
+    def __init__(self):
+        self._engines: Dict[str, WordSolver] = {}
+        self._lock = threading.Lock()
+        self._memory: Optional[Tuple[tuple, Dict[str, Dict[str, Any]]]] = None
+
+    def get(self, name: str) -> Optional[WordSolver]:
+        return self._engines.get(name)
+
+    def names(self) -> List[str]:
+        return list(self._engines)
+
+    def snapshots(self) -> List[DictionarySnapshot]:
+        return [engine.snapshot for engine in self._engines.values()]
+
+    def versions(self) -> List[str]:
+        return [snapshot.version for snapshot in self.snapshots()]
+
+    def share(self, snapshot: DictionarySnapshot) -> DictionarySnapshot:
+        """Deduplicate a snapshot's words against the resident dictionaries."""
+        return share_words(snapshot, self.snapshots())
+
+    def register(
+        self,
+        name: str,
+        snapshot: DictionarySnapshot,
+        primary: Optional[DictionarySnapshot] = None,
+    ) -> WordSolver:
+        """Make ``snapshot`` resident under ``name`` and return its engine."""
+        with self._lock:
+            others = [e.snapshot for key, e in self._engines.items() if key != name]
+            snapshot = share_words(snapshot, others + ([primary] if primary else []))
+            engine = WordSolver.from_snapshot(snapshot)
+            self._engines = {**self._engines, name: engine}
+        return engine
+
+    def clear(self) -> None:
+        with self._lock:
+            self._engines = {}
+
+    def memory(
+        self, primary_name: str, primary: Optional[DictionarySnapshot]
+    ) -> Dict[str, Dict[str, Any]]:
+        """Per-dictionary index and word list sizes, primary included.
+
+        Words shared with an earlier dictionary in the listing are counted
+        once, under that dictionary. The result is cached until the set of
+        resident snapshots changes.
+        """
+        entries = [(name, e.snapshot) for name, e in self._engines.items()]
+        if primary is not None:
+            entries = [(primary_name, primary)] + [
+                (name, s) for name, s in entries if name != primary_name
+            ]
+        key = tuple((id(s), s.version, s.revision) for _, s in entries)
+        cached = self._memory
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        report: Dict[str, Dict[str, Any]] = {}
+        for position, (name, snapshot) in enumerate(entries):
+            earlier = [s for _, s in entries[:position]]
+            report[name] = {
+                "words": len(snapshot.words),
+                "version": snapshot.version,
+                "tier": snapshot.tier,
+                "index_bytes": snapshot.index.nbytes,
+                **word_memory(snapshot, earlier),
+            }
+        self._memory = (key, report)
+        return report
@@ -0,0 +1,116 @@
+"""Sampled, non-blocking structured request logging.
+
+Logging every solve in the request path costs formatting and a synchronous
+write per request, and at production rates the volume is not worth reading.
+``RequestLog`` keeps a sample instead: a request is logged with probability
+``sample_rate``, the decision is made before anything is built, and a
+sampled record is only put on a queue. A background listener thread turns
+records into one JSON line each and writes them out, so request handlers
+never format or write anything themselves. When the queue is full (the
+writer cannot keep up) records are dropped and counted rather than blocking.
+"""
+
+import json
+import logging
+import queue
+import random
+import sys
+from logging.handlers import QueueHandler, QueueListener
+from typing import IO, Any, Dict, Optional
+
+# Logger for request records; kept separate from the application log
+LOGGER_NAME = "wordmixr.requests"
+
+
+class JSONLineFormatter(logging.Formatter):
+    """Format a record's structured fields as one JSON object per line."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        fields: Dict[str, Any] = getattr(record, "fields", {})
+        return json.dumps(
+            {"ts": round(record.created, 3), "event": record.msg, **fields},
+            separators=(",", ":"),
+        )
+
+
+class _DeferredQueueHandler(QueueHandler):
+    """Queue records as they are, leaving all formatting to the listener."""
+
+    def __init__(self, records: "queue.Queue[logging.LogRecord]"):
+        super().__init__(records)
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # The default merges and formats the message in the calling thread;
+        # records never leave the process, so they can be queued untouched
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+class RequestLog:
+    """Write a sample of request records from a background thread."""
+
+    def __init__(
+        self,
+        sample_rate: float,
+        queue_size: int = 10000,
+        stream: Optional[IO[str]] = None,
+    ):
+        self.sample_rate = max(0.0, min(1.0, sample_rate))
+        self._records: "queue.Queue[logging.LogRecord]" = queue.Queue(queue_size)
+        self._handler = _DeferredQueueHandler(self._records)
+        output = logging.StreamHandler(stream or sys.stderr)
+        output.setFormatter(JSONLineFormatter())
+        self._listener = QueueListener(self._records, output)
+        self._logger = logging.getLogger(LOGGER_NAME)
+        self._logger.setLevel(logging.INFO)
+        self._logger.propagate = False
+        self._running = False
+
+    @property
+    def dropped(self) -> int:
+        return self._handler.dropped
+
+    def start(self) -> None:
+        if self.sample_rate > 0 and not self._running:
+            self._logger.addHandler(self._handler)
+            self._listener.start()
+            self._running = True
+
+    def stop(self) -> None:
+        """Stop the writer after it has written every queued record."""
+        if self._running:
+            self._logger.removeHandler(self._handler)
+            self._listener.stop()
+            self._running = False
+
+    def log(
+        self,
+        endpoint: str,
+        rack_length: int,
+        results: int,
+        latency_ms: float,
+        engine: str,
+        cached: bool = False,
+    ) -> None:
+        """Record one request, if it is sampled and the writer is running."""
+        if not self._running or random.random() >= self.sample_rate:  # nosec B311
+            return
+        self._logger.info(
+            "request",
+            extra={
+                "fields": {
+                    "endpoint": endpoint,
+                    "rack_length": rack_length,
+                    "results": results,
+                    "latency_ms": round(latency_ms, 2),
+                    "engine": engine,
+                    "cached": cached,
+                }
+            },
+        )
@@ -0,0 +1,91 @@
+"""Fast JSON responses for large word lists.
+
+FastAPI turns a returned dict into JSON by first walking it with
+``jsonable_encoder``, which for a response with ten thousand words costs
+around fifteen milliseconds - more than solving the rack. Word lists are
+plain strings and numbers, so ``json_response`` encodes them directly with
+the same settings as FastAPI's ``JSONResponse`` (compact separators, UTF-8
+left unescaped), giving byte-for-byte the same body about twenty times
+faster. Bodies of at least ``Config.COMPRESS_MIN_BYTES`` are compressed
+with brotli (when the ``brotli`` package is installed) or gzip, whichever
+the client accepts.
+"""
+
+import gzip
+import json
+from typing import Any, Dict, Optional
+
+from config import Config
+from fastapi import Response
+
+try:
+    import brotli  # Optional: pip install brotli
+except ImportError:  # pragma: no cover - depends on the environment
+    brotli = None
+
+# Content codings in order of preference
+CODINGS = ("br", "gzip")
+
+
+def encode_json(content: Any) -> bytes:
+    """Encode ``content`` exactly as FastAPI's default ``JSONResponse`` does."""
+    return json.dumps(
+        content, ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")
+    ).encode("utf-8")
+
+
+def choose_coding(accept_encoding: Optional[str]) -> Optional[str]:
+    """Return the preferred content coding an ``Accept-Encoding`` value allows."""
+    if not accept_encoding:
+        return None
+    weights: Dict[str, float] = {}
+    for item in accept_encoding.split(","):
+        coding, _, params = item.partition(";")
+        weight = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                weight = float(params[2:])
+            except ValueError:
+                weight = 0.0
+        weights[coding.strip().lower()] = weight
+    for coding in CODINGS:
+        if coding == "br" and brotli is None:
+            continue
+        if weights.get(coding, weights.get("*", 0.0)) > 0:
+            return coding
+    return None
+
+
+def compress(body: bytes, coding: str) -> bytes:
+    """Compress ``body`` with a coding from ``CODINGS``."""
+    if coding == "br":
+        data: bytes = brotli.compress(body, quality=Config.BROTLI_QUALITY)
+        return data
+    return gzip.compress(body, Config.GZIP_LEVEL)
+
+
+def encoded_etag(etag: str, coding: str) -> str:
+    """Return the ETag of the ``coding``-compressed form of a response."""
+    return f'{etag[:-1]}-{coding}"'
+
+
+def json_response(
+    content: Any,
+    headers: Optional[Dict[str, str]] = None,
+    accept_encoding: Optional[str] = None,
+) -> Response:
+    """Return ``content`` as a JSON ``Response``, compressed when worthwhile."""
+    body = encode_json(content)
+    headers = dict(headers or {})
+    if Config.COMPRESS_MIN_BYTES > 0:
+        headers["Vary"] = "Accept-Encoding"
+        coding = choose_coding(accept_encoding)
+        if coding is not None and len(body) >= Config.COMPRESS_MIN_BYTES:
+            body = compress(body, coding)
+            headers["Content-Encoding"] = coding
+            # A strong ETag identifies the exact bytes, so each coding has its own
+            for name, value in headers.items():
+                if name.lower() == "etag":
+                    headers[name] = encoded_etag(value, coding)
+    return Response(body, media_type="application/json", headers=headers)
@@ -0,0 +1,263 @@
+"""Dictionary index stored in a memory-mapped file shared between workers.
+
+With several uvicorn/gunicorn workers every process would otherwise build and
+hold its own copy of the dictionary and index. Instead, the first worker to
+start writes the index's flat arrays to one file and every worker maps it
+read-only; the kernel keeps a single copy of those pages in the page cache no
+matter how many workers attach.
+
+The file is rebuilt only when its fingerprint (dictionary type, source file
+and overlay file size/mtime) no longer matches. A file lock makes concurrent
+workers wait for the one doing the build instead of building in parallel.
+
+The file can also be built ahead of time as a preload step::
+
+    python shared_index.py --path /tmp/wordmixr.idx --dictionary scowl_large
+"""
+
+import argparse
+import fcntl
+import json
+import mmap
+import os
+import sys
+import time
+from array import array
+from typing import Any, Dict, Optional, Tuple
+
+from alphabet import ENGLISH, get_alphabet
+from config import Config, DictionaryType
+from index import SortedWordList, WordIndex
+from solver import DictionarySnapshot, load_snapshot
+
+MAGIC = b"WMXIDX1\0"
+FORMAT_VERSION = 3
+
+# Sections holding index arrays, with their array typecodes
+_ARRAY_SECTIONS = {
+    "masks": "Q",
+    "starts": "I",
+    "length_starts": "I",
+    "deep_cids": "I",
+    "deep_offsets": "I",
+    "word_offsets": "I",
+    "word_starts": "I",
+}
+
+
+def _stat(path: str) -> Optional[Dict[str, Any]]:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return {"path": path, "size": st.st_size, "mtime": st.st_mtime}
+
+
+def source_fingerprint(config_type: Optional[DictionaryType] = None) -> Dict[str, Any]:
+    """Describe the inputs a shared index file was built from."""
+    config_type = config_type or Config.DICTIONARY_TYPE
+    source = None
+    for path in Config.get_dictionary_paths(config_type):
+        source = _stat(path)
+        if source is not None:
+            break
+    return {
+        "format": FORMAT_VERSION,
+        "byteorder": sys.byteorder,
+        "dictionary": config_type.value,
+        "source": source,
+        "overlay": _stat(Config.OVERLAY_FILE) if Config.OVERLAY_FILE else None,
+        "word_tiers": Config.WORD_TIERS,
+    }
+
+
+def _align(offset: int) -> int:
+    return (offset + 7) & ~7
+
+
+def write_shared_index(path: str, snapshot: DictionarySnapshot, fingerprint) -> None:
+    """Write a snapshot's words and index to ``path`` atomically."""
+    index = snapshot.index
+    words = SortedWordList.build(snapshot.words)
+
+    deep_cids = array("I", sorted(index.deep))
+    deep_offsets = array("I", [0])
+    deep_levels = bytearray()
+    for cid in deep_cids:
+        levels = index.deep[cid]
+        deep_levels += levels.to_bytes((levels.bit_length() + 7) // 8, "little")
+        deep_offsets.append(len(deep_levels))
+
+    sections = {
+        "masks": index.masks.tobytes(),
+        "starts": index.starts.tobytes(),
+        "length_starts": index.length_starts.tobytes(),
+        "blob": bytes(index.blob),
+        "deep_cids": deep_cids.tobytes(),
+        "deep_offsets": deep_offsets.tobytes(),
+        "deep_levels": bytes(deep_levels),
+        "word_offsets": words.offsets.tobytes(),
+        "word_blob": bytes(words.blob),
+    }
+    if index.tiers is not None and index.word_starts is not None:
+        sections["tiers"] = bytes(index.tiers)
+        sections["word_starts"] = index.word_starts.tobytes()
+
+    layout = {}
+    offset = 0
+    for name, data in sections.items():
+        layout[name] = [offset, len(data)]
+        offset = _align(offset + len(data))
+
+    header = json.dumps(
+        {
+            "fingerprint": fingerprint,
+            "version": snapshot.version,
+            "info": snapshot.info,
+            "added": sorted(snapshot.added),
+            "removed": sorted(snapshot.removed),
+            "word_count": index.word_count,
+            "dictionary_type": index.dictionary_type,
+            "created_at": time.time(),
+            "sections": layout,
+        }
+    ).encode("utf-8")
+    data_start = _align(len(MAGIC) + 8 + len(header))
+
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(MAGIC)
+        f.write(len(header).to_bytes(8, "little"))
+        f.write(header)
+        for name, data in sections.items():
+            f.seek(data_start + layout[name][0])
+            f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    # Workers that already mapped the old file keep their pages; new attaches
+    # see the new file
+    os.replace(tmp_path, path)
+
+
+def read_header(path: str) -> Tuple[Dict[str, Any], int]:
+    """Return a shared index file's header and the offset of its data."""
+    with open(path, "rb") as f:
+        if f.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f"{path} is not a WordMixr index file")
+        length = int.from_bytes(f.read(8), "little")
+        header = json.loads(f.read(length).decode("utf-8"))
+    return header, _align(len(MAGIC) + 8 + length)
+
+
+def attach_shared_index(path: str, tier: str = "full") -> DictionarySnapshot:
+    """Map a shared index file read-only and wrap it in a snapshot."""
+    header, data_start = read_header(path)
+    with open(path, "rb") as f:
+        mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    view = memoryview(mapping)
+
+    def section(name: str) -> Any:
+        offset, length = header["sections"][name]
+        start = data_start + offset
+        part = view[start : start + length]
+        typecode = _ARRAY_SECTIONS.get(name)
+        return part.cast(typecode) if typecode else part  # type: ignore
+
+    # Deep classes are rare, so a per-worker dict of them costs little
+    deep_offsets = section("deep_offsets")
+    deep_levels = section("deep_levels")
+    deep = {
+        cid: int.from_bytes(
+            deep_levels[deep_offsets[i] : deep_offsets[i + 1]], "little"
+        )
+        for i, cid in enumerate(section("deep_cids"))
+    }
+
+    has_tiers = "tiers" in header["sections"]
+    index = WordIndex(
+        section("masks"),
+        deep,
+        section("starts"),
+        section("blob"),
+        section("length_starts"),
+        header["word_count"],
+        header["dictionary_type"],
+        get_alphabet(header["info"].get("alphabet", ENGLISH.name)),
+        *((section("tiers"), section("word_starts")) if has_tiers else ()),
+    )
+    index.shared = True
+    words = SortedWordList(section("word_blob"), section("word_offsets"))
+    info = {**header["info"], "shared_index": path}
+    return DictionarySnapshot(
+        words=words,  # type: ignore[arg-type]
+        info=info,
+        index=index,
+        version=header["version"],
+        added=frozenset(header["added"]),
+        removed=frozenset(header["removed"]),
+        tier=tier,
+    )
+
+
+def _is_current(path: str, fingerprint: Dict[str, Any]) -> bool:
+    try:
+        header, _ = read_header(path)
+    except (OSError, ValueError):
+        return False
+    return bool(header.get("fingerprint") == fingerprint)
+
+
+def load_shared_snapshot(
+    path: str,
+    config_type: Optional[DictionaryType] = None,
+    tier: str = "full",
+    force: bool = False,
+) -> DictionarySnapshot:
+    """Attach to the shared index at ``path``, building it first if stale."""
+    fingerprint = source_fingerprint(config_type)
+    if force or not _is_current(path, fingerprint):
+        with open(f"{path}.lock", "w") as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            try:
+                # Another worker may have finished the build while we waited
+                if force or not _is_current(path, fingerprint):
+                    print(f"Building shared dictionary index: {path}")
+                    snapshot = load_snapshot(config_type, tier=tier)
+                    write_shared_index(path, snapshot, fingerprint)
+            finally:
+                fcntl.flock(lock, fcntl.LOCK_UN)
+    return attach_shared_index(path, tier=tier)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Build the shared WordMixr dictionary index file"
+    )
+    parser.add_argument(
+        "--path",
+        default=Config.SHARED_INDEX_PATH,
+        help="Index file to write (default: $WORDMIXR_SHARED_INDEX)",
+    )
+    parser.add_argument(
+        "--dictionary",
+        type=DictionaryType,
+        default=Config.DICTIONARY_TYPE,
+        help="Dictionary type to index (default: $WORDMIXR_DICTIONARY)",
+    )
+    parser.add_argument(
+        "--force", action="store_true", help="Rebuild even if the file is current"
+    )
+    args = parser.parse_args(argv)
+    if not args.path:
+        parser.error("--path or WORDMIXR_SHARED_INDEX is required")
+
+    snapshot = load_shared_snapshot(args.path, args.dictionary, force=args.force)
+    print(
+        f"Shared index {args.path}: {snapshot.info['size']} words, "
+        f"version {snapshot.version}, {os.path.getsize(args.path)} bytes"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
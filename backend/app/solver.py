@@ -1,13 +1,28 @@
 import os
+import time
+from bisect import bisect_left
 from collections import Counter
-
-from config import Config
-
-
-def load_dictionary() -> tuple[set, dict]:
+from dataclasses import dataclass, field, replace
+from functools import cached_property
+from typing import Callable, Dict, List, Optional, Tuple
+
+from admission import checkpoint
+from alphabet import ENGLISH, Alphabet, get_alphabet
+from config import Config, DictionaryType
+from index import (
+    SortedWordList,
+    WordIndex,
+    dictionary_version,
+    tier_mask,
+    tier_names,
+)
+
+
+def load_dictionary(config_type: Optional[DictionaryType] = None) -> tuple[set, dict]:
     """Load dictionary words from configured file with metadata."""
-    # Get dictionary paths from configuration
-    dict_paths = Config.get_dictionary_paths()
+    # Get dictionary paths and alphabet from configuration
+    dict_paths = Config.get_dictionary_paths(config_type)
+    alphabet = Config.get_alphabet(config_type)
 
     # Try to load from each path in order
     for filepath in dict_paths:
@@ -16,7 +31,7 @@ def load_dictionary() -> tuple[set, dict]:
                 with open(filepath, "r", encoding="utf-8") as f:
                     words = set()
                     for word in f:
-                        word = word.strip().lower()
+                        word = alphabet.normalize(word.strip())
                         if (
                             word and len(word) >= 2
                         ):  # Only include words with 2+ characters
@@ -29,6 +44,8 @@ def load_dictionary() -> tuple[set, dict]:
                         dict_type = "scowl_medium"
                     elif "scowl-large" in filepath:
                         dict_type = "scowl_large"
+                    elif alphabet is not ENGLISH:
+                        dict_type = (config_type or Config.DICTIONARY_TYPE).value
                     elif len(words) < 20000:
                         dict_type = "small"
                     elif len(words) < 70000:
@@ -42,7 +59,8 @@ def load_dictionary() -> tuple[set, dict]:
                         "filepath": filepath,
                         "size": len(words),
                         "type": dict_type,
-                        "config": Config.get_dictionary_info(),
+                        "alphabet": alphabet.name,
+                        "config": Config.get_dictionary_info(config_type),
                     }
 
                     print(f"Loaded dictionary: {filepath} ({len(words)} words)")
@@ -52,6 +70,12 @@ def load_dictionary() -> tuple[set, dict]:
                 print(f"Error loading dictionary from {filepath}: {e}")
                 continue
 
+    # The built-in fallback is English only
+    if alphabet is not ENGLISH:
+        raise FileNotFoundError(
+            f"No {alphabet.name} dictionary file found (tried {', '.join(dict_paths)})"
+        )
+
     # Ultimate fallback - small curated dictionary
     print("Warning: Using fallback dictionary")
     fallback_words = {
@@ -226,7 +250,8 @@ def load_dictionary() -> tuple[set, dict]:
         "filepath": "builtin_fallback",
         "size": len(fallback_words),
         "type": "fallback",
-        "config": Config.get_dictionary_info(),
+        "alphabet": ENGLISH.name,
+        "config": Config.get_dictionary_info(config_type),
     }
 
     return fallback_words, fallback_info
@@ -326,11 +351,236 @@ def is_valid_word(word, min_length=3, dictionary_type="scowl_large"):
     return True
 
 
+def load_overlay(path: str, alphabet: Alphabet = ENGLISH) -> tuple[set, set]:
+    """Read the words added to and removed from the base dictionary.
+
+    Words are normalized with the dictionary's ``alphabet``, as edits are.
+    """
+    added: set = set()
+    removed: set = set()
+    if not path or not os.path.exists(path):
+        return added, removed
+
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            op, word = line[0], alphabet.normalize(line[1:].strip())
+            if op == "+":
+                added.add(word)
+                removed.discard(word)
+            elif op == "-":
+                removed.add(word)
+                added.discard(word)
+    return added, removed
+
+
+def save_overlay(path: str, added, removed) -> None:
+    """Atomically write the overlay file."""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write("# WordMixr dictionary overlay: +word adds, -word removes\n")
+        for word in sorted(added):
+            f.write(f"+{word}\n")
+        for word in sorted(removed):
+            f.write(f"-{word}\n")
+    os.replace(tmp_path, path)
+
+
+def _with(words, word: str):
+    # A memory-mapped list records the edit in its overlay instead of being
+    # copied into this process
+    if isinstance(words, SortedWordList):
+        return words.with_word(word)
+    return words | {word}
+
+
+def _without(words, word: str):
+    if isinstance(words, SortedWordList):
+        return words.without_word(word)
+    return words - {word}
+
+
+@dataclass(frozen=True)
+class DictionarySnapshot:
+    """A loaded dictionary together with its precomputed index.
+
+    Snapshots are never mutated. Requests capture one snapshot and use it
+    throughout, so a reload only has to replace the reference for new requests
+    to see the new dictionary while in-flight requests finish on the old one.
+
+    ``version`` identifies the word list the snapshot was built from and
+    namespaces cached results; ``revision`` counts single-word edits applied
+    since, each of which invalidates only the cached results it affects.
+    ``added`` and ``removed`` hold the overlay applied on top of the base file.
+    ``tier`` is "fast" for the small stand-in dictionary served while the
+    configured one is still loading, and "full" otherwise.
+    """
+
+    words: frozenset
+    info: dict
+    index: WordIndex
+    version: str
+    loaded_at: float = field(default_factory=time.time)
+    added: frozenset = frozenset()
+    removed: frozenset = frozenset()
+    revision: int = 0
+    tier: str = "full"
+
+    @property
+    def dictionary_type(self) -> str:
+        return str(self.info.get("type", "scowl_large"))
+
+    @cached_property
+    def content_version(self) -> str:
+        """Identifies the exact word list served, single-word edits included."""
+        if not self.added and not self.removed:
+            return self.version
+        edits = [f"+{word}" for word in self.added]
+        edits += [f"-{word}" for word in self.removed]
+        return dictionary_version([self.version, *edits])
+
+    @property
+    def alphabet(self) -> Alphabet:
+        return self.index.alphabet
+
+    def _edited(
+        self, words: frozenset, index: WordIndex, added, removed
+    ) -> "DictionarySnapshot":
+        info = {
+            **self.info,
+            "size": len(words),
+            "overlay": {"added": len(added), "removed": len(removed)},
+        }
+        return replace(
+            self,
+            words=words,
+            info=info,
+            index=index,
+            added=frozenset(added),
+            removed=frozenset(removed),
+            revision=self.revision + 1,
+        )
+
+    def with_word(self, word: str) -> "DictionarySnapshot":
+        """Return a snapshot that also contains ``word``."""
+        if word in self.words:
+            return self
+        index = self.index
+        if is_valid_word(word, 1, self.dictionary_type):
+            index = index.with_word(word)
+        return self._edited(
+            _with(self.words, word), index, self.added | {word}, self.removed - {word}
+        )
+
+    def without_word(self, word: str) -> "DictionarySnapshot":
+        """Return a snapshot that no longer contains ``word``."""
+        if word not in self.words:
+            return self
+        return self._edited(
+            _without(self.words, word),
+            self.index.without_word(word),
+            self.added - {word},
+            self.removed | {word},
+        )
+
+
+# Bundled dictionaries behind each word tier, in ``TIER_NAMES`` order
+TIER_DICTIONARIES = (
+    DictionaryType.GOOGLE_10K,
+    DictionaryType.SCOWL_MEDIUM,
+    DictionaryType.SCOWL_LARGE,
+)
+
+
+def _read_word_list(dict_type: DictionaryType) -> set:
+    """Read a bundled word list as-is, without quality filtering."""
+    for filepath in Config.get_dictionary_paths(dict_type):
+        if os.path.exists(filepath):
+            with open(filepath, "r", encoding="utf-8") as f:
+                return {line.strip().lower() for line in f}
+    return set()
+
+
+def load_tier_bits(words, dictionary_type: str) -> Optional[Callable[[str], int]]:
+    """Return a function giving a word's tier bits, or None without tier lists.
+
+    The lists are read once here and dropped after the index is built; only
+    the per-word bits are kept.
+    """
+    lists = [
+        words if tier_type.value == dictionary_type else _read_word_list(tier_type)
+        for tier_type in TIER_DICTIONARIES
+    ]
+    if not any(lists):
+        return None
+    word_bits: Dict[str, int] = dict.fromkeys(lists[-1], 1 << (len(lists) - 1))
+    for i, tier_words in enumerate(lists[:-1]):
+        for word in tier_words:
+            word_bits[word] = word_bits.get(word, 0) | 1 << i
+    return lambda word: word_bits.get(word, 0)
+
+
+def build_snapshot(
+    words, info, added=(), removed=(), tier: str = "full"
+) -> DictionarySnapshot:
+    """Build the index for a loaded word list and wrap both in a snapshot."""
+    dict_type = info.get("type", "scowl_large")
+    alphabet = get_alphabet(info.get("alphabet", ENGLISH.name))
+    # The fast stand-in dictionary skips tiers so it loads as quickly as possible
+    tiers = None
+    if Config.WORD_TIERS and alphabet is ENGLISH and tier != "fast":
+        tiers = load_tier_bits(words, dict_type)
+    index = WordIndex.build(
+        words,
+        dict_type,
+        keep=lambda word: is_valid_word(word, 1, dict_type),
+        alphabet=alphabet,
+        tiers=tiers,
+    )
+    return DictionarySnapshot(
+        words=frozenset(words),
+        info=info,
+        index=index,
+        version=dictionary_version(words),
+        added=frozenset(added),
+        removed=frozenset(removed),
+        tier=tier,
+    )
+
+
+def load_snapshot(
+    config_type: Optional[DictionaryType] = None, tier: str = "full"
+) -> DictionarySnapshot:
+    """Load the configured dictionary, apply the overlay and build its index."""
+    words, info = load_dictionary(config_type)
+    alphabet = get_alphabet(info.get("alphabet", ENGLISH.name))
+    added, removed = load_overlay(Config.OVERLAY_FILE, alphabet)
+    if added or removed:
+        words = (words | added) - removed
+        info = {
+            **info,
+            "size": len(words),
+            "overlay": {"added": len(added), "removed": len(removed)},
+        }
+    return build_snapshot(words, info, added, removed, tier)
+
+
 def find_valid_words(letters, dictionary, min_length=3, dictionary_type="scowl_large"):
-    """Find all valid words that can be formed using the given letters."""
+    """Find all valid words that can be formed using the given letters.
+
+    ``dictionary`` may be a plain word set or a prebuilt ``WordIndex``.
+    """
     if not letters or not dictionary:
         return []
 
+    if isinstance(dictionary, WordIndex):
+        words = dictionary.find_words(letters.lower(), min_length)
+        if dictionary_type != dictionary.dictionary_type:
+            words = [w for w in words if is_valid_word(w, min_length, dictionary_type)]
+        return words
+
     letter_count = Counter(letters.lower())
     valid_words = set()
 
@@ -356,6 +606,14 @@ def get_anagrams(letters, dictionary, min_length=3, dictionary_type="scowl_large
     if not letters or not dictionary:
         return []
 
+    if isinstance(dictionary, WordIndex):
+        anagrams = dictionary.find_anagrams(letters.lower(), min_length)
+        if dictionary_type != dictionary.dictionary_type:
+            anagrams = [
+                w for w in anagrams if is_valid_word(w, min_length, dictionary_type)
+            ]
+        return anagrams
+
     letter_count = Counter(letters.lower())
     anagrams = []
 
@@ -370,3 +628,205 @@ def get_anagrams(letters, dictionary, min_length=3, dictionary_type="scowl_large
                 anagrams.append(word)
 
     return sorted(anagrams, key=lambda x: (len(x), x))
+
+
+def find_tiered_words(
+    letters, index: WordIndex, min_length=3, max_tier: Optional[str] = None
+) -> Tuple[List[str], Dict[str, str]]:
+    """Find formable words and the smallest bundled list containing each.
+
+    ``max_tier`` keeps only words in that tier or a smaller one.
+    """
+    if not letters:
+        return [], {}
+    mask = tier_mask(max_tier) if max_tier else 0
+    words, word_tiers = index.find_tiered_words(letters.lower(), min_length, mask)
+    return words, tier_names(word_tiers)
+
+
+def parse_anchors(spec: str, alphabet: Alphabet) -> List[Tuple[str, Optional[int]]]:
+    """Parse "e,s@0,t@-1" into (letter, position) anchors.
+
+    A position pins the anchor to that index of the word (negative indexes
+    count from the end); without one the anchor may go anywhere.
+    """
+    anchors: List[Tuple[str, Optional[int]]] = []
+    for part in filter(None, (part.strip() for part in spec.split(","))):
+        letter, _, position = part.partition("@")
+        letter = alphabet.normalize(letter)
+        if len(letter) != 1 or not alphabet.spells(letter):
+            raise ValueError(f"Invalid anchor {part!r}; expected a letter")
+        try:
+            anchors.append((letter, int(position) if position else None))
+        except ValueError:
+            raise ValueError(f"Invalid anchor position {part!r}; expected LETTER@INDEX")
+    return anchors
+
+
+def anchor_label(letter: str, position: Optional[int]) -> str:
+    return letter if position is None else f"{letter}@{position}"
+
+
+def find_hook_words(
+    letters, anchors: List[Tuple[str, Optional[int]]], index: WordIndex, min_length=3
+) -> Tuple[List[str], Dict[str, List[str]]]:
+    """Find words formable from ``letters`` plus exactly one anchor letter.
+
+    ``anchors`` comes from ``parse_anchors``. Returns the words, shortest
+    first, and for each word the anchors it can be played through.
+    """
+    if not anchors:
+        return [], {}
+    letters = letters.lower()
+    hooks = index.find_hook_words(letters, "".join(a for a, _ in anchors), min_length)
+    used: Dict[str, List[str]] = {}
+    for word, letter in hooks.items():
+        labels = [
+            anchor_label(anchor, position)
+            for anchor, position in anchors
+            if anchor == letter
+            and (
+                position is None
+                or (-len(word) <= position < len(word) and word[position] == letter)
+            )
+        ]
+        if labels:
+            used[word] = labels
+    return list(used), used
+
+
+def check_words(
+    words, snapshot: DictionarySnapshot, min_length=3
+) -> List[Dict[str, object]]:
+    """Report, in input order, whether each word is in the dictionary.
+
+    ``valid`` means the word is in the word list; ``playable`` means it also
+    passes the quality filter at ``min_length``, i.e. the solvers would
+    return it.
+    """
+    alphabet = snapshot.alphabet
+    candidates = [alphabet.normalize(word.strip()) for word in words]
+    store = snapshot.words
+    if isinstance(store, SortedWordList):
+        # One sorted pass over the blob instead of a binary search per word
+        members = store.contains_many(candidates)
+    else:
+        members = frozenset(word for word in candidates if word in store)
+    dict_type = snapshot.dictionary_type
+    results: List[Dict[str, object]] = []
+    for word in candidates:
+        valid = word in members
+        playable = (
+            valid
+            and alphabet.spells(word)
+            and is_valid_word(word, min_length, dict_type)
+        )
+        results.append({"word": word, "valid": valid, "playable": playable})
+    return results
+
+
+def is_playable(word: str, snapshot: DictionarySnapshot) -> bool:
+    """Return whether ``word`` belongs in the snapshot's ``playable_words``."""
+    return snapshot.alphabet.spells(word) and is_valid_word(
+        word, 1, snapshot.dictionary_type
+    )
+
+
+def playable_words(snapshot: DictionarySnapshot) -> List[str]:
+    """Return the snapshot's indexable words in sorted order.
+
+    The list holds the snapshot's own string objects, so it only costs a
+    pointer per word.
+    """
+    return sorted(word for word in snapshot.words if is_playable(word, snapshot))
+
+
+def find_completions(
+    prefix: str,
+    letters: str,
+    words: Dict[int, List[str]],
+    min_length=3,
+    limit=10,
+) -> List[str]:
+    """Return up to ``limit`` words starting with ``prefix``, shortest first.
+
+    ``words`` maps each length to its sorted playable words; only words
+    that can be built
+    from ``letters`` are returned. Lengths are searched shortest first and
+    each prefix range is found by binary search, so a lookup stops as soon
+    as ``limit`` words are found instead of scanning every word sharing the
+    prefix.
+    """
+    remaining = Counter(letters)
+    remaining.subtract(prefix)
+    if min(remaining.values(), default=0) < 0:
+        return []
+    start = len(prefix)
+    completions: List[str] = []
+    for length in range(max(min_length, start, 1), len(letters) + 1):
+        bucket = words.get(length)
+        if bucket is None:
+            continue
+        for i in range(bisect_left(bucket, prefix), len(bucket)):
+            word = bucket[i]
+            if not word.startswith(prefix):
+                break
+            suffix = word[start:]
+            if all(suffix.count(char) <= remaining[char] for char in set(suffix)):
+                completions.append(word)
+                if len(completions) == limit:
+                    return completions
+    return completions
+
+
+# Sorts after any string of letters, bounding a prefix range from above
+_PAST_LETTERS = chr(0x10FFFF)
+
+
+def _grid_neighbours(rows: List[str]) -> List[List[int]]:
+    """Return the cells adjacent to each cell (diagonals included), row-major."""
+    height, width = len(rows), len(rows[0])
+    neighbours = []
+    for r in range(height):
+        for c in range(width):
+            neighbours.append(
+                [
+                    nr * width + nc
+                    for nr in range(max(r - 1, 0), min(r + 2, height))
+                    for nc in range(max(c - 1, 0), min(c + 2, width))
+                    if (nr, nc) != (r, c)
+                ]
+            )
+    return neighbours
+
+
+def find_grid_words(rows: List[str], words: List[str], min_length=3) -> List[str]:
+    """Find the words traceable through adjacent cells of a board.
+
+    ``rows`` are equal-length strings, one letter per cell, and a word may
+    use each cell once. ``words`` is the sorted ``playable_words`` list: the
+    depth-first search keeps the range of words starting with the path so
+    far, narrowing it by binary search at each step and abandoning a path
+    as soon as the range is empty.
+    """
+    cells = "".join(rows)
+    neighbours = _grid_neighbours(rows)
+    found = set()
+
+    def visit(cell: int, path: str, lo: int, hi: int, used: int) -> None:
+        path += cells[cell]
+        lo = bisect_left(words, path, lo, hi)
+        hi = bisect_left(words, path + _PAST_LETTERS, lo, hi)
+        if lo == hi:
+            return
+        if words[lo] == path and len(path) >= min_length:
+            found.add(path)
+        used |= 1 << cell
+        for neighbour in neighbours[cell]:
+            if not used >> neighbour & 1:
+                visit(neighbour, path, lo, hi, used)
+
+    for cell in range(len(cells)):
+        checkpoint()
+        visit(cell, "", 0, len(words), 0)
+    return sorted(found, key=lambda x: (len(x), x))
@@ -1,5 +1,10 @@
-import re
-from typing import Any, Dict, List, TypedDict
+import hashlib
+import resource
+from typing import Any, Dict, List, Optional, TypedDict
+
+from alphabet import ENGLISH, Alphabet
+from config import Config
+from responses import CODINGS, encoded_etag
 
 
 class ValidationResult(TypedDict):
@@ -8,17 +13,16 @@ class ValidationResult(TypedDict):
     cleaned: str
 
 
-def clean_letters(letters: str) -> str:
+def clean_letters(letters: str, alphabet: Alphabet = ENGLISH) -> str:
     """Clean and validate input letters."""
     if not letters:
         return ""
 
-    # Remove non-alphabetic characters and convert to lowercase
-    cleaned = re.sub(r"[^a-zA-Z]", "", letters).lower()
-    return cleaned
+    # Remove characters outside the alphabet and convert to lowercase
+    return alphabet.clean(letters)
 
 
-def validate_letters(letters: str) -> ValidationResult:
+def validate_letters(letters: str, alphabet: Alphabet = ENGLISH) -> ValidationResult:
     """Validate the input letters and return validation result."""
     result: ValidationResult = {"valid": True, "errors": [], "cleaned": letters}
 
@@ -27,22 +31,54 @@ def validate_letters(letters: str) -> ValidationResult:
         result["errors"].append("Letters parameter is required")
         return result
 
-    cleaned = clean_letters(letters)
+    cleaned = clean_letters(letters, alphabet)
 
     if not cleaned:
         result["valid"] = False
         result["errors"].append("No valid letters found in input")
         return result
 
-    if len(cleaned) > 20:
+    if len(cleaned) > Config.MAX_LETTERS:
         result["valid"] = False
-        result["errors"].append("Too many letters (maximum 20 allowed)")
+        result["errors"].append(
+            f"Too many letters (maximum {Config.MAX_LETTERS} allowed)"
+        )
         return result
 
     result["cleaned"] = cleaned
     return result
 
 
+class GridValidationResult(TypedDict):
+    valid: bool
+    errors: List[str]
+    rows: List[str]
+
+
+def validate_grid(board: str, alphabet: Alphabet = ENGLISH) -> GridValidationResult:
+    """Validate a board given as comma-separated rows of letters."""
+    result: GridValidationResult = {"valid": False, "errors": [], "rows": []}
+
+    rows = [clean_letters(row, alphabet) for row in board.split(",")]
+    if not any(rows):
+        result["errors"].append("Board parameter is required")
+        return result
+
+    if not all(rows) or len({len(row) for row in rows}) > 1:
+        result["errors"].append("Board rows must all have the same number of letters")
+        return result
+
+    if max(len(rows), len(rows[0])) > Config.MAX_GRID_SIZE:
+        result["errors"].append(
+            f"Board too large (maximum {Config.MAX_GRID_SIZE} cells per side)"
+        )
+        return result
+
+    result["valid"] = True
+    result["rows"] = rows
+    return result
+
+
 def format_response(words: List[str], letters: str) -> Dict[str, Any]:
     """Format the API response."""
     return {
@@ -56,3 +92,60 @@ def format_response(words: List[str], letters: str) -> Dict[str, Any]:
 def format_error_response(errors: List[str]) -> Dict[str, Any]:
     """Format an error response."""
     return {"success": False, "errors": errors, "words": []}
+
+
+def make_etag(*parts: Any) -> str:
+    """Return a strong ETag for a response determined entirely by ``parts``."""
+    digest = hashlib.sha256("\x1f".join(map(str, parts)).encode("utf-8"))
+    return f'"{digest.hexdigest()[:32]}"'
+
+
+def matching_etag(if_none_match: Optional[str], etag: str) -> Optional[str]:
+    """Return the tag in an ``If-None-Match`` value that matches ``etag``.
+
+    The header lists tags separated by commas or is "*"; it is compared
+    weakly, so a ``W/`` prefix added by a proxy still matches, and the tags
+    of compressed copies (``encoded_etag``) match too. Returns None when
+    nothing matches.
+    """
+    if not if_none_match:
+        return None
+    variants = {etag, *(encoded_etag(etag, coding) for coding in CODINGS)}
+    for tag in if_none_match.split(","):
+        tag = tag.strip()
+        if tag == "*":
+            return etag
+        tag = tag[2:] if tag.startswith("W/") else tag
+        if tag in variants:
+            return tag
+    return None
+
+
+def process_memory() -> Dict[str, int]:
+    """Report this process's memory use in kilobytes.
+
+    On Linux ``pss`` splits shared pages (such as a mapped shared index)
+    between the processes using them, so summing it over all workers gives
+    their real combined footprint; ``rss`` counts shared pages in full.
+    """
+    fields = {
+        "Rss": "rss",
+        "Pss": "pss",
+        "Shared_Clean": "shared_clean",
+        "Shared_Dirty": "shared_dirty",
+        "Private_Clean": "private_clean",
+        "Private_Dirty": "private_dirty",
+    }
+    memory: Dict[str, int] = {}
+    try:
+        with open("/proc/self/smaps_rollup", "r") as f:
+            for line in f:
+                name, _, value = line.partition(":")
+                if name in fields:
+                    memory[fields[name] + "_kb"] = int(value.split()[0])
+    except (OSError, ValueError, IndexError):
+        pass
+    if not memory:
+        # ru_maxrss is the peak, not current, resident size
+        memory["max_rss_kb"] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return memory
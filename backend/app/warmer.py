@@ -0,0 +1,227 @@
+"""Offline result cache warmer.
+
+Precomputes ``/solve`` and ``/anagrams`` results for the racks players
+actually ask for, so the first requests after a deploy are cache hits instead
+of paying the full solver cost. Racks come from an access log (most frequent
+first) or from a level-pack file (one rack per line). Results are computed in
+parallel with a process pool and written to a gzip-compressed JSON lines
+artifact that the app loads at startup (``WORDMIXR_WARM_CACHE``) before it
+reports ready::
+
+    python warmer.py --log access.log --top 5000 --output warm-cache.jsonl.gz
+    python warmer.py --level-pack levels.txt --output warm-cache.jsonl.gz
+"""
+
+import argparse
+import gzip
+import json
+import os
+import re
+import sys
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterable, List, Optional, Tuple
+from urllib.parse import parse_qs
+
+from alphabet import ENGLISH, Alphabet
+from cache import CacheBackend
+from config import Config, DictionaryType
+from engine import WordSolver
+from utils import validate_letters
+
+ARTIFACT_FORMAT = 1
+
+# (kind, letters, min_length) - ``kind`` is "solve" or "anagrams"
+Rack = Tuple[str, str, int]
+
+_REQUEST_RE = re.compile(r"/(solve|anagrams)\?([^\s\"]+)")
+
+# Engine used by pool workers; set in the parent before forking so workers
+# inherit it, or loaded by the pool initializer otherwise
+_engine: Optional[WordSolver] = None
+
+
+def _normalize(
+    kind: str, letters: str, min_length: int, alphabet: Alphabet
+) -> Optional[Rack]:
+    validation = validate_letters(letters, alphabet)
+    if not validation["valid"] or not 1 <= min_length <= 10:
+        return None
+    # Letter order does not affect results (see CacheBackend.make_key)
+    return (kind, "".join(sorted(validation["cleaned"])), min_length)
+
+
+def parse_log(lines: Iterable[str], alphabet: Alphabet = ENGLISH) -> Counter:
+    """Count the solver requests found in access log lines."""
+    racks: Counter = Counter()
+    for line in lines:
+        for kind, query in _REQUEST_RE.findall(line):
+            params = parse_qs(query)
+            try:
+                min_length = int(params.get("min_word_length", ["3"])[0])
+            except ValueError:
+                continue
+            letters = params.get("letters", [""])[0]
+            rack = _normalize(kind, letters, min_length, alphabet)
+            if rack is not None:
+                racks[rack] += 1
+    return racks
+
+
+def parse_level_pack(
+    lines: Iterable[str], min_length: int = 3, alphabet: Alphabet = ENGLISH
+) -> List[Rack]:
+    """Return the racks for every level in a level pack.
+
+    Each non-empty, non-comment line holds one level's letters; both the
+    solve and anagram results are warmed for it.
+    """
+    racks: List[Rack] = []
+    seen = set()
+    for line in lines:
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        for kind in ("solve", "anagrams"):
+            rack = _normalize(kind, line, min_length, alphabet)
+            if rack is not None and rack not in seen:
+                seen.add(rack)
+                racks.append(rack)
+    return racks
+
+
+def _init_worker(config_type: Optional[DictionaryType]) -> None:
+    global _engine
+    if _engine is None:
+        _engine = WordSolver(config_type).load()
+
+
+def _solve(rack: Rack) -> Tuple[str, str, int, List[str]]:
+    if _engine is None:
+        raise RuntimeError("Warmer worker has no dictionary loaded")
+    kind, letters, min_length = rack
+    solve = _engine.solve if kind == "solve" else _engine.anagrams
+    return (kind, letters, min_length, solve(letters, min_length))
+
+
+def build_warm_cache(
+    racks: List[Rack],
+    output: str,
+    config_type: Optional[DictionaryType] = None,
+    workers: Optional[int] = None,
+) -> dict:
+    """Solve ``racks`` in a process pool and write the warm-cache artifact.
+
+    Racks should be ordered most valuable first; the artifact keeps that
+    order.
+    """
+    global _engine
+    _engine = WordSolver(config_type).load()
+    snapshot = _engine.snapshot
+    header = {
+        "format": ARTIFACT_FORMAT,
+        "version": snapshot.version,
+        "dictionary_type": snapshot.dictionary_type,
+        "created_at": time.time(),
+        "entries": len(racks),
+    }
+
+    workers = workers or os.cpu_count() or 1
+    started = time.time()
+    tmp_path = f"{output}.tmp"
+    with (
+        ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_worker, initargs=(config_type,)
+        ) as pool,
+        gzip.open(tmp_path, "wt", encoding="utf-8") as f,
+    ):
+        f.write(json.dumps(header) + "\n")
+        chunksize = max(1, len(racks) // (4 * workers))
+        for entry in pool.map(_solve, racks, chunksize=chunksize):
+            f.write(json.dumps(entry, separators=(",", ":")) + "\n")
+    os.replace(tmp_path, output)
+    return {**header, "seconds": round(time.time() - started, 3)}
+
+
+def load_warm_cache(
+    path: str,
+    cache: CacheBackend,
+    version: str,
+    content_version: Optional[str] = None,
+    edited: Iterable[str] = (),
+) -> int:
+    """Load a warm-cache artifact into ``cache``; return the entries loaded.
+
+    Artifacts built against a different dictionary version are ignored. When
+    single-word edits apply on top of ``version``, entries are stored under
+    the edited list's ``content_version`` and those an ``edited`` word could
+    change are skipped.
+    """
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        header = json.loads(f.readline())
+        if header.get("format") != ARTIFACT_FORMAT:
+            raise ValueError(f"Unsupported warm cache format in {path}")
+        if header.get("version") != version:
+            return 0
+        entries = [json.loads(line) for line in f]
+
+    edited = list(edited)
+    loaded = 0
+    # Insert the most valuable racks last so an LRU cache keeps them
+    for kind, letters, min_length, words in reversed(entries):
+        key = CacheBackend.make_key(
+            content_version or version, kind, letters, min_length
+        )
+        if not any(CacheBackend.affected_by(key, word) for word in edited):
+            cache.set(key, words)
+            loaded += 1
+    return loaded
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Build a WordMixr warm cache")
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--log", help="Access log to take the most common racks from")
+    source.add_argument("--level-pack", help="Level pack file, one rack per line")
+    parser.add_argument(
+        "--output",
+        default=Config.WARM_CACHE_PATH or "warm-cache.jsonl.gz",
+        help="Artifact to write (default: $WORDMIXR_WARM_CACHE)",
+    )
+    parser.add_argument(
+        "--top", type=int, default=10000, help="Number of log racks to keep"
+    )
+    parser.add_argument(
+        "--min-length", type=int, default=3, help="Minimum word length for packs"
+    )
+    parser.add_argument(
+        "--dictionary",
+        type=DictionaryType,
+        default=Config.DICTIONARY_TYPE,
+        help="Dictionary type to solve with (default: $WORDMIXR_DICTIONARY)",
+    )
+    parser.add_argument(
+        "--workers", type=int, default=None, help="Worker processes (default: CPUs)"
+    )
+    args = parser.parse_args(argv)
+
+    alphabet = Config.get_alphabet(args.dictionary)
+    if args.log:
+        with open(args.log, "r", encoding="utf-8", errors="replace") as f:
+            counts = parse_log(f, alphabet)
+        racks = [rack for rack, _ in counts.most_common(args.top)]
+    else:
+        with open(args.level_pack, "r", encoding="utf-8") as f:
+            racks = parse_level_pack(f, args.min_length, alphabet)
+
+    result = build_warm_cache(racks, args.output, args.dictionary, args.workers)
+    print(
+        f"Wrote {result['entries']} results to {args.output} in "
+        f"{result['seconds']}s (dictionary version {result['version']})"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,201 @@
+"""Wordle-style solver: filter words by feedback and rank the next guess.
+
+Feedback for a guess is one mark per letter: ``g`` (green, right letter in
+the right place), ``y`` (yellow, in the word elsewhere) or ``b`` (grey, not
+in the word beyond the copies already marked). A guess and its feedback are
+written ``crane:bygbb``, several separated by commas.
+
+Patterns are encoded as base-3 numbers (grey 0, yellow 1, green 2, first
+letter least significant). ``WordleIndex`` scores a guess against every word
+of one length at once: the words are stored column by column with one
+16-bit lane per word, and big-integer arithmetic over those lanes computes
+all the patterns together. Each pattern row is cached, so filtering and
+entropy ranking reuse each other's work.
+"""
+
+import math
+import sys
+import threading
+from array import array
+from collections import Counter, OrderedDict
+from itertools import compress, repeat
+from operator import eq
+from typing import Dict, List, Sequence, Tuple
+
+from admission import checkpoint
+from alphabet import Alphabet
+
+# Feedback marks and their pattern digits
+MARKS = {"b": 0, "y": 1, "g": 2}
+
+# Longest word a pattern still fits in a 16-bit lane for (3**10 < 2**16)
+MAX_LENGTH = 10
+
+# Pattern rows kept per word length
+PATTERN_ROWS = 1024
+
+
+def parse_feedback(spec: str, alphabet: Alphabet) -> List[Tuple[str, int]]:
+    """Parse "crane:bygbb,slate:gbbyb" into (guess, pattern) pairs."""
+    feedback: List[Tuple[str, int]] = []
+    for part in filter(None, (part.strip() for part in spec.split(","))):
+        guess, _, marks = part.partition(":")
+        guess, marks = alphabet.normalize(guess), marks.lower()
+        if not alphabet.spells(guess):
+            raise ValueError(f"Invalid guess {guess!r}")
+        if len(marks) != len(guess) or not set(marks) <= set(MARKS):
+            raise ValueError(
+                f"Invalid feedback {part!r}; expected GUESS:MARKS with one of "
+                "g, y or b per letter"
+            )
+        pattern = sum(MARKS[mark] * 3**i for i, mark in enumerate(marks))
+        feedback.append((guess, pattern))
+    return feedback
+
+
+def score(guess: str, answer: str) -> int:
+    """Return the pattern ``answer`` shows for ``guess``, one pair at a time."""
+    marks = [0] * len(guess)
+    unmatched = Counter(a for g, a in zip(guess, answer) if g != a)
+    for i, (g, a) in enumerate(zip(guess, answer)):
+        if g == a:
+            marks[i] = 2
+        elif unmatched[g]:
+            marks[i] = 1
+            unmatched[g] -= 1
+    return sum(mark * 3**i for i, mark in enumerate(marks))
+
+
+class WordleIndex:
+    """Words of one length with per-position and letter-count lanes.
+
+    For every position and letter there is a lane mask holding 1 for the
+    words with that letter there, and for every letter a lane count of its
+    copies in each word. A guess's pattern against all words is then a
+    handful of additions, comparisons and masks over those integers.
+    """
+
+    def __init__(self, words: Sequence[str], alphabet: Alphabet):
+        if not words:
+            raise ValueError("No words to index")
+        self.words = list(words)
+        self.length = length = len(self.words[0])
+        if length > MAX_LENGTH:
+            raise ValueError(f"Words longer than {MAX_LENGTH} letters")
+        size = len(self.words)
+        self._one = int.from_bytes(b"\x00\x01" * size, "big")
+        self._high = int.from_bytes(b"\x80\x00" * size, "big")
+
+        # Column i holds a big-endian lane per word with its i-th letter code
+        codes = {
+            letter: position + 1 for letter, position in alphabet.positions.items()
+        }
+        columns = [
+            bytes(byte for word in self.words for byte in (0, codes[word[i]]))
+            for i in range(length)
+        ]
+        self._at: Dict[Tuple[int, str], int] = {}
+        self._count: Dict[str, int] = {}
+        for letter, code in codes.items():
+            table = bytearray(256)
+            table[code] = 1
+            count = 0
+            for i, column in enumerate(columns):
+                lanes = int.from_bytes(column.translate(table), "big")
+                self._at[i, letter] = lanes
+                count += lanes
+            self._count[letter] = count
+
+        self._rows: "OrderedDict[str, array]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._opening: List[Tuple[str, float]] = []
+
+    def __len__(self) -> int:
+        return len(self.words)
+
+    def _compute(self, guess: str) -> array:
+        one, high = self._one, self._high
+        greens = [self._at[i, letter] for i, letter in enumerate(guess)]
+        yellows = [0] * self.length
+        for letter in set(guess):
+            positions = [i for i, g in enumerate(guess) if g == letter]
+            # Copies of the letter in each word not already matched in place
+            spare = self._count[letter]
+            for i in positions:
+                spare -= greens[i]
+            # The k-th misplaced copy is yellow while the word has k spare
+            # copies; earlier greens at this letter's positions free one up
+            earlier_greens = 0
+            for k, i in enumerate(positions, 1):
+                enough = ((spare + earlier_greens + high - k * one) & high) >> 15
+                yellows[i] = enough & ~greens[i]
+                earlier_greens += greens[i]
+        lanes = sum(3**i * (2 * greens[i] + yellows[i]) for i in range(self.length))
+        row = array("H")
+        row.frombytes(lanes.to_bytes(2 * len(self.words), "big"))
+        if sys.byteorder == "little":
+            row.byteswap()
+        return row
+
+    def patterns(self, guess: str) -> array:
+        """Return the pattern every indexed word shows for ``guess``."""
+        if len(guess) != self.length:
+            raise ValueError(f"Guess {guess!r} is not {self.length} letters long")
+        with self._lock:
+            row = self._rows.get(guess)
+            if row is not None:
+                self._rows.move_to_end(guess)
+                return row
+        row = self._compute(guess)
+        with self._lock:
+            self._rows[guess] = row
+            if len(self._rows) > PATTERN_ROWS:
+                self._rows.popitem(last=False)
+        return row
+
+    def candidates(self, feedback: Sequence[Tuple[str, int]]) -> List[int]:
+        """Return the ids of the words consistent with every guess."""
+        ids: Sequence[int] = range(len(self.words))
+        for guess, pattern in feedback:
+            row = self.patterns(guess)
+            ids = list(
+                compress(ids, map(eq, map(row.__getitem__, ids), repeat(pattern)))
+            )
+            if not ids:
+                break
+        return list(ids)
+
+    def entropy(self, guess: str, ids: Sequence[int]) -> float:
+        """Expected information, in bits, that ``guess`` gives about ``ids``."""
+        checkpoint()
+        row = self.patterns(guess)
+        if len(ids) == len(self.words):
+            counts = Counter(row)
+        else:
+            counts = Counter(map(row.__getitem__, ids))
+        total = len(ids)
+        return -sum(n / total * math.log2(n / total) for n in counts.values())
+
+    def rank(
+        self, ids: Sequence[int], limit: int = 10, pool: int = 500
+    ) -> List[Tuple[str, float]]:
+        """Rank candidate guesses by the information they are expected to give.
+
+        Guesses come from the remaining candidates; when there are more than
+        ``pool`` of them an evenly spaced sample is scored. The ranking of
+        the opening guess (every word still possible) is computed once.
+        """
+        if len(ids) <= 1:
+            return [(self.words[i], 0.0) for i in ids]
+        opening = len(ids) == len(self.words)
+        if opening and len(self._opening) >= limit:
+            return self._opening[:limit]
+        step = max(1, math.ceil(len(ids) / pool))
+        guesses = [self.words[i] for i in ids[::step]]
+        ranked = sorted(
+            ((guess, self.entropy(guess, ids)) for guess in guesses),
+            key=lambda pair: -pair[1],
+        )
+        if opening:
+            self._opening = ranked
+        return ranked[:limit]
@@ -0,0 +1,124 @@
+import pytest
+import asyncio
+import os
+import sys
+
+# Add the app directory to the path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'app'))
+
+from admission import (
+    AdmissionController,
+    Cancelled,
+    Deadline,
+    DeadlineExceeded,
+    RequestRejected,
+    checkpoint,
+    remaining,
+)
+
+class TestDeadline:
+    """Test request deadlines and cooperative cancellation"""
+    
+    def test_checkpoint_outside_request(self):
+        """Test checkpoints do nothing when no deadline applies"""
+        checkpoint()
+    
+    def test_remaining(self):
+        """Test the time left is only known inside a deadline"""
+        assert remaining() is None
+        left = Deadline(10).run(remaining)
+        assert 9 < left <= 10
+    
+    def test_run_within_deadline(self):
+        """Test work inside the budget runs to completion"""
+        assert Deadline(10).run(lambda x: checkpoint() or x * 2, 21) == 42
+    
+    def test_expired_deadline(self):
+        """Test checkpoints stop work once the deadline has passed"""
+        deadline = Deadline(10)
+        
+        def work():
+            checkpoint()
+            deadline.expires = 0
+            checkpoint()
+            raise AssertionError("checkpoint did not stop the work")
+        
+        with pytest.raises(DeadlineExceeded) as excinfo:
+            deadline.run(work)
+        assert excinfo.value.reason == "deadline"
+        # The deadline only applies inside run()
+        checkpoint()
+    
+    def test_cancelled(self):
+        """Test a cancelled request stops at its next checkpoint"""
+        deadline = Deadline(10)
+        deadline.cancel()
+        with pytest.raises(Cancelled):
+            deadline.run(checkpoint)
+
+class TestAdmissionController:
+    """Test concurrency limits, the bounded queue and load shedding"""
+    
+    def test_queue_and_shed(self):
+        """Test requests beyond the slots wait and beyond the queue are rejected"""
+        async def scenario():
+            admission = AdmissionController(max_active=1, max_queued=1, queue_timeout=5)
+            release = asyncio.Event()
+            order = []
+            
+            async def request(name):
+                async with admission.slot(name):
+                    order.append(name)
+                    await release.wait()
+            
+            first = asyncio.create_task(request("a"))
+            await asyncio.sleep(0)
+            second = asyncio.create_task(request("b"))
+            await asyncio.sleep(0)
+            assert (admission.active, admission.queued) == (1, 1)
+            
+            with pytest.raises(RequestRejected) as excinfo:
+                async with admission.slot("c"):
+                    pass
+            assert excinfo.value.reason == "overloaded"
+            assert excinfo.value.retry_after >= 1
+            
+            release.set()
+            await asyncio.gather(first, second)
+            assert order == ["a", "b"]
+            assert admission.status() == {
+                "active": 0, "queued": 0, "max_active": 1, "max_queued": 1, "rejected": 1
+            }
+        
+        asyncio.run(scenario())
+    
+    def test_queue_timeout(self):
+        """Test a waiter gives up when no slot frees in time"""
+        async def scenario():
+            admission = AdmissionController(max_active=1, max_queued=4, queue_timeout=5)
+            async with admission.slot("a"):
+                with pytest.raises(RequestRejected):
+                    async with admission.slot("b", timeout=0.01):
+                        pass
+                assert admission.queued == 0
+            assert admission.active == 0
+        
+        asyncio.run(scenario())
+    
+    def test_client_limit(self):
+        """Test one client cannot hold more than its share"""
+        async def scenario():
+            admission = AdmissionController(
+                max_active=4, max_queued=4, queue_timeout=5, max_per_client=1
+            )
+            async with admission.slot("a"):
+                with pytest.raises(RequestRejected) as excinfo:
+                    async with admission.slot("a"):
+                        pass
+                assert excinfo.value.reason == "client_limit"
+                async with admission.slot("b"):
+                    pass
+            async with admission.slot("a"):
+                pass
+        
+        asyncio.run(scenario())
@@ -1,12 +1,24 @@
 import pytest
 import os
 import sys
+import threading
+import time
+from unittest.mock import patch
 from fastapi.testclient import TestClient
 
 # Add the app directory to the path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'app'))
 
+from config import Config
+import main
 from main import app
+from profiler import solver_profiler
+
+@pytest.fixture(autouse=True)
+def no_fuzzy_prebuild():
+    """Skip building the fuzzy index in the background for every test client"""
+    with patch.object(main.Config, "FUZZY_PREBUILD", False):
+        yield
 
 class TestAPIEndpoints:
     """Test API endpoint functionality"""
@@ -28,10 +40,17 @@ class TestAPIEndpoints:
         data = response.json()
         
         assert data["status"] == "healthy"
+        assert data["live"] is True
+        assert data["ready"] is True
+        assert data["dictionary_tier"] == "full"
         assert data["dictionary_loaded"] == True
         assert data["dictionary_size"] > 0
         assert "dictionary_info" in data
         assert "configuration" in data
+        assert data["memory"]["pid"] == os.getpid()
+        assert data["memory"]["index_bytes"] > 0
+        assert data["memory"]["index_shared"] is False
+        assert data["memory"]["process"]
         
         # Check configuration structure
         config = data["configuration"]
@@ -205,6 +224,305 @@ class TestAPIEndpoints:
         # Check consistency
         assert len(data["words"]) == data["word_count"]
 
+    def test_solve_word_tiers(self, client):
+        """Test tier annotation and max_tier filtering"""
+        plain = client.get("/solve?letters=bhace").json()
+        annotated = client.get("/solve?letters=bhace&annotate=tier").json()
+        common = client.get("/solve?letters=bhace&max_tier=common").json()
+        
+        assert annotated["words"] == plain["words"]
+        assert "tiers" not in plain
+        assert set(annotated["tiers"]) == set(plain["words"])
+        assert annotated["tiers"]["beach"] == "common"
+        assert annotated["tiers"]["ache"] == "medium"
+        assert common["words"] == [w for w in plain["words"] if annotated["tiers"][w] == "common"]
+        assert client.get("/solve?letters=bhace&max_tier=huge").status_code == 422
+    
+    def test_hooks_endpoint(self, client):
+        """Test plays through one board letter"""
+        response = client.get("/hooks?letters=beach&anchors=s,t@0")
+        
+        assert response.status_code == 200
+        data = response.json()
+        assert data["success"] == True
+        assert "beaches" not in data["words"]
+        assert data["anchors"]["aches"] == ["s"]
+        assert set(data["anchors"]) == set(data["words"])
+        assert all(word.startswith("t") for word, labels in data["anchors"].items()
+                   if "t@0" in labels)
+        
+        assert client.get("/hooks?letters=beach").status_code == 400
+        assert client.get("/hooks?letters=beach&anchors=s@x").status_code == 400
+    
+    def test_grid_endpoint(self, client):
+        """Test finding words on a letter grid"""
+        response = client.get("/grid?board=cat,ore,dog")
+        
+        assert response.status_code == 200
+        data = response.json()
+        assert data["success"] == True
+        assert data["input_letters"] == "cat,ore,dog"
+        assert "cat" in data["words"]
+        assert "dog" in data["words"]
+        # c-a-t-e is not traceable: e is not next to t
+        assert "cate" not in data["words"]
+        
+        assert client.get("/grid?board=cat,or").json()["success"] == False
+        assert client.get("/grid?board=").json()["success"] == False
+        too_big = ",".join(["a" * (Config.MAX_GRID_SIZE + 1)] * 2)
+        assert client.get(f"/grid?board={too_big}").json()["success"] == False
+    
+    def test_wordle_endpoint(self, client):
+        """Test filtering by Wordle feedback and ranking next guesses"""
+        opening = client.get("/wordle?limit=3").json()
+        assert opening["length"] == 5
+        assert len(opening["suggestions"]) == 3
+        
+        # Answer "beach": crane -> yellow, grey, green, grey, yellow
+        data = client.get("/wordle?guesses=crane:ybgby&limit=5").json()
+        assert data["success"] == True
+        assert "beach" in data["candidates"]
+        assert data["candidate_count"] == len(data["candidates"]) < opening["candidate_count"]
+        assert all("r" not in word and "n" not in word for word in data["candidates"])
+        entropies = [s["entropy"] for s in data["suggestions"]]
+        assert entropies == sorted(entropies, reverse=True)
+        
+        assert client.get("/wordle?guesses=crane:bbx").status_code == 400
+        assert client.get("/wordle?guesses=crane:bbbbb&length=6").status_code == 400
+    
+    def test_suggest_endpoint(self, client):
+        """Test typo-tolerant lookup"""
+        data = client.get("/suggest?word=beutiful").json()
+        
+        assert data["success"] == True
+        assert data["found"] is False
+        assert data["suggestions"][0] == {"word": "beautiful", "distance": 1}
+        distances = [s["distance"] for s in data["suggestions"]]
+        assert distances == sorted(distances)
+        
+        exact = client.get("/suggest?word=beach&max_distance=1").json()
+        assert exact["found"] is True
+        assert exact["suggestions"][0] == {"word": "beach", "distance": 0}
+        assert all(s["distance"] <= 1 for s in exact["suggestions"])
+        
+        assert client.get("/suggest?word=123").status_code == 400
+        assert client.get("/suggest?word=beach&max_distance=3").status_code == 422
+    
+    def test_conditional_get(self, client):
+        """Test ETags let clients revalidate results without a re-solve"""
+        response = client.get("/solve?letters=bhace")
+        etag = response.headers["ETag"]
+        assert etag.startswith('"') and etag.endswith('"')
+        assert response.headers["Cache-Control"] == f"public, max-age={Config.HTTP_CACHE_MAX_AGE}"
+        
+        # The cached copy is confirmed before the solver runs
+        with patch.object(main.solver_profiler, "call", side_effect=AssertionError):
+            cached = client.get("/solve?letters=bhace", headers={"If-None-Match": etag})
+        assert cached.status_code == 304
+        assert cached.content == b""
+        assert cached.headers["ETag"] == etag
+        assert cached.headers["X-Dictionary-Type"] == response.headers["X-Dictionary-Type"]
+        weak = client.get("/solve?letters=bhace", headers={"If-None-Match": f'"x", W/{etag}'})
+        assert weak.status_code == 304
+        
+        # Any change to the query or its echoed letters gives a new ETag
+        assert client.get("/solve?letters=hbace").headers["ETag"] != etag
+        assert client.get("/solve?letters=bhace&min_word_length=4").headers["ETag"] != etag
+        assert client.get("/anagrams?letters=bhace").headers["ETag"] != etag
+        stale = client.get("/anagrams?letters=bhace", headers={"If-None-Match": etag})
+        assert stale.status_code == 200
+        assert "beach" in stale.json()["words"]
+        
+        # Invalid input is not cacheable
+        assert "ETag" not in client.get("/solve?letters=123").headers
+    
+    def test_large_results_compressed(self, client):
+        """Test large word lists are gzipped and revalidate by their own ETag"""
+        url = "/solve?letters=abcdefghijklmnop"
+        response = client.get(url, headers={"Accept-Encoding": "gzip"})
+        assert response.headers["Content-Encoding"] == "gzip"
+        assert response.headers["ETag"].endswith('-gzip"')
+        assert response.json()["word_count"] > 1000
+        
+        plain = client.get(url, headers={"Accept-Encoding": "identity"})
+        assert "Content-Encoding" not in plain.headers
+        assert plain.content == response.content
+        assert "Accept-Encoding" in plain.headers["Vary"]
+        
+        etag = response.headers["ETag"]
+        cached = client.get(url, headers={"Accept-Encoding": "gzip", "If-None-Match": etag})
+        assert cached.status_code == 304
+        assert cached.headers["ETag"] == etag
+    
+    def test_overload_shed(self, client):
+        """Test requests are shed with Retry-After once capacity is used up"""
+        from admission import AdmissionController
+        
+        full = AdmissionController(max_active=1, max_queued=0, queue_timeout=1)
+        full.active = 1
+        with patch.object(main, "ADMISSION", full):
+            response = client.get("/solve?letters=overload")
+        assert response.status_code == 503
+        assert int(response.headers["Retry-After"]) >= 1
+        assert response.json()["success"] is False
+        
+        greedy = AdmissionController(max_active=4, max_queued=4, queue_timeout=1, max_per_client=1)
+        greedy._clients["testclient"] = 1
+        with patch.object(main, "ADMISSION", greedy):
+            response = client.get("/anagrams?letters=overload")
+        assert response.status_code == 429
+        assert "Retry-After" in response.headers
+        
+        assert client.get("/health").json()["admission"]["active"] == 0
+    
+    def test_generate_admitted(self, client):
+        """Test puzzle generation goes through admission and its deadline"""
+        from admission import AdmissionController
+        
+        full = AdmissionController(max_active=1, max_queued=0, queue_timeout=1)
+        full.active = 1
+        with patch.object(main, "ADMISSION", full):
+            assert client.get("/generate").status_code == 503
+        
+        # A deadline shorter than the time budget cuts the search short
+        with patch.object(main.Config, "ENDPOINT_DEADLINES_MS", {"generate": 50}):
+            response = client.get("/generate?limit=100&time_budget_ms=10000")
+        assert response.status_code == 200
+        assert response.json()["elapsed_ms"] < 1000
+    
+    def test_deadline_exceeded(self, client):
+        """Test solver work past its deadline is stopped with a 503"""
+        with patch.object(main.Config, "ENDPOINT_DEADLINES_MS", {"grid": -1}):
+            response = client.get("/grid?board=cat,ore,dog")
+            assert response.status_code == 503
+            assert "Retry-After" in response.headers
+            # Other endpoints keep the default budget
+            assert client.get("/solve?letters=bhace").status_code == 200
+    
+    def test_disconnect_cancels_work(self):
+        """Test solver work stops soon after the client goes away"""
+        import asyncio
+        from types import SimpleNamespace
+        from admission import Cancelled, checkpoint
+        
+        async def disconnected():
+            return True
+        
+        def endless():
+            for _ in range(500):
+                checkpoint()
+                time.sleep(0.01)
+            return "finished"
+        
+        request = SimpleNamespace(client=None, is_disconnected=disconnected)
+        started = time.monotonic()
+        with pytest.raises(Cancelled):
+            asyncio.run(main._run_solver(request, "solve", endless))
+        assert time.monotonic() - started < 2
+    
+    def test_request_log(self, client):
+        """Test solver requests are logged as sampled structured records"""
+        import io
+        import json
+        from request_log import RequestLog
+        
+        stream = io.StringIO()
+        log = RequestLog(1.0, stream=stream)
+        log.start()
+        with patch.object(main, "REQUEST_LOG", log):
+            client.get("/solve?letters=bhace")
+            client.get("/solve?letters=bhace")
+            client.get("/anagrams?letters=listen")
+        log.stop()
+        
+        records = [json.loads(line) for line in stream.getvalue().splitlines()]
+        assert [r["endpoint"] for r in records] == ["solve", "solve", "anagrams"]
+        assert records[0]["rack_length"] == 5
+        assert records[0]["results"] == records[1]["results"] > 0
+        assert records[1]["cached"] is True
+        assert records[2]["engine"] == "scowl_large"
+        # The rack itself is never logged
+        assert "bhace" not in stream.getvalue()
+    
+    def test_ladder_endpoint(self, client):
+        """Test shortest word ladders and their search limits"""
+        data = client.get("/ladder?start=cold&end=warm").json()
+        
+        assert data["success"] == True
+        assert data["found"] is True
+        assert data["status"] == "found"
+        assert data["path"][0] == "cold" and data["path"][-1] == "warm"
+        assert data["steps"] == len(data["path"]) - 1
+        
+        with patch.object(main.Config, "LADDER_MAX_NODES", 1):
+            limited = client.get("/ladder?start=cold&end=warm").json()
+        assert limited["found"] is False
+        assert limited["status"] == "node_limit"
+        assert limited["steps"] is None
+        
+        assert client.get("/ladder?start=cold&end=beach").status_code == 400
+        assert client.get("/ladder?start=cold").status_code == 400
+    
+    def test_fuzzy_index_prebuilt_at_load(self):
+        """Test the fuzzy index is built in the background after loading"""
+        os.chdir(os.path.join(os.path.dirname(__file__), '..', 'app'))
+        with patch.object(main.Config, "FUZZY_PREBUILD", True):
+            with TestClient(app):
+                engine = main.ENGINE
+                for _ in range(300):
+                    if engine._fuzzy is not None:
+                        break
+                    time.sleep(0.1)
+                assert engine._fuzzy is not None
+    
+    def test_complete_endpoint(self, client):
+        """Test prefix suggestions limited to the rack"""
+        response = client.get("/complete?prefix=ca&letters=castle&limit=3")
+        
+        assert response.status_code == 200
+        data = response.json()
+        assert data["success"] == True
+        assert data["prefix"] == "ca"
+        assert data["input_letters"] == "castle"
+        assert 0 < data["word_count"] <= 3
+        assert all(word.startswith("ca") for word in data["words"])
+        assert data["words"] == sorted(data["words"], key=lambda w: (len(w), w))
+        
+        assert client.get("/complete?prefix=zz&letters=castle").json()["words"] == []
+        assert client.get("/complete?prefix=ca").json()["success"] == False
+        assert client.get("/complete?prefix=ca&letters=cat&limit=0").status_code == 422
+    
+    def test_check_endpoint(self, client):
+        """Test checking many words in one request"""
+        response = client.post("/check", json={"words": ["beach", "Cat", "xqzv", "aaa"]})
+        
+        assert response.status_code == 200
+        data = response.json()
+        assert [r["word"] for r in data["results"]] == ["beach", "cat", "xqzv", "aaa"]
+        assert [r["valid"] for r in data["results"]][:3] == [True, True, False]
+        assert data["results"][3]["playable"] is False
+        assert data["count"] == 4
+        assert data["valid_count"] == sum(r["valid"] for r in data["results"])
+        assert data["dictionary_type"] == response.headers["X-Dictionary-Type"]
+        
+        too_many = ["cat"] * (Config.MAX_CHECK_WORDS + 1)
+        assert client.post("/check", json={"words": too_many}).status_code == 422
+        assert client.post("/check", json={"words": ["cat"], "min_word_length": 0}).status_code == 422
+    
+    def test_generate_endpoint(self, client):
+        """Test puzzle generation within a time budget"""
+        response = client.get("/generate?min_words=6&max_words=12&limit=3&time_budget_ms=2000")
+        
+        assert response.status_code == 200
+        data = response.json()
+        assert data["success"] == True
+        assert len(data["puzzles"]) == 3
+        for puzzle in data["puzzles"]:
+            assert 6 <= puzzle["word_count"] <= 12
+            assert len(puzzle["pangrams"]) == 1
+        
+        assert client.get("/generate?lengths=bogus").status_code == 400
+
 class TestPerformance:
     """Test API performance with various loads"""
     
@@ -228,6 +546,25 @@ class TestPerformance:
         # Just verify it returns a result
         assert data["word_count"] >= 0
     
+    def test_solve_performance_max_letters(self, client):
+        """Test worst-case latency for long racks at a raised letter limit"""
+        import time
+        from benchmark import worst_case_rack
+        
+        rack = worst_case_rack(sorted(main.ENGINE.snapshot.words), 60)
+        assert client.get(f"/solve?letters={rack}").json()["success"] == False
+        
+        with patch.object(Config, 'MAX_LETTERS', 60):
+            started = time.perf_counter()
+            response = client.get(f"/solve?letters={rack}&min_word_length=3")
+            elapsed = time.perf_counter() - started
+        
+        data = response.json()
+        assert data["success"] == True
+        assert data["word_count"] > 50000
+        # Solving is bounded by dictionary size; generous margin for slow CI
+        assert elapsed < 2.0
+    
     def test_solve_performance_short_words(self, client):
         """Test performance with minimum length requirements"""
         response = client.get("/solve?letters=programming&min_word_length=2")
@@ -283,4 +620,464 @@ class TestCoverage:
         # But good words should appear
         good_words = ["ace", "cab", "each", "beach"]
         found_good_words = [word for word in good_words if word in words]
-        assert len(found_good_words) > 0, "No good words found in results" 
\ No newline at end of file
+        assert len(found_good_words) > 0, "No good words found in results" 
+
+class TestAdminProfiling:
+    """Test the admin-only profiling endpoints"""
+    
+    @pytest.fixture
+    def client(self):
+        """Create test client with an admin token configured"""
+        os.chdir(os.path.join(os.path.dirname(__file__), '..', 'app'))
+        with patch.object(Config, 'ADMIN_TOKEN', 'test-token'):
+            with TestClient(app) as test_client:
+                yield test_client
+        solver_profiler.reset()
+    
+    def test_admin_endpoints_hidden_without_token(self):
+        """Test admin endpoints are disabled when no token is configured"""
+        os.chdir(os.path.join(os.path.dirname(__file__), '..', 'app'))
+        with patch.object(Config, 'ADMIN_TOKEN', ''):
+            with TestClient(app) as client:
+                response = client.get("/admin/profile")
+                assert response.status_code == 404
+    
+    def test_admin_endpoints_require_token(self, client):
+        """Test admin endpoints reject missing or wrong tokens"""
+        assert client.get("/admin/profile").status_code == 403
+        response = client.get("/admin/profile", headers={"X-Admin-Token": "wrong"})
+        assert response.status_code == 403
+    
+    def test_profile_next_requests(self, client):
+        """Test arming the profiler and reading back aggregated stats"""
+        headers = {"X-Admin-Token": "test-token"}
+        response = client.post("/admin/profile?requests=1", headers=headers)
+        assert response.status_code == 200
+        assert response.json()["active"] is True
+        
+        # Use a rack no other test solves so the result cache cannot answer it
+        client.get("/solve?letters=profilers")
+        client.get("/solve?letters=profiling")
+        
+        response = client.get("/admin/profile", headers=headers)
+        assert response.status_code == 200
+        data = response.json()
+        assert data["status"]["profiled_calls"] == 1
+        assert data["status"]["active"] is False
+        assert "find_valid_words" in data["stats"]
+        
+        response = client.delete("/admin/profile", headers=headers)
+        assert response.json()["profiled_calls"] == 0
+    
+    def test_profile_requires_budget(self, client):
+        """Test arming without requests or sample rate is rejected"""
+        response = client.post("/admin/profile", headers={"X-Admin-Token": "test-token"})
+        assert response.status_code == 400
+
+
+class TestDictionaryReload:
+    """Test zero-downtime dictionary reloads"""
+    
+    HEADERS = {"X-Admin-Token": "test-token"}
+    
+    @pytest.fixture
+    def client(self):
+        """Create test client with an admin token configured"""
+        os.chdir(os.path.join(os.path.dirname(__file__), '..', 'app'))
+        with patch.object(Config, 'ADMIN_TOKEN', 'test-token'):
+            with TestClient(app) as test_client:
+                yield test_client
+    
+    def test_reload_requires_admin(self, client):
+        """Test that reloads are admin-only"""
+        assert client.post("/admin/reload").status_code == 403
+    
+    def test_reload_switches_dictionary(self, client):
+        """Test that a reload swaps in the new dictionary and version"""
+        before = client.get("/health").json()
+        assert "ache" in client.get("/solve?letters=bhace").json()["words"]
+        
+        response = client.post("/admin/reload?dictionary=google_10k", headers=self.HEADERS)
+        assert response.status_code == 202
+        assert response.json()["current_version"] == before["dictionary_version"]
+        
+        # Background tasks complete before the test client returns
+        status = client.get("/admin/reload", headers=self.HEADERS).json()
+        assert status["state"] == "idle"
+        assert status["error"] is None
+        
+        after = client.get("/health").json()
+        assert after["dictionary_info"]["type"] == "google_10k"
+        assert after["dictionary_version"] != before["dictionary_version"]
+        assert status["current_version"] == after["dictionary_version"]
+        
+        # Cached results from the old dictionary must not be served
+        assert "ache" not in client.get("/solve?letters=bhace").json()["words"]
+        
+        client.post("/admin/reload?dictionary=scowl_large", headers=self.HEADERS)
+        assert client.get("/health").json()["dictionary_version"] == before["dictionary_version"]
+        assert "ache" in client.get("/solve?letters=bhace").json()["words"]
+    
+    def test_reload_keeps_current_type_by_default(self, client):
+        """Test that a plain reload rebuilds the active dictionary"""
+        before = client.get("/health").json()
+        response = client.post("/admin/reload", headers=self.HEADERS)
+        assert response.json()["dictionary_type"] == before["dictionary_info"]["config"]["type"]
+        assert client.get("/health").json()["dictionary_version"] == before["dictionary_version"]
+    
+    def test_invalid_dictionary_type(self, client):
+        """Test that unknown dictionary types are rejected"""
+        response = client.post("/admin/reload?dictionary=klingon", headers=self.HEADERS)
+        assert response.status_code == 422
+
+
+class TestWordEdits:
+    """Test the incremental word add/remove endpoints"""
+    
+    HEADERS = {"X-Admin-Token": "test-token"}
+    
+    @pytest.fixture
+    def client(self, tmp_path):
+        """Create test client with an admin token and overlay file configured"""
+        os.chdir(os.path.join(os.path.dirname(__file__), '..', 'app'))
+        overlay = str(tmp_path / "overlay.txt")
+        with patch.object(Config, 'ADMIN_TOKEN', 'test-token'), \
+                patch.object(Config, 'OVERLAY_FILE', overlay):
+            with TestClient(app) as test_client:
+                yield test_client
+    
+    def test_edits_require_admin(self, client):
+        """Test that word edits are admin-only"""
+        assert client.put("/admin/words/zzyzx").status_code == 403
+        assert client.delete("/admin/words/beach").status_code == 403
+    
+    def test_add_and_remove_word(self, client):
+        """Test that edits take effect immediately and persist across reloads"""
+        before = client.get("/solve?letters=bhace")
+        assert "beach" in before.json()["words"]
+        unrelated = client.get("/solve?letters=grindk").json()["words"]
+        
+        response = client.delete("/admin/words/Beach", headers=self.HEADERS)
+        assert response.status_code == 200
+        data = response.json()
+        assert data["word"] == "beach"
+        assert data["changed"] is True
+        assert data["in_dictionary"] is False
+        assert data["invalidated_results"] >= 1
+        assert "beach" not in client.get("/solve?letters=bhace").json()["words"]
+        assert client.get("/solve?letters=grindk").json()["words"] == unrelated
+        # Copies cached by clients before the edit are no longer current
+        revalidated = client.get(
+            "/solve?letters=bhace", headers={"If-None-Match": before.headers["ETag"]}
+        )
+        assert revalidated.status_code == 200
+        
+        response = client.put("/admin/words/zzyzx", headers=self.HEADERS)
+        assert response.json()["in_dictionary"] is True
+        assert "zzyzx" in client.get("/anagrams?letters=xyzzz").json()["words"]
+        
+        edits = client.get("/admin/words", headers=self.HEADERS).json()
+        assert edits["added"] == ["zzyzx"]
+        assert edits["removed"] == ["beach"]
+        assert client.get("/health").json()["dictionary_revision"] == 2
+        
+        # The overlay file is applied again when the dictionary is rebuilt
+        client.post("/admin/reload", headers=self.HEADERS)
+        assert "beach" not in client.get("/solve?letters=bhace").json()["words"]
+        assert "zzyzx" in client.get("/solve?letters=zzyzx").json()["words"]
+    
+    def test_inflight_solve_cannot_restore_removed_word(self, client):
+        """Test results computed on the old word list are not served after an edit"""
+        cache = main.ResultCache()
+        with patch.object(main, 'RESULT_CACHE', cache):
+            client.get("/solve?letters=grindk")
+            before = main.ENGINE.snapshot
+            client.delete("/admin/words/beach", headers=self.HEADERS)
+            # A solve that started before the edit stores its result afterwards
+            cache.set(
+                main.ResultCache.make_key(before.content_version, "solve", "bhace", 3),
+                ["beach"],
+            )
+            
+            assert "beach" not in client.get("/solve?letters=bhace").json()["words"]
+            hits = cache.stats()["hits"]
+            client.get("/solve?letters=grindk")
+            # Unaffected results carry over to the edited list
+            assert cache.stats()["hits"] == hits + 1
+    
+    def test_noop_edit(self, client):
+        """Test that adding an existing word changes nothing"""
+        response = client.put("/admin/words/beach", headers=self.HEADERS)
+        assert response.json()["changed"] is False
+        assert response.json()["invalidated_results"] == 0
+    
+    def test_invalid_word(self, client):
+        """Test that non-alphabetic words are rejected"""
+        response = client.put("/admin/words/a1", headers=self.HEADERS)
+        assert response.status_code == 400
+        assert "alphabet" in response.json()["detail"]
+        response = client.put("/admin/words/a", headers=self.HEADERS)
+        assert "at least 2 letters" in response.json()["detail"]
+    
+    def test_edits_share_one_fuzzy_builder(self, client):
+        """Test a burst of edits runs one background fuzzy build, then updates it"""
+        with patch.object(main.Config, "FUZZY_PREBUILD", True):
+            for word in ["zzyzx", "qwxyz", "xyzzq"]:
+                client.put(f"/admin/words/{word}", headers=self.HEADERS)
+                builders = [t for t in threading.enumerate() if t.name == "fuzzy-index"]
+                assert len(builders) <= 1
+            builder = main._fuzzy_builder
+            if builder is not None:
+                builder.join(60)
+            assert main.ENGINE.has_fuzzy_index
+            
+            # Later edits update the built index instead of starting a build
+            client.delete("/admin/words/zzyzx", headers=self.HEADERS)
+            assert main.ENGINE.has_fuzzy_index
+            assert main._fuzzy_builder is None
+        suggestions = client.get("/suggest?word=qwxyy&max_distance=1").json()
+        assert suggestions["suggestions"] == [{"word": "qwxyz", "distance": 1}]
+    
+    def test_remove_listed_word_outside_alphabet(self, client):
+        """Test dictionary entries with an apostrophe can still be removed"""
+        assert "a's" in main.ENGINE.snapshot.words
+        response = client.delete("/admin/words/A's", headers=self.HEADERS)
+        assert response.status_code == 200
+        assert response.json()["changed"] is True
+        assert "a's" not in main.ENGINE.snapshot.words
+        assert client.put("/admin/words/o'er", headers=self.HEADERS).status_code == 400
+
+
+class TestFastStart:
+    """Test serving from a small dictionary while the full one loads"""
+    
+    @pytest.fixture
+    def gate(self):
+        """Hold the background load of the full dictionary until released"""
+        import threading
+        
+        gate = threading.Event()
+        real_load_snapshot = main.load_snapshot
+        
+        def gated_load_snapshot(config_type=None, tier="full"):
+            if tier == "full":
+                gate.wait(timeout=30)
+            return real_load_snapshot(config_type, tier)
+        
+        with patch.object(main, 'load_snapshot', side_effect=gated_load_snapshot):
+            yield gate
+        gate.set()
+    
+    @pytest.fixture
+    def client(self, gate):
+        """Create test client with fast start enabled"""
+        os.chdir(os.path.join(os.path.dirname(__file__), '..', 'app'))
+        with patch.object(Config, 'FAST_START', True):
+            with TestClient(app) as test_client:
+                yield test_client
+            gate.set()
+    
+    def wait_until_ready(self, client, timeout=30):
+        import time
+        
+        deadline = time.time() + timeout
+        while time.time() < deadline:
+            if client.get("/health/ready").status_code == 200:
+                return True
+            time.sleep(0.05)
+        return False
+    
+    def test_serves_fast_tier_until_full_dictionary_loads(self, client, gate):
+        """Test tiered serving and separate liveness/readiness states"""
+        assert client.get("/health/live").status_code == 200
+        response = client.get("/health/ready")
+        assert response.status_code == 503
+        assert response.json()["dictionary_tier"] == "fast"
+        
+        health = client.get("/health").json()
+        assert health["live"] is True
+        assert health["ready"] is False
+        assert health["dictionary_info"]["type"] == "google_10k"
+        
+        # The small dictionary answers immediately and says so
+        response = client.get("/solve?letters=bhace")
+        assert response.status_code == 200
+        assert response.headers["X-Dictionary-Tier"] == "fast"
+        assert response.headers["X-Dictionary-Type"] == "google_10k"
+        assert "beach" in response.json()["words"]
+        assert "ache" not in response.json()["words"]
+        
+        # Edits to the stand-in would be lost when the full dictionary loads
+        with patch.object(Config, 'ADMIN_TOKEN', 'test-token'):
+            response = client.put("/admin/words/zzyzx", headers={"X-Admin-Token": "test-token"})
+        assert response.status_code == 503
+        
+        gate.set()
+        assert self.wait_until_ready(client)
+        
+        response = client.get("/solve?letters=bhace")
+        assert response.headers["X-Dictionary-Tier"] == "full"
+        assert response.headers["X-Dictionary-Type"] == "scowl_large"
+        assert "ache" in response.json()["words"]
+        assert client.get("/health").json()["ready"] is True
+
+class TestSharedIndexWorkers:
+    """Test attaching to a shared index file instead of building in-process"""
+    
+    @pytest.fixture
+    def client(self, tmp_path):
+        """Create test client using a shared index file"""
+        os.chdir(os.path.join(os.path.dirname(__file__), '..', 'app'))
+        path = str(tmp_path / "wordmixr.idx")
+        with patch.object(Config, 'SHARED_INDEX_PATH', path):
+            with TestClient(app) as test_client:
+                yield test_client
+    
+    def test_serves_from_shared_index(self, client, tmp_path):
+        """Test the app builds the file, maps it and reports it on /health"""
+        assert (tmp_path / "wordmixr.idx").exists()
+        
+        health = client.get("/health").json()
+        assert health["ready"] is True
+        assert health["memory"]["index_shared"] is True
+        assert health["dictionary_info"]["shared_index"] == str(tmp_path / "wordmixr.idx")
+        
+        response = client.get("/solve?letters=dgirnk")
+        assert "gird" in response.json()["words"]
+        assert "grind" in response.json()["words"]
+
+class TestPersistentResultCache:
+    """Test serving results through a persistent cache backend"""
+    
+    @pytest.fixture
+    def client(self, tmp_path):
+        """Create test client with a SQLite result cache"""
+        from cache import SQLiteResultCache
+        
+        os.chdir(os.path.join(os.path.dirname(__file__), '..', 'app'))
+        cache = SQLiteResultCache(str(tmp_path / "cache.sqlite3"), ttl=60)
+        with patch.object(main, 'RESULT_CACHE', cache):
+            with TestClient(app) as test_client:
+                yield test_client
+        cache.close()
+    
+    def test_repeat_requests_hit_cache(self, client):
+        """Test the second request for a rack is answered from the cache"""
+        first = client.get("/solve?letters=bhace").json()
+        second = client.get("/solve?letters=ehcab").json()
+        
+        assert second["words"] == first["words"]
+        stats = client.get("/health").json()["result_cache"]
+        assert stats["backend"] == "sqlite"
+        assert stats["hits"] == 1
+        assert stats["size"] == 1
+    
+    def test_startup_and_reload_keep_shared_results(self, tmp_path):
+        """Test results of other versions in a shared cache are left to expire"""
+        from cache import ResultCache, SQLiteResultCache
+        
+        os.chdir(os.path.join(os.path.dirname(__file__), '..', 'app'))
+        cache = SQLiteResultCache(str(tmp_path / "shared.sqlite3"), ttl=60)
+        other = ResultCache.make_key("other-worker", "solve", "bhace", 3)
+        cache.set(other, ["ache"])
+        with patch.object(main, 'RESULT_CACHE', cache), \
+                patch.object(Config, 'ADMIN_TOKEN', 'test-token'):
+            with TestClient(app) as client:
+                client.post("/admin/reload", headers={"X-Admin-Token": "test-token"})
+                assert cache.get(other) == ["ache"]
+        cache.close()
+    
+    def test_in_process_cache_purged_on_reload(self):
+        """Test the in-process cache drops results of replaced versions"""
+        from cache import ResultCache
+        
+        os.chdir(os.path.join(os.path.dirname(__file__), '..', 'app'))
+        cache = ResultCache()
+        stale = ResultCache.make_key("replaced", "solve", "bhace", 3)
+        with patch.object(main, 'RESULT_CACHE', cache), \
+                patch.object(Config, 'ADMIN_TOKEN', 'test-token'):
+            with TestClient(app) as client:
+                cache.set(stale, ["ache"])
+                client.post("/admin/reload", headers={"X-Admin-Token": "test-token"})
+                assert cache.get(stale) is None
+
+class TestWarmCache:
+    """Test loading a warm-cache artifact at startup"""
+    
+    @pytest.fixture
+    def client(self, tmp_path):
+        """Create test client with a warm cache built for the test rack"""
+        from warmer import build_warm_cache, parse_level_pack
+        
+        os.chdir(os.path.join(os.path.dirname(__file__), '..', 'app'))
+        output = str(tmp_path / "warm.jsonl.gz")
+        build_warm_cache(parse_level_pack(["warmed"]), output, workers=1)
+        with patch.object(Config, 'WARM_CACHE_PATH', output):
+            with TestClient(app) as test_client:
+                yield test_client
+    
+    def test_first_request_is_a_cache_hit(self, client):
+        """Test the warmed rack is served from the cache on first request"""
+        hits = client.get("/health").json()["result_cache"]["hits"]
+        response = client.get("/solve?letters=demraw")
+        
+        assert "warmed" in response.json()["words"]
+        assert client.get("/health").json()["result_cache"]["hits"] == hits + 1
+
+class TestResidentDictionaries:
+    """Test serving several resident dictionaries from one process"""
+    
+    @pytest.fixture
+    def client(self):
+        """Create test client with Google 10k resident next to the default"""
+        os.chdir(os.path.join(os.path.dirname(__file__), '..', 'app'))
+        resident = [main.DictionaryType.GOOGLE_10K]
+        with patch.object(main.Config, 'RESIDENT_DICTIONARIES', resident):
+            with TestClient(app) as test_client:
+                yield test_client
+    
+    def test_select_dictionary_per_request(self, client):
+        """Test the dictionary parameter picks the resident dictionary"""
+        default = client.get("/solve?letters=bhace")
+        easy = client.get("/solve?letters=bhace&dictionary=google_10k")
+        hard = client.get("/solve?letters=bhace&dictionary=scowl_large")
+        
+        assert "ache" in default.json()["words"]
+        assert "ache" not in easy.json()["words"]
+        assert "beach" in easy.json()["words"]
+        assert hard.json()["words"] == default.json()["words"]
+        assert easy.headers["X-Dictionary-Type"] == "google_10k"
+        assert hard.headers["X-Dictionary-Type"] == "scowl_large"
+        
+        anagrams = client.get("/anagrams?letters=tca&dictionary=google_10k")
+        assert "cat" in anagrams.json()["words"]
+    
+    def test_unknown_or_unloaded_dictionary(self, client):
+        """Test dictionaries that are not resident are rejected"""
+        response = client.get("/solve?letters=bhace&dictionary=scowl_medium")
+        assert response.status_code == 400
+        assert "google_10k" in response.json()["detail"]
+        assert client.get("/solve?letters=bhace&dictionary=klingon").status_code == 422
+    
+    def test_health_reports_each_dictionary(self, client):
+        """Test per-dictionary memory and word sharing on /health"""
+        data = client.get("/health").json()
+        dictionaries = data["memory"]["dictionaries"]
+        
+        assert data["configuration"]["resident_dictionaries"] == ["scowl_large", "google_10k"]
+        assert set(dictionaries) == {"scowl_large", "google_10k"}
+        assert dictionaries["scowl_large"]["shared_words"] == 0
+        assert dictionaries["google_10k"]["index_bytes"] > 0
+        # Most Google 10k words are also SCOWL words and share their strings
+        assert dictionaries["google_10k"]["shared_words"] > dictionaries["google_10k"]["words"] // 2
+    
+    def test_auto_dictionary_answers_to_resolved_type(self):
+        """Test "auto" serves requests naming the dictionary type it picked"""
+        os.chdir(os.path.join(os.path.dirname(__file__), '..', 'app'))
+        with patch.object(main.Config, 'DICTIONARY_TYPE', main.DictionaryType.AUTO):
+            with TestClient(app) as client:
+                response = client.get("/solve?letters=bhace&dictionary=scowl_large")
+                assert response.status_code == 200
+                assert "ache" in response.json()["words"]
+                resident = client.get("/health").json()["configuration"]["resident_dictionaries"]
+                assert resident == ["scowl_large"]
@@ -0,0 +1,70 @@
+import pytest
+import csv
+import io
+import json
+import os
+import sys
+
+# Add the app directory to the path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'app'))
+
+from bulk import ProgressReporter, bulk_solve, main, write_results
+from config import DictionaryType
+from solver import find_valid_words, load_snapshot
+
+class TestBulkSolver:
+    """Test the command-line bulk solver"""
+    
+    @pytest.fixture(autouse=True)
+    def app_dir(self):
+        """Change to app directory for dictionary file access"""
+        os.chdir(os.path.join(os.path.dirname(__file__), '..', 'app'))
+    
+    def test_results_in_input_order(self):
+        """Test results come back in input order across chunks and workers"""
+        racks = ["bhace", "tac", "123", "dgirnk", "stop"] * 20
+        results = list(bulk_solve((rack + "\n" for rack in racks), config_type=DictionaryType.GOOGLE_10K,
+                                  workers=2, chunk_size=3))
+        
+        snapshot = load_snapshot(DictionaryType.GOOGLE_10K)
+        assert len(results) == len(racks)
+        for rack, result in zip(racks, results):
+            if rack == "123":
+                assert result["success"] is False
+                continue
+            assert result["input_letters"] == rack
+            assert result["words"] == find_valid_words(rack, snapshot.index, 3, snapshot.dictionary_type)
+    
+    def test_anagram_mode(self):
+        """Test anagram mode uses every letter"""
+        results = list(bulk_solve(["tac"], mode="anagrams", config_type=DictionaryType.GOOGLE_10K, workers=1))
+        assert results[0]["words"] == ["act", "cat"]
+    
+    def test_csv_output_and_progress(self):
+        """Test CSV rows and the throughput report"""
+        results = [
+            {"success": True, "input_letters": "tac", "word_count": 2, "words": ["act", "cat"]},
+            {"success": False, "errors": ["No valid letters found in input"], "words": []},
+        ]
+        output, errors = io.StringIO(), io.StringIO()
+        progress = ProgressReporter(errors, interval=0)
+        write_results(results, output, "csv", progress)
+        progress.report(final=True)
+        
+        rows = list(csv.reader(io.StringIO(output.getvalue())))
+        assert rows[0] == ["letters", "word_count", "words", "errors"]
+        assert rows[1] == ["tac", "2", "act cat", ""]
+        assert rows[2] == ["", "0", "", "No valid letters found in input"]
+        assert errors.getvalue().startswith("Solved 2 racks (1 invalid)")
+    
+    def test_cli_with_files(self, tmp_path):
+        """Test the CLI reads a rack file and writes JSON lines"""
+        racks = tmp_path / "racks.txt"
+        racks.write_text("bhace\ntac\n")
+        output = tmp_path / "results.jsonl"
+        
+        assert main([str(racks), "--output", str(output), "--dictionary", "google_10k",
+                     "--workers", "1"]) == 0
+        lines = [json.loads(line) for line in output.read_text().splitlines()]
+        assert [line["input_letters"] for line in lines] == ["bhace", "tac"]
+        assert "beach" in lines[0]["words"]
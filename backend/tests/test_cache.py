@@ -0,0 +1,273 @@
+import pytest
+import os
+import socketserver
+import sys
+import threading
+import time
+
+# Add the app directory to the path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'app'))
+
+from cache import (
+    RedisResultCache,
+    ResultCache,
+    SQLiteResultCache,
+    create_result_cache,
+    decode_words,
+    encode_words,
+)
+
+class TestResultCache:
+    """Test the in-process solver result cache"""
+    
+    def test_key_ignores_letter_order(self):
+        """Test that permutations of the same rack share a cache key"""
+        assert ResultCache.make_key("v1", "solve", "bhace", 3) == \
+            ResultCache.make_key("v1", "solve", "beach", 3)
+        assert ResultCache.make_key("v1", "solve", "bhace", 3) != \
+            ResultCache.make_key("v2", "solve", "bhace", 3)
+        assert ResultCache.make_key("v1", "solve", "bhace", 3) != \
+            ResultCache.make_key("v1", "anagrams", "bhace", 3)
+    
+    def test_get_and_set(self):
+        """Test basic hits and misses"""
+        cache = ResultCache(maxsize=10)
+        key = ResultCache.make_key("v1", "solve", "tac", 3)
+        
+        assert cache.get(key) is None
+        cache.set(key, ["act", "cat"])
+        assert cache.get(key) == ["act", "cat"]
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 1
+    
+    def test_lru_eviction(self):
+        """Test that the least recently used entry is evicted first"""
+        cache = ResultCache(maxsize=2)
+        keys = [ResultCache.make_key("v1", "solve", letters, 3) for letters in ("ab", "cd", "ef")]
+        
+        cache.set(keys[0], ["a"])
+        cache.set(keys[1], ["b"])
+        cache.get(keys[0])
+        cache.set(keys[2], ["c"])
+        
+        assert cache.get(keys[0]) == ["a"]
+        assert cache.get(keys[1]) is None
+        assert cache.get(keys[2]) == ["c"]
+    
+    def test_purge_drops_other_versions(self):
+        """Test that purging keeps only entries for the current version"""
+        cache = ResultCache()
+        old_key = ResultCache.make_key("old", "solve", "tac", 3)
+        new_key = ResultCache.make_key("new", "solve", "tac", 3)
+        cache.set(old_key, ["cat"])
+        cache.set(new_key, ["act"])
+        
+        assert cache.purge(keep_version="new") == 1
+        assert cache.get(old_key) is None
+        assert cache.get(new_key) == ["act"]
+    
+    def test_disabled_cache(self):
+        """Test that a zero-size cache stores nothing"""
+        cache = ResultCache(maxsize=0)
+        key = ResultCache.make_key("v1", "solve", "tac", 3)
+        cache.set(key, ["cat"])
+        assert cache.get(key) is None
+    
+    def test_invalidate_word_only_drops_affected_entries(self):
+        """Test that a word edit only invalidates results it can appear in"""
+        cache = ResultCache()
+        solve_hit = ResultCache.make_key("v1", "solve", "bhace", 3)
+        solve_short = ResultCache.make_key("v1", "solve", "bhace", 6)
+        solve_miss = ResultCache.make_key("v1", "solve", "grindk", 3)
+        anagram_hit = ResultCache.make_key("v1", "anagrams", "beach", 3)
+        anagram_miss = ResultCache.make_key("v1", "anagrams", "bhacet", 3)
+        other_version = ResultCache.make_key("v0", "solve", "bhace", 3)
+        for key in (solve_hit, solve_short, solve_miss, anagram_hit, anagram_miss, other_version):
+            cache.set(key, ["x"])
+        
+        assert cache.invalidate_word("v1", "beach") == 2
+        assert cache.get(solve_hit) is None
+        assert cache.get(anagram_hit) is None
+        for key in (solve_short, solve_miss, anagram_miss, other_version):
+            assert cache.get(key) == ["x"]
+
+class FakeRedisHandler(socketserver.StreamRequestHandler):
+    """Serve the handful of Redis commands the cache uses from a dict"""
+    
+    def read_command(self):
+        line = self.rfile.readline()
+        if not line:
+            return None
+        args = []
+        for _ in range(int(line[1:])):
+            length = int(self.rfile.readline()[1:])
+            args.append(self.rfile.read(length + 2)[:-2])
+        return args
+    
+    def bulk(self, value):
+        if value is None:
+            return b"$-1\r\n"
+        return b"$%d\r\n%s\r\n" % (len(value), value)
+    
+    def handle(self):
+        store = self.server.store
+        while True:
+            args = self.read_command()
+            if args is None:
+                return
+            command = args[0].upper()
+            now = time.time()
+            for key in [k for k, (_, expires) in store.items() if expires and expires <= now]:
+                del store[key]
+            if command == b"GET":
+                entry = store.get(args[1])
+                reply = self.bulk(entry[0] if entry else None)
+            elif command == b"SET":
+                expires = now + int(args[4]) / 1000 if len(args) > 3 else 0
+                store[args[1]] = (args[2], expires)
+                reply = b"+OK\r\n"
+            elif command == b"DEL":
+                deleted = sum(store.pop(key, None) is not None for key in args[1:])
+                reply = b":%d\r\n" % deleted
+            elif command == b"SCAN":
+                prefix = args[3].rstrip(b"*")
+                keys = [key for key in store if key.startswith(prefix)]
+                reply = b"*2\r\n" + self.bulk(b"0") + b"*%d\r\n" % len(keys) + \
+                    b"".join(self.bulk(key) for key in keys)
+            else:
+                reply = b"-ERR unknown command\r\n"
+            self.wfile.write(reply)
+
+@pytest.fixture
+def redis_url():
+    """Run a local stand-in Redis server for the duration of a test"""
+    server = socketserver.ThreadingTCPServer(("127.0.0.1", 0), FakeRedisHandler)
+    server.daemon_threads = True
+    server.store = {}
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"redis://127.0.0.1:{server.server_address[1]}/0"
+    server.shutdown()
+    server.server_close()
+
+@pytest.fixture(params=["memory", "sqlite", "redis"])
+def backend(request, tmp_path):
+    """Create each result cache backend"""
+    if request.param == "redis":
+        url = request.getfixturevalue("redis_url")
+    else:
+        url = ""
+    cache = create_result_cache(request.param, path=str(tmp_path / "cache.sqlite3"), url=url)
+    yield cache
+    cache.close()
+
+class TestCacheBackends:
+    """Test behaviour shared by every result cache backend"""
+    
+    def test_round_trip(self, backend):
+        """Test results come back exactly as stored, including empty ones"""
+        key = ResultCache.make_key("v1", "solve", "bhace", 3)
+        empty = ResultCache.make_key("v1", "solve", "zzz", 3)
+        
+        assert backend.get(key) is None
+        backend.set(key, ["ace", "ache", "each", "beach"])
+        backend.set(empty, [])
+        
+        assert backend.get(key) == ["ace", "ache", "each", "beach"]
+        assert backend.get(empty) == []
+        assert backend.stats()["backend"] == backend.name
+        assert backend.stats()["hits"] == 2
+        assert backend.stats()["misses"] == 1
+    
+    def test_purge_and_invalidate(self, backend):
+        """Test version purges and word invalidation"""
+        old_key = ResultCache.make_key("old", "solve", "tac", 3)
+        hit = ResultCache.make_key("new", "solve", "bhace", 3)
+        miss = ResultCache.make_key("new", "anagrams", "tac", 3)
+        for key in (old_key, hit, miss):
+            backend.set(key, ["x"])
+        
+        assert backend.purge(keep_version="new") == 1
+        assert backend.get(old_key) is None
+        assert backend.invalidate_word("new", "beach") == 1
+        assert backend.get(hit) is None
+        assert backend.get(miss) == ["x"]
+    
+    def test_invalidate_word_carries_over(self, backend):
+        """Test a word edit moves unaffected results to the edited list's version"""
+        hit = ResultCache.make_key("v1", "solve", "bhace", 3)
+        miss = ResultCache.make_key("v1", "anagrams", "tac", 3)
+        for key in (hit, miss):
+            backend.set(key, ["x"])
+        
+        assert backend.invalidate_word("v1", "beach", "v2") == 1
+        assert backend.get(ResultCache.make_key("v2", "anagrams", "tac", 3)) == ["x"]
+        assert backend.get(ResultCache.make_key("v2", "solve", "bhace", 3)) is None
+        if backend.name != "memory":
+            # Workers still on the old list keep their results
+            assert backend.get(hit) == ["x"]
+    
+    def test_purge_keeps_several_versions(self, backend):
+        """Test purges can keep the results of every resident dictionary"""
+        keys = [ResultCache.make_key(version, "solve", "tac", 3) for version in ("a", "b", "c")]
+        for key in keys:
+            backend.set(key, ["act"])
+        
+        assert backend.purge("a", ["b"]) == 1
+        assert [backend.get(key) for key in keys] == [["act"], ["act"], None]
+    
+    def test_ttl_expiry(self, backend):
+        """Test entries disappear once their TTL passes"""
+        backend.ttl = 0.05
+        key = ResultCache.make_key("v1", "solve", "tac", 3)
+        backend.set(key, ["act", "cat"])
+        assert backend.get(key) == ["act", "cat"]
+        
+        time.sleep(0.1)
+        assert backend.get(key) is None
+
+class TestPersistentCaches:
+    """Test the caches shared across workers and restarts"""
+    
+    def test_compact_encoding(self):
+        """Test the serialized form round-trips and is smaller than the text"""
+        words = [f"word{i}" for i in range(500)]
+        data = encode_words(words)
+        
+        assert decode_words(data) == words
+        assert len(data) < len("\n".join(words))
+        assert encode_words([]) == b""
+    
+    def test_sqlite_survives_restart(self, tmp_path):
+        """Test a second cache on the same file sees earlier results"""
+        path = str(tmp_path / "cache.sqlite3")
+        key = ResultCache.make_key("v1", "solve", "tac", 3)
+        first = SQLiteResultCache(path)
+        first.set(key, ["act", "cat"])
+        first.close()
+        
+        second = SQLiteResultCache(path)
+        assert second.get(key) == ["act", "cat"]
+        assert second.stats()["size"] == 1
+        second.close()
+    
+    def test_redis_shared_between_clients(self, redis_url):
+        """Test two clients (workers) share entries through the server"""
+        key = ResultCache.make_key("v1", "anagrams", "tac", 3)
+        RedisResultCache(redis_url).set(key, ["act", "cat"])
+        
+        assert RedisResultCache(redis_url).get(key) == ["act", "cat"]
+    
+    def test_redis_unavailable_is_a_miss(self):
+        """Test a missing server degrades to cache misses, not errors"""
+        cache = RedisResultCache("redis://127.0.0.1:1/0")
+        key = ResultCache.make_key("v1", "solve", "tac", 3)
+        
+        cache.set(key, ["cat"])
+        assert cache.get(key) is None
+        assert cache.purge("v1") == 0
+    
+    def test_unknown_backend(self):
+        """Test an unknown backend name is rejected"""
+        with pytest.raises(ValueError):
+            create_result_cache("memcached")
@@ -18,6 +18,7 @@ class TestConfiguration:
         assert DictionaryType.SCOWL_LARGE.value == "scowl_large"
         assert DictionaryType.COMPREHENSIVE.value == "comprehensive"
         assert DictionaryType.AUTO.value == "auto"
+        assert DictionaryType.SPANISH.value == "spanish"
     
     def test_default_configuration(self):
         """Test default configuration values"""
@@ -38,6 +39,14 @@ class TestConfiguration:
         # Check AUTO has empty list (special case)
         assert mappings[DictionaryType.AUTO] == []
     
+    def test_resolve_auto_dictionary_type(self):
+        """Test AUTO resolves to the first priority type with a file present"""
+        os.chdir(os.path.join(os.path.dirname(__file__), '..', 'app'))
+        assert Config.resolve_dictionary_type(DictionaryType.AUTO) == DictionaryType.SCOWL_LARGE
+        assert Config.resolve_dictionary_type(DictionaryType.GOOGLE_10K) == DictionaryType.GOOGLE_10K
+        with patch.object(Config, 'AUTO_PRIORITY', (DictionaryType.SPANISH, DictionaryType.GOOGLE_10K)):
+            assert Config.resolve_dictionary_type(DictionaryType.AUTO) == DictionaryType.GOOGLE_10K
+    
     def test_get_dictionary_paths_specific_types(self):
         """Test getting dictionary paths for specific types"""
         # Test SCOWL Large
@@ -0,0 +1,149 @@
+import pytest
+import os
+import sys
+
+# Add the app directory to the path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'app'))
+
+from config import DictionaryType
+from engine import WordSolver
+from solver import find_valid_words, get_anagrams
+
+class TestWordSolver:
+    """Test the embeddable solver engine"""
+    
+    @pytest.fixture
+    def engine(self):
+        """Create an engine over the Google 10k dictionary"""
+        os.chdir(os.path.join(os.path.dirname(__file__), '..', 'app'))
+        return WordSolver(DictionaryType.GOOGLE_10K)
+    
+    def test_loads_lazily(self, engine):
+        """Test nothing is loaded until the first query"""
+        assert not engine.loaded
+        engine.solve("beach")
+        assert engine.loaded
+        snapshot = engine.snapshot
+        engine.anagrams("tac")
+        assert engine.snapshot is snapshot
+    
+    def test_matches_solver_functions(self, engine):
+        """Test engine queries agree with the solver functions"""
+        snapshot = engine.load().snapshot
+        index, dict_type = snapshot.index, snapshot.dictionary_type
+        assert engine.solve("BEACH!") == find_valid_words("beach", index, 3, dict_type)
+        assert engine.anagrams("tac") == get_anagrams("tac", index, 3, dict_type)
+        assert engine.solve("beach", min_length=4) == find_valid_words(
+            "beach", index, 4, dict_type)
+    
+    def test_batch(self, engine):
+        """Test batch answers each rack in input order"""
+        racks = ["beach", "tac", "xyz"]
+        assert engine.batch(racks) == [engine.solve(rack) for rack in racks]
+        assert engine.batch(racks, mode="anagrams") == [
+            engine.anagrams(rack) for rack in racks]
+        with pytest.raises(ValueError):
+            engine.batch(racks, mode="boggle")
+    
+    def test_complete(self):
+        """Test prefix completion builds its sorted arrays on first use"""
+        engine = WordSolver.from_words(["cat", "cab", "cast", "dog"])
+        assert engine.complete("CA", "tsac") == ["cat", "cast"]
+        words = engine.sorted_words
+        assert engine.complete("d", "god") == ["dog"]
+        assert engine.sorted_words is words
+    
+    def test_hooks(self):
+        """Test hook plays report the anchor each word uses"""
+        engine = WordSolver.from_words(["cat", "cats", "scat", "tact"])
+        assert engine.hooks("TAC", [("s", -1), ("t", None)]) == (
+            ["cats", "tact"], {"cats": ["s@-1"], "tact": ["t"]})
+    
+    def test_grid(self):
+        """Test grid solving uses the engine's sorted word list"""
+        engine = WordSolver.from_words(["cat", "act", "dog", "tact"])
+        assert engine.grid(["CA", "xt"]) == ["act", "cat"]
+    
+    def test_wordle(self):
+        """Test Wordle filtering uses a per-length index built once"""
+        engine = WordSolver.from_words(["crane", "crate", "trace", "cat"])
+        candidates, suggestions = engine.wordle([("crane", 2 + 2 * 3 + 2 * 9 + 2 * 81)])
+        assert candidates == ["crate"]
+        assert suggestions == [("crate", 0.0)]
+        assert engine.wordle_index(5) is engine.wordle_index(5)
+        with pytest.raises(ValueError):
+            engine.wordle([], length=7)
+    
+    def test_ladder(self):
+        """Test word ladders are searched within one word length"""
+        engine = WordSolver.from_words(["cold", "cord", "card", "ward", "warm", "cat"])
+        assert engine.ladder("Cold", "warm").path == [
+            "cold", "cord", "card", "ward", "warm"
+        ]
+        assert engine.ladder_graph(4) is engine.ladder_graph(4)
+        with pytest.raises(ValueError):
+            engine.ladder("cold", "cat")
+        with pytest.raises(ValueError):
+            engine.ladder("abcdefg", "gfedcba")
+    
+    def test_suggest(self):
+        """Test typo suggestions come from a lazily built fuzzy index"""
+        engine = WordSolver.from_words(["word", "world", "sword", "cat"])
+        assert engine.suggest("Wrod", max_distance=1) == [("word", 1)]
+        # Equally close words come more frequent first
+        assert [w for w, _ in engine.suggest("wrod")] == ["word", "world", "sword"]
+        assert engine.fuzzy_index is engine.fuzzy_index
+    
+    def test_from_words(self):
+        """Test an engine over an in-memory word list"""
+        engine = WordSolver.from_words(["cat", "act", "tack", "dog"])
+        assert not engine.loaded
+        assert engine.solve("tack") == ["act", "cat", "tack"]
+        assert engine.anagrams("tca") == ["act", "cat"]
+    
+    def test_edits_return_new_engines(self):
+        """Test editing words leaves the original engine untouched"""
+        engine = WordSolver.from_words(["cat", "act"])
+        added = engine.with_word("tac")
+        assert added is not engine
+        assert "tac" in added.solve("cat")
+        assert "tac" not in engine.solve("cat")
+        assert added.with_word("tac") is added
+        assert "cat" not in added.without_word("cat").solve("cat")
+    
+    def test_edits_reuse_built_indexes(self):
+        """Test an edit carries indexes over and only rebuilds the edited length"""
+        engine = WordSolver.from_words(["cat", "act", "cot", "dog", "tack", "tick"])
+        wordle3, wordle4 = engine.wordle_index(3), engine.wordle_index(4)
+        ladder4 = engine.ladder_graph(4)
+        
+        added = engine.with_word("tuck")
+        assert added.sorted_words == ["act", "cat", "cot", "dog", "tack", "tick", "tuck"]
+        assert added.words_by_length[4] == ["tack", "tick", "tuck"]
+        assert engine.words_by_length[4] == ["tack", "tick"]
+        assert added.wordle_index(3) is wordle3
+        assert added.wordle_index(4) is not wordle4
+        assert added.ladder("tack", "tuck").path == ["tack", "tuck"]
+        assert engine.ladder_graph(4) is ladder4
+        
+        removed = added.without_word("dog")
+        assert removed.words_by_length[3] == ["act", "cat", "cot"]
+        assert removed.wordle_index(4) is added.wordle_index(4)
+        # Results match an engine built from scratch
+        fresh = WordSolver.from_words(["cat", "act", "cot", "tack", "tick", "tuck"])
+        assert removed.sorted_words == fresh.sorted_words
+        assert removed.words_by_length == fresh.words_by_length
+    
+    def test_edits_update_built_fuzzy_index(self):
+        """Test an edit applies the word to a built fuzzy index"""
+        engine = WordSolver.from_words(["cat", "act", "tack", "tick"])
+        assert not engine.has_fuzzy_index
+        assert not engine.with_word("tuck").has_fuzzy_index
+        
+        engine.fuzzy_index
+        added = engine.with_word("tuck")
+        assert added.has_fuzzy_index
+        assert added.suggest("tuk", 1) == [("tuck", 1)]
+        assert engine.suggest("tuk", 1) == []
+        removed = added.without_word("tick")
+        assert removed.suggest("tick", 1) == [("tack", 1), ("tuck", 1)]
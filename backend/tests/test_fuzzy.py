@@ -0,0 +1,80 @@
+import pytest
+import os
+import sys
+
+# Add the app directory to the path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'app'))
+
+from admission import Cancelled, Deadline
+from fuzzy import FuzzyIndex, edit_distance
+
+LETTERS = "abcdefghijklmnopqrstuvwxyz"
+WORDS = ["hello", "help", "hell", "held", "yellow", "world", "word", "sword",
+         "receive", "deceive", "the", "then", "tea", "ten"]
+
+class TestEditDistance:
+    """Test the transposition-aware edit distance"""
+    
+    def test_distances(self):
+        """Test each kind of edit counts once"""
+        assert edit_distance("word", "word", 2) == 0
+        assert edit_distance("wrd", "word", 2) == 1
+        assert edit_distance("wordy", "word", 2) == 1
+        assert edit_distance("ward", "word", 2) == 1
+        assert edit_distance("wrod", "word", 2) == 1
+        assert edit_distance("recieve", "receive", 2) == 1
+        assert edit_distance("wrodd", "word", 2) == 2
+    
+    def test_limit(self):
+        """Test distances past the limit are capped"""
+        assert edit_distance("hello", "world", 2) == 3
+        assert edit_distance("a", "abcdef", 2) == 3
+
+class TestFuzzyIndex:
+    """Test symmetric-delete lookups"""
+    
+    @pytest.fixture
+    def index(self):
+        return FuzzyIndex(WORDS, LETTERS, {"the": 0, "hello": 5, "help": 3, "hell": 9})
+    
+    def test_matches_brute_force(self, index):
+        """Test lookups find exactly the words within the distance"""
+        for query in ["helo", "wrod", "teh", "recieve", "yelow", "hepl", "xyz", "swrods"]:
+            for distance in (1, 2):
+                expected = {w for w in WORDS if edit_distance(query, w, distance) <= distance}
+                found = index.lookup(query, distance, limit=100)
+                assert {w for w, _ in found} == expected
+                assert all(d == edit_distance(query, w, distance) for w, d in found)
+    
+    def test_ranking(self, index):
+        """Test closer words first, then more frequent ones, then alphabetical"""
+        assert index.lookup("helo", 1) == [("help", 1), ("hello", 1), ("hell", 1), ("held", 1)]
+        assert index.lookup("hello", 2, limit=2) == [("hello", 0), ("hell", 1)]
+        assert index.lookup("teh", 1, limit=1) == [("the", 1)]
+    
+    def test_compact_storage(self, index):
+        """Test deletions are stored as flat arrays, about eight bytes each"""
+        assert index.keys.itemsize == index.ids.itemsize == 4
+        assert len(index.keys) == sum(len({w, *(w[:i] + w[i + 1:] for i in range(len(w)))})
+                                      for w in WORDS)
+    
+    def test_edits_match_fresh_build(self, index):
+        """Test adding and removing words gives the lookups of a rebuilt index"""
+        edited = index.with_word("helm").without_word("hell").without_word("the")
+        words = [w for w in WORDS if w not in ("hell", "the")] + ["helm"]
+        fresh = FuzzyIndex(words, LETTERS, index.ranks)
+        for query in ["helo", "hel", "teh", "wrod", "hellm"]:
+            assert edited.lookup(query, 2, limit=100) == fresh.lookup(query, 2, limit=100)
+        assert len(edited) == len(fresh)
+        assert len(edited.keys) == len(fresh.keys)
+        # The original index is left as it was
+        assert ("hell", 1) in index.lookup("helm", 1)
+        assert edited.with_word("helm") is edited
+        assert edited.without_word("hell") is edited
+    
+    def test_cancelled_build(self):
+        """Test a build stops at its deadline's checkpoints"""
+        deadline = Deadline(60)
+        deadline.cancel()
+        with pytest.raises(Cancelled):
+            deadline.run(FuzzyIndex, WORDS, LETTERS)
@@ -0,0 +1,98 @@
+import pytest
+import os
+import sys
+
+# Add the app directory to the path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'app'))
+
+from config import DictionaryType
+from generator import PuzzleConstraints, PuzzleGenerator, load_word_ranks, parse_length_bounds
+from solver import build_snapshot, find_valid_words, load_snapshot
+
+class TestPuzzleGenerator:
+    """Test generating racks that meet level constraints"""
+    
+    @pytest.fixture
+    def generator(self):
+        """Create a generator over the Google 10k dictionary"""
+        os.chdir(os.path.join(os.path.dirname(__file__), '..', 'app'))
+        return PuzzleGenerator(load_snapshot(DictionaryType.GOOGLE_10K), load_word_ranks())
+    
+    def test_word_ranks_follow_frequency(self):
+        """Test ranks come from the frequency-ordered list"""
+        os.chdir(os.path.join(os.path.dirname(__file__), '..', 'app'))
+        ranks = load_word_ranks()
+        assert ranks["the"] == 0
+        assert ranks["the"] < ranks["beach"]
+    
+    def test_sub_multisets(self):
+        """Test sub-multiset enumeration handles repeated letters"""
+        assert PuzzleGenerator.sub_multisets("aab") == frozenset(
+            {"aab", "ab", "aa", "a", "b", ""})
+    
+    def test_solve_matches_solver(self, generator):
+        """Test sub-multiset assembly agrees with the index solver"""
+        constraints = PuzzleConstraints()
+        snapshot = generator.snapshot
+        expected = find_valid_words("abotu", snapshot.index, 3, snapshot.dictionary_type)
+        assert generator.solve("abotu", constraints) == expected
+    
+    def test_generated_puzzles_meet_constraints(self, generator):
+        """Test every puzzle satisfies count, pangram and length constraints"""
+        constraints = PuzzleConstraints(min_letters=5, max_letters=7, min_words=6, max_words=12,
+                                        length_bounds={3: (2, 8)})
+        result = generator.generate(constraints, limit=5, time_budget=5)
+        
+        assert len(result["puzzles"]) == 5
+        for puzzle in result["puzzles"]:
+            assert 5 <= len(puzzle["letters"]) <= 7
+            assert 6 <= puzzle["word_count"] <= 12
+            assert len(puzzle["pangrams"]) == 1
+            assert sorted(puzzle["pangrams"][0]) == sorted(puzzle["letters"])
+            assert 2 <= puzzle["length_distribution"][3] <= 8
+    
+    def test_seed_is_reproducible(self, generator):
+        """Test shuffled searches repeat for the same seed"""
+        first = generator.generate(PuzzleConstraints(), limit=3, seed=7)
+        second = generator.generate(PuzzleConstraints(), limit=3, seed=7)
+        assert [p["letters"] for p in first["puzzles"]] == [p["letters"] for p in second["puzzles"]]
+    
+    def test_time_budget(self):
+        """Test the search stops when the budget runs out"""
+        snapshot = build_snapshot({"cat", "act", "tac"}, {"type": "scowl_large"})
+        generator = PuzzleGenerator(snapshot, {"cat": 0, "act": 1, "tac": 2})
+        result = generator.generate(PuzzleConstraints(min_letters=3), time_budget=0)
+        assert result["timed_out"] is True
+        assert result["puzzles"] == []
+    
+    def test_class_maps_bounded(self):
+        """Test rank cutoffs past the list share a class map and old ones are evicted"""
+        snapshot = build_snapshot({"cat", "act", "tac"}, {"type": "scowl_large"})
+        generator = PuzzleGenerator(snapshot, {"cat": 0, "act": 1, "tac": 2})
+        
+        assert generator.classes(3, 3) is generator.classes(10 ** 9, 3)
+        for max_rank in range(1, 4):
+            for min_length in range(1, 4):
+                generator.classes(max_rank, min_length)
+        assert len(generator._classes) == PuzzleGenerator.CLASS_CACHE_SIZE
+    
+    def test_class_build_counts_against_budget(self, monkeypatch):
+        """Test a class build that uses up the budget stops the search"""
+        from types import SimpleNamespace
+        import generator as generator_module
+        
+        snapshot = build_snapshot({"cat", "act", "tac"}, {"type": "scowl_large"})
+        generator = PuzzleGenerator(snapshot, {"cat": 0, "act": 1, "tac": 2})
+        clock = iter([0.0, 5.0, 5.0])
+        monkeypatch.setattr(generator_module, "time", SimpleNamespace(monotonic=lambda: next(clock)))
+        
+        result = generator.generate(PuzzleConstraints(min_letters=3), time_budget=1)
+        assert result["timed_out"] is True
+        assert result["examined"] == 0
+    
+    def test_parse_length_bounds(self):
+        """Test the length bound syntax"""
+        assert parse_length_bounds("3:2-6, 4:1") == {3: (2, 6), 4: (1, 1)}
+        assert parse_length_bounds("") == {}
+        with pytest.raises(ValueError):
+            parse_length_bounds("3:x")
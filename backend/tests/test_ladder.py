@@ -0,0 +1,65 @@
+import pytest
+import os
+import sys
+from unittest.mock import patch
+
+# Add the app directory to the path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'app'))
+
+from ladder import LadderGraph, FOUND, NODE_LIMIT, TIME_LIMIT, UNREACHABLE
+
+WORDS = ["cold", "cord", "card", "ward", "warm", "word", "wore", "core",
+         "corm", "worm", "wold", "golf", "zzzz"]
+
+class TestLadderGraph:
+    """Test wildcard-bucket adjacency and bidirectional search"""
+    
+    def test_neighbours(self):
+        """Test words sharing a wildcard bucket are neighbours"""
+        graph = LadderGraph(WORDS)
+        cold = graph.ids["cold"]
+        neighbours = {graph.words[i] for i in graph.neighbours(cold)}
+        assert neighbours == {"cord", "wold"}
+        assert "c?ld" not in graph.buckets  # only "cold" matches it
+    
+    def test_shortest_path(self):
+        """Test the ladder found is a shortest one"""
+        graph = LadderGraph(WORDS)
+        result = graph.find("cold", "warm")
+        
+        assert result.status == FOUND
+        assert result.found
+        assert len(result.path) == 5
+        assert result.path[0] == "cold" and result.path[-1] == "warm"
+        for a, b in zip(result.path, result.path[1:]):
+            assert sum(x != y for x, y in zip(a, b)) == 1
+        # Either direction gives a ladder of the same length
+        assert len(graph.find("warm", "cold").path) == 5
+    
+    def test_same_word(self):
+        """Test a word is a ladder to itself"""
+        assert LadderGraph(WORDS).find("cold", "cold").path == ["cold"]
+    
+    def test_unreachable(self):
+        """Test disconnected words report no ladder"""
+        result = LadderGraph(WORDS).find("cold", "zzzz")
+        assert result.status == UNREACHABLE
+        assert result.path == []
+    
+    def test_unknown_word(self):
+        """Test words outside the graph are rejected"""
+        with pytest.raises(ValueError):
+            LadderGraph(WORDS).find("cold", "hold")
+    
+    def test_node_limit(self):
+        """Test the search stops after visiting too many words"""
+        result = LadderGraph(WORDS).find("cold", "warm", max_nodes=3)
+        assert result.status == NODE_LIMIT
+        assert result.path == []
+    
+    def test_time_limit(self):
+        """Test the search stops once its time is up"""
+        graph = LadderGraph(WORDS)
+        with patch("ladder.time.monotonic", side_effect=[0.0, 1.0]):
+            result = graph.find("cold", "warm", time_limit=0.5)
+        assert result.status == TIME_LIMIT
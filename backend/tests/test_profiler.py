@@ -0,0 +1,75 @@
+import pytest
+import os
+import sys
+
+# Add the app directory to the path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'app'))
+
+from profiler import SolverProfiler
+from solver import find_valid_words
+
+class TestSolverProfiler:
+    """Test the on-demand solver profiler"""
+    
+    @pytest.fixture
+    def test_dictionary(self):
+        """Small test dictionary for controlled testing"""
+        return {"cat", "act", "tac", "ace", "beach", "each", "ache"}
+    
+    def test_disabled_profiler_passes_through(self, test_dictionary):
+        """Test that a disarmed profiler just calls the function"""
+        profiler = SolverProfiler()
+        words = profiler.call(find_valid_words, "bhace", test_dictionary, 3)
+        
+        assert words == ["ace", "ache", "each", "beach"]
+        assert profiler.status()["profiled_calls"] == 0
+        assert profiler.report() == ""
+    
+    def test_profiles_next_n_requests(self, test_dictionary):
+        """Test that exactly the next N calls are profiled"""
+        profiler = SolverProfiler()
+        profiler.arm(requests=2)
+        assert profiler.active
+        
+        for _ in range(3):
+            profiler.call(find_valid_words, "bhace", test_dictionary, 3)
+        
+        status = profiler.status()
+        assert status["profiled_calls"] == 2
+        assert status["remaining_requests"] == 0
+        assert not profiler.active
+        assert "find_valid_words" in profiler.report()
+    
+    def test_sampled_profiling(self, test_dictionary):
+        """Test that sample_rate=1 profiles every call until disarmed"""
+        profiler = SolverProfiler()
+        profiler.arm(sample_rate=1.0)
+        
+        for _ in range(3):
+            profiler.call(find_valid_words, "bhace", test_dictionary, 3)
+        profiler.disarm()
+        profiler.call(find_valid_words, "bhace", test_dictionary, 3)
+        
+        assert profiler.status()["profiled_calls"] == 3
+    
+    def test_dump_writes_pstats_file(self, test_dictionary, tmp_path):
+        """Test that aggregated stats can be written to disk"""
+        import pstats
+        
+        profiler = SolverProfiler()
+        assert profiler.dump(str(tmp_path)) is None
+        
+        profiler.arm(requests=1)
+        profiler.call(find_valid_words, "bhace", test_dictionary, 3)
+        path = profiler.dump(str(tmp_path))
+        
+        assert path is not None and os.path.exists(path)
+        assert pstats.Stats(path).total_calls > 0
+    
+    def test_invalid_arguments(self):
+        """Test argument validation"""
+        profiler = SolverProfiler()
+        with pytest.raises(ValueError):
+            profiler.arm(requests=-1)
+        with pytest.raises(ValueError):
+            profiler.arm(sample_rate=1.5)
@@ -0,0 +1,76 @@
+import pytest
+import io
+import json
+import logging
+import os
+import sys
+from unittest.mock import patch
+
+# Add the app directory to the path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'app'))
+
+from request_log import JSONLineFormatter, RequestLog
+
+def lines(stream):
+    return [json.loads(line) for line in stream.getvalue().splitlines()]
+
+class TestRequestLog:
+    """Test sampled request records written by the background thread"""
+    
+    def test_structured_records(self):
+        """Test sampled requests are written as JSON lines"""
+        stream = io.StringIO()
+        log = RequestLog(1.0, stream=stream)
+        log.start()
+        log.log("solve", 8, 42, 1.234, "scowl_large", cached=True)
+        log.log("anagrams", 5, 3, 0.5, "google_10k")
+        log.stop()
+        
+        first, second = lines(stream)
+        assert first["event"] == "request"
+        assert first["endpoint"] == "solve"
+        assert first["rack_length"] == 8
+        assert first["results"] == 42
+        assert first["latency_ms"] == 1.23
+        assert first["engine"] == "scowl_large"
+        assert first["cached"] is True
+        assert second["endpoint"] == "anagrams" and second["cached"] is False
+        assert "ts" in first
+    
+    def test_unsampled_requests_cost_nothing(self):
+        """Test requests outside the sample are never built or formatted"""
+        stream = io.StringIO()
+        log = RequestLog(0.5, stream=stream)
+        log.start()
+        with patch("request_log.random.random", return_value=0.9), \
+                patch.object(JSONLineFormatter, "format") as formatter, \
+                patch.object(logging.Logger, "info") as info:
+            log.log("solve", 8, 42, 1.0, "scowl_large")
+        log.stop()
+        
+        assert not info.called
+        assert not formatter.called
+        assert stream.getvalue() == ""
+    
+    def test_disabled(self):
+        """Test a zero sample rate never starts the writer"""
+        stream = io.StringIO()
+        log = RequestLog(0, stream=stream)
+        log.start()
+        log.log("solve", 8, 42, 1.0, "scowl_large")
+        log.stop()
+        assert stream.getvalue() == ""
+    
+    def test_full_queue_drops_records(self):
+        """Test records are dropped instead of blocking when the writer lags"""
+        log = RequestLog(1.0, queue_size=1, stream=io.StringIO())
+        # Enqueue without the listener draining the queue
+        log._running = True
+        log._logger.addHandler(log._handler)
+        try:
+            for _ in range(3):
+                log.log("solve", 8, 42, 1.0, "scowl_large")
+        finally:
+            log._logger.removeHandler(log._handler)
+            log._running = False
+        assert log.dropped == 2
@@ -0,0 +1,82 @@
+import pytest
+import gzip
+import os
+import sys
+from types import SimpleNamespace
+from unittest.mock import patch
+
+# Add the app directory to the path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'app'))
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+import responses
+from responses import choose_coding, encode_json, json_response
+from utils import format_response, matching_etag
+
+WORDS = ["ace", "ache", "beach", "niño", "straße", "ærø"] * 500
+
+class TestEncodeJSON:
+    """Test the fast encoder matches FastAPI's default output"""
+    
+    def test_byte_compatible(self):
+        """Test bodies are identical to the jsonable_encoder/JSONResponse path"""
+        for content in (
+            format_response(WORDS, "bhace"),
+            format_response([], ""),
+            {**format_response(["ace"], "ace"), "tiers": {"ace": "common"}},
+        ):
+            assert encode_json(content) == JSONResponse(jsonable_encoder(content)).body
+
+class TestCompression:
+    """Test content coding negotiation and compressed responses"""
+    
+    def test_choose_coding(self):
+        """Test the preferred accepted coding is picked"""
+        assert choose_coding(None) is None
+        assert choose_coding("identity") is None
+        assert choose_coding("gzip, deflate") == "gzip"
+        assert choose_coding("GZIP;q=0.5") == "gzip"
+        assert choose_coding("gzip;q=0") is None
+        assert choose_coding("*") == "gzip"
+        with patch.object(responses, "brotli", None):
+            assert choose_coding("br, gzip") == "gzip"
+        with patch.object(responses, "brotli", SimpleNamespace()):
+            assert choose_coding("gzip, br") == "br"
+            assert choose_coding("br;q=0, gzip") == "gzip"
+    
+    def test_large_bodies_compressed(self):
+        """Test bodies over the threshold are gzipped with their own ETag"""
+        content = format_response(WORDS, "bhace")
+        response = json_response(content, {"ETag": '"abc"'}, "gzip")
+        
+        assert response.headers["Content-Encoding"] == "gzip"
+        assert response.headers["Vary"] == "Accept-Encoding"
+        assert response.headers["ETag"] == '"abc-gzip"'
+        assert response.media_type == "application/json"
+        assert gzip.decompress(response.body) == encode_json(content)
+    
+    def test_small_or_unaccepted_bodies_plain(self):
+        """Test small bodies and clients without gzip get plain JSON"""
+        small = format_response(["ace"], "ace")
+        response = json_response(small, {"ETag": '"abc"'}, "gzip")
+        assert "Content-Encoding" not in response.headers
+        assert response.headers["ETag"] == '"abc"'
+        assert response.body == encode_json(small)
+        
+        large = format_response(WORDS, "bhace")
+        assert json_response(large, {}, None).body == encode_json(large)
+        with patch.object(responses.Config, "COMPRESS_MIN_BYTES", 0):
+            response = json_response(large, {}, "gzip")
+        assert response.body == encode_json(large)
+        assert "Vary" not in response.headers
+    
+    def test_compressed_etags_match(self):
+        """Test revalidating a compressed copy matches its base ETag"""
+        assert matching_etag('"abc-gzip"', '"abc"') == '"abc-gzip"'
+        assert matching_etag('W/"abc-br"', '"abc"') == '"abc-br"'
+        assert matching_etag('"abc"', '"abc"') == '"abc"'
+        assert matching_etag("*", '"abc"') == '"abc"'
+        assert matching_etag('"abc-zstd", "abd"', '"abc"') is None
+        assert matching_etag(None, '"abc"') is None
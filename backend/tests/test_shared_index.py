@@ -0,0 +1,157 @@
+import pytest
+import os
+import sys
+
+# Add the app directory to the path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'app'))
+
+from config import DictionaryType
+from index import SortedWordList
+from solver import build_snapshot, find_tiered_words, find_valid_words, get_anagrams
+from shared_index import (
+    attach_shared_index,
+    load_shared_snapshot,
+    read_header,
+    write_shared_index,
+)
+
+WORDS = {"cat", "act", "tac", "beach", "ache", "each", "bach", "aaah",
+         "sassafras", "grind", "gird", "dig", "rig"}
+
+class TestSortedWordList:
+    """Test the sorted byte-blob word set"""
+    
+    def test_membership_and_iteration(self):
+        """Test bisect membership matches a plain set"""
+        words = SortedWordList.build(WORDS)
+        
+        assert len(words) == len(WORDS)
+        assert list(words) == sorted(WORDS)
+        for word in WORDS:
+            assert word in words
+        assert "dog" not in words
+        assert "" not in words
+        assert 42 not in words
+    
+    def test_set_operations_return_frozensets(self):
+        """Test edits on a shared word list produce ordinary sets"""
+        words = SortedWordList.build(WORDS)
+        
+        added = words | {"dog"}
+        assert isinstance(added, frozenset)
+        assert "dog" in added
+        assert words - {"cat"} == frozenset(WORDS - {"cat"})
+        assert words == frozenset(WORDS)
+    
+    def test_contains_many(self):
+        """Test batch membership matches single lookups"""
+        words = SortedWordList.build(WORDS)
+        candidates = ["zzz", "cat", "dog", "aaah", "cat", "", "sassafras", "ab"]
+        
+        assert words.contains_many(candidates) == frozenset(
+            word for word in candidates if word in words)
+        assert words.contains_many([]) == frozenset()
+
+    def test_word_edits_share_the_blob(self):
+        """Test single-word edits keep the blob and record an overlay"""
+        words = SortedWordList.build(WORDS)
+        
+        edited = words.with_word("dog").without_word("cat")
+        assert isinstance(edited, SortedWordList)
+        assert edited.blob is words.blob
+        assert edited.extra == {"dog"} and edited.hidden == {"cat"}
+        assert "dog" in edited and "cat" not in edited and "cat" in words
+        assert list(edited) == sorted(WORDS - {"cat"} | {"dog"})
+        assert len(edited) == len(WORDS)
+        assert edited.contains_many(["cat", "dog", "act"]) == {"dog", "act"}
+        # Undoing an edit empties the overlay again
+        restored = edited.with_word("cat").without_word("dog")
+        assert restored.extra == frozenset() and restored.hidden == frozenset()
+        assert restored == words
+        assert edited.with_word("dog") is edited
+
+class TestSharedIndex:
+    """Test writing and attaching the memory-mapped index file"""
+    
+    def test_round_trip_matches_built_index(self, tmp_path):
+        """Test an attached index answers exactly like the one it was written from"""
+        snapshot = build_snapshot(WORDS, {"filepath": "test", "size": len(WORDS), "type": "scowl_large"})
+        path = str(tmp_path / "words.idx")
+        write_shared_index(path, snapshot, {"test": True})
+        
+        shared = attach_shared_index(path)
+        assert shared.version == snapshot.version
+        assert shared.index.shared is True
+        assert shared.info["shared_index"] == path
+        assert len(shared.words) == len(snapshot.words)
+        assert shared.index.deep == snapshot.index.deep
+        for letters in ["cat", "bhace", "sassafras", "aaahbc", "dgirn", "xyz"]:
+            assert find_valid_words(letters, shared.index, 3) == \
+                find_valid_words(letters, snapshot.index, 3)
+            assert get_anagrams(letters, shared.index, 3) == \
+                get_anagrams(letters, snapshot.index, 3)
+    
+    def test_snapshot_edits_stay_shared(self, tmp_path):
+        """Test word edits on an attached snapshot do not copy its word list"""
+        snapshot = build_snapshot(WORDS, {"filepath": "test", "size": len(WORDS), "type": "scowl_large"})
+        path = str(tmp_path / "words.idx")
+        write_shared_index(path, snapshot, {"test": True})
+        shared = attach_shared_index(path)
+        
+        edited = shared.with_word("tact").without_word("beach")
+        assert isinstance(edited.words, SortedWordList)
+        assert edited.words.blob is shared.words.blob
+        assert "tact" in edited.words and "beach" not in edited.words
+        assert find_valid_words("tact", edited.index, 3) == ["act", "cat", "tac", "tact"]
+    
+    def test_round_trip_keeps_word_tiers(self, tmp_path):
+        """Test word tier bits survive the shared index file"""
+        os.chdir(os.path.join(os.path.dirname(__file__), '..', 'app'))
+        snapshot = build_snapshot(WORDS, {"filepath": "test", "size": len(WORDS), "type": "scowl_large"})
+        path = str(tmp_path / "words.idx")
+        write_shared_index(path, snapshot, {"test": True})
+        
+        shared = attach_shared_index(path)
+        assert shared.index.has_tiers
+        for letters in ["bhace", "dgirn", "tac"]:
+            assert find_tiered_words(letters, shared.index, 3) == \
+                find_tiered_words(letters, snapshot.index, 3)
+    
+    def test_edits_on_attached_snapshot(self, tmp_path):
+        """Test single-word edits layer over the read-only mapping"""
+        snapshot = build_snapshot(WORDS, {"filepath": "test", "size": len(WORDS), "type": "scowl_large"})
+        path = str(tmp_path / "words.idx")
+        write_shared_index(path, snapshot, {"test": True})
+        shared = attach_shared_index(path)
+        
+        edited = shared.with_word("tca").without_word("act")
+        assert "tca" in edited.words
+        assert "act" not in edited.words
+        assert get_anagrams("cat", edited.index, 3) == ["cat", "tac", "tca"]
+        # The attached snapshot itself is unchanged
+        assert get_anagrams("cat", shared.index, 3) == ["act", "cat", "tac"]
+    
+    def test_rebuilds_only_when_stale(self, tmp_path):
+        """Test the file is reused while its fingerprint still matches"""
+        os.chdir(os.path.join(os.path.dirname(__file__), '..', 'app'))
+        path = str(tmp_path / "google.idx")
+        
+        first = load_shared_snapshot(path, DictionaryType.GOOGLE_10K)
+        created_at = read_header(path)[0]["created_at"]
+        assert first.info["type"] == "google_10k"
+        assert "beach" in first.words
+        
+        second = load_shared_snapshot(path, DictionaryType.GOOGLE_10K)
+        assert read_header(path)[0]["created_at"] == created_at
+        assert second.version == first.version
+        
+        load_shared_snapshot(path, DictionaryType.GOOGLE_10K, force=True)
+        assert read_header(path)[0]["created_at"] != created_at
+    
+    def test_rejects_foreign_files(self, tmp_path):
+        """Test a file without the index header is not attached"""
+        path = tmp_path / "bogus.idx"
+        path.write_bytes(b"not an index")
+        
+        with pytest.raises(ValueError):
+            attach_shared_index(str(path))
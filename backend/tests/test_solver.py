@@ -2,16 +2,30 @@ import pytest
 import os
 import sys
 from collections import Counter
+from dataclasses import replace
 
 # Add the app directory to the path so we can import our modules
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'app'))
 
 from solver import (
     load_dictionary, 
+    load_snapshot,
+    load_overlay,
+    save_overlay,
+    build_snapshot,
+    parse_anchors,
+    playable_words,
+    check_words,
+    find_completions,
+    find_grid_words,
+    find_hook_words,
+    find_tiered_words,
     find_valid_words, 
     get_anagrams, 
     is_valid_word
 )
+from alphabet import ENGLISH
+from index import SortedWordList, WordIndex, dictionary_version, tier_mask, tier_names
 
 # Helper function for loading specific dictionaries in tests
 def load_specific_dictionary(filepath):
@@ -219,6 +233,328 @@ class TestSolverFunctions:
         assert is_valid_word("beach", dictionary_type="comprehensive") == True
         assert is_valid_word("ache", dictionary_type="comprehensive") == True
 
+class TestWordIndex:
+    """Test the anagram-class index against the brute-force solver"""
+    
+    @pytest.fixture
+    def test_dictionary(self):
+        """Small test dictionary including repeated-letter words"""
+        return {
+            "cat", "act", "tac", "bat", "tab", "cab", "ace", "beach", "each", "ache",
+            "gird", "assess", "asses", "sass", "ass", "sea", "eel", "level", "eve",
+            "crèche", "aaa", "mississippi", "miss", "sip", "spim", "tips", "pits",
+        }
+    
+    def test_matches_brute_force(self, test_dictionary):
+        """Test that index results match the set-based solver exactly"""
+        index = WordIndex.build(test_dictionary, "scowl_large", keep=lambda w: is_valid_word(w, 1))
+        racks = ["bhace", "tac", "assess", "sssaae", "lvele", "mississippi", "spit", "a", "zzz", "",
+                 "thequickbrownfoxjumpsoverthelazydogmississippilevelassess"]
+        
+        for letters in racks:
+            for min_length in (1, 2, 3, 4):
+                assert find_valid_words(letters, index, min_length) == \
+                    find_valid_words(letters, test_dictionary, min_length), letters
+                assert get_anagrams(letters, index, min_length) == \
+                    get_anagrams(letters, test_dictionary, min_length), letters
+    
+    def test_long_rack_on_real_dictionary(self):
+        """Test a 60-letter bank against the brute-force solver"""
+        os.chdir(os.path.join(os.path.dirname(__file__), '..', 'app'))
+        snapshot = load_snapshot()
+        rack = "thequickbrownfoxjumpsoverthelazydogthequickbrownfoxjumpsovert"
+        
+        assert find_valid_words(rack, snapshot.index, 3) == \
+            find_valid_words(rack, snapshot.words, 3)
+    
+    def test_repeated_letters_need_enough_copies(self, test_dictionary):
+        """Test that words repeating a letter need that many copies in the rack"""
+        index = WordIndex.build(test_dictionary)
+        
+        assert "assess" not in index.find_words("asses", 3)
+        assert "assess" in index.find_words("assess", 3)
+        assert "sass" not in index.find_words("sase", 3)
+        assert index.find_anagrams("ssessa", 6) == ["assess"]
+    
+    def test_index_skips_non_alphabet_words(self, test_dictionary):
+        """Test that words that can never be typed are not indexed"""
+        index = WordIndex.build(test_dictionary)
+        assert len(index) == len(test_dictionary) - 1  # "crèche"
+    
+    def test_empty_index(self):
+        """Test that an empty index answers every query with no words"""
+        index = WordIndex.build(set())
+        assert len(index) == 0
+        assert index.find_words("abc", 1) == []
+        assert index.find_anagrams("abc", 1) == []
+    
+    def test_incremental_add_and_remove(self, test_dictionary):
+        """Test that single-word edits match a full rebuild"""
+        index = WordIndex.build(test_dictionary)
+        edited = index.with_word("abc").with_word("cab").without_word("tac").without_word("assess")
+        rebuilt = WordIndex.build((test_dictionary | {"abc"}) - {"tac", "assess"})
+        
+        assert len(edited) == len(rebuilt)
+        assert "abc" in edited and "tac" not in edited
+        assert "tac" in index  # The original index is untouched
+        for letters in ["cat", "abc", "bhacet", "assess", "ssseea"]:
+            assert edited.find_words(letters, 1) == rebuilt.find_words(letters, 1)
+            assert edited.find_anagrams(letters, 1) == rebuilt.find_anagrams(letters, 1)
+        
+        # Re-adding a removed word and removing an added one round-trips
+        restored = edited.with_word("tac").without_word("abc")
+        assert restored.find_anagrams("cat", 3) == ["act", "cat", "tac"]
+        assert restored.find_words("abc", 3) == ["cab"]
+    
+    def test_rejects_words_outside_alphabet(self):
+        """Test that words that could never be typed cannot be added"""
+        with pytest.raises(ValueError):
+            WordIndex.build({"cat"}).with_word("crèche")
+    
+    def test_dictionary_version_is_content_hash(self, test_dictionary):
+        """Test that the version depends only on the word set contents"""
+        assert dictionary_version(test_dictionary) == dictionary_version(sorted(test_dictionary))
+        assert dictionary_version(test_dictionary) != dictionary_version(test_dictionary - {"cat"})
+    
+    def test_snapshot_matches_real_dictionary(self):
+        """Test that a snapshot of the real dictionary agrees with brute force"""
+        os.chdir(os.path.join(os.path.dirname(__file__), '..', 'app'))
+        dictionary, info = load_dictionary()
+        snapshot = build_snapshot(dictionary, info)
+        
+        assert snapshot.words == dictionary
+        assert snapshot.dictionary_type == info["type"]
+        for letters in ["bhace", "grindk", "listen", "mississippi", "abcdefghijklmnop"]:
+            assert find_valid_words(letters, snapshot.index, 3) == \
+                find_valid_words(letters, dictionary, 3)
+            assert get_anagrams(letters, snapshot.index, 3) == \
+                get_anagrams(letters, dictionary, 3)
+
+class TestCheckWords:
+    """Test bulk word validity checking"""
+    
+    @pytest.fixture
+    def snapshot(self):
+        words = {"cat", "act", "at", "aaa", "beach"}
+        return build_snapshot(words, {"type": "scowl_large", "size": len(words)})
+    
+    def test_validity_and_quality(self, snapshot):
+        """Test membership and quality filter status are reported per word"""
+        results = check_words(["Cat", "dog", "aaa", "at", "beach"], snapshot)
+        
+        assert [r["word"] for r in results] == ["cat", "dog", "aaa", "at", "beach"]
+        assert [r["valid"] for r in results] == [True, False, True, True, True]
+        assert [r["playable"] for r in results] == [True, False, False, False, True]
+        assert check_words(["at"], snapshot, min_length=2)[0]["playable"]
+    
+    def test_sorted_word_list_matches_set(self, snapshot):
+        """Test a blob-backed word list gives the same answers as a set"""
+        shared = replace(snapshot, words=SortedWordList.build(snapshot.words))
+        candidates = ["beach", "zebra", "cat", "act", "aaa", "", "ca"]
+        
+        assert check_words(candidates, shared) == check_words(candidates, snapshot)
+
+def by_length(words):
+    """Split a sorted word list by word length"""
+    lengths = {}
+    for word in words:
+        lengths.setdefault(len(word), []).append(word)
+    return lengths
+
+class TestCompletions:
+    """Test prefix completion restricted to a rack"""
+    
+    @pytest.fixture
+    def words(self):
+        words = {"cat", "cab", "cast", "castle", "cats", "act", "aaa", "dog", "ca"}
+        return by_length(playable_words(build_snapshot(words, {"type": "scowl_large"})))
+    
+    def test_rack_feasible_shortest_first(self, words):
+        """Test completions use only rack letters, shortest first"""
+        assert find_completions("ca", "castle", words) == ["cat", "cast", "cats", "castle"]
+        assert find_completions("ca", "abct", words) == ["cab", "cat"]
+        assert find_completions("ca", "castle", words, min_length=2) == \
+            ["ca", "cat", "cast", "cats", "castle"]
+    
+    def test_limit_and_unbuildable_prefix(self, words):
+        """Test the result cap and prefixes the rack cannot spell"""
+        assert find_completions("ca", "castle", words, limit=2) == ["cat", "cast"]
+        assert find_completions("", "tac", words) == ["act", "cat"]
+        assert find_completions("do", "castle", words) == []
+        assert find_completions("aaa", "aa", words) == []
+    
+    def test_matches_solver(self):
+        """Test completions agree with filtering the full solver output"""
+        os.chdir(os.path.join(os.path.dirname(__file__), '..', 'app'))
+        snapshot = load_snapshot()
+        words = by_length(playable_words(snapshot))
+        for prefix, letters in [("ca", "castle"), ("s", "stressed"), ("", "beach")]:
+            solved = find_valid_words(letters, snapshot.index, 3, snapshot.dictionary_type)
+            expected = [word for word in solved if word.startswith(prefix)]
+            assert find_completions(prefix, letters, words, limit=1000) == expected
+
+class TestGridWords:
+    """Test tracing words through adjacent grid cells"""
+    
+    @pytest.fixture
+    def words(self):
+        words = {"cat", "act", "tea", "eat", "ate", "tac", "cate", "tat", "aaa", "taco"}
+        return playable_words(build_snapshot(words, {"type": "scowl_large"}))
+    
+    def test_adjacent_paths_only(self, words):
+        """Test words need adjacent cells, diagonals included, each used once"""
+        # c a
+        # e t
+        assert find_grid_words(["ca", "et"], words) == ["act", "ate", "cat", "eat", "tac", "tea", "cate"]
+        # "tac" needs a and c next to each other
+        assert "tac" not in find_grid_words(["cxa", "xxt"], words)
+        assert find_grid_words(["cx", "xx"], words) == []
+    
+    def test_cells_used_once_and_min_length(self, words):
+        """Test a cell cannot repeat and short words are dropped"""
+        assert find_grid_words(["ta"], words) == []
+        assert find_grid_words(["tat"], words) == ["tat"]
+        assert find_grid_words(["ca", "et"], words, min_length=4) == ["cate"]
+    
+    def test_matches_brute_force(self):
+        """Test the pruned search finds every traceable dictionary word"""
+        os.chdir(os.path.join(os.path.dirname(__file__), '..', 'app'))
+        snapshot = load_snapshot()
+        rows = ["stae", "rlin", "pdoc", "eumg"]
+        found = find_grid_words(rows, playable_words(snapshot))
+        
+        cells = {(r, c): rows[r][c] for r in range(4) for c in range(4)}
+        def traceable(word, cell, used):
+            if cells[cell] != word[0]:
+                return False
+            if len(word) == 1:
+                return True
+            return any(traceable(word[1:], (r, c), used | {cell})
+                       for r in range(cell[0] - 1, cell[0] + 2)
+                       for c in range(cell[1] - 1, cell[1] + 2)
+                       if (r, c) in cells and (r, c) not in used | {cell})
+        candidates = find_valid_words("".join(rows), snapshot.index, 3, snapshot.dictionary_type)
+        expected = [w for w in candidates if any(traceable(w, cell, set()) for cell in cells)]
+        assert found == expected
+        assert len(found) > 20
+
+class TestHookWords:
+    """Test rack plus one board letter move generation"""
+    
+    @pytest.fixture
+    def index(self):
+        words = {"cat", "cats", "scat", "act", "acts", "tact", "at", "sat", "cast", "casts"}
+        return WordIndex.build(words)
+    
+    def test_exactly_one_anchor(self, index):
+        """Test words need the rack plus exactly one anchor letter"""
+        words, used = find_hook_words("cat", parse_anchors("s,t", ENGLISH), index)
+        
+        # "cat" uses no anchor, "casts" would need two
+        assert words == ["sat", "acts", "cast", "cats", "scat", "tact"]
+        assert used["tact"] == ["t"]
+        assert used["cats"] == ["s"]
+    
+    def test_positions(self, index):
+        """Test anchors pinned to an index of the word"""
+        words, used = find_hook_words("cat", parse_anchors("s@0,s@-1", ENGLISH), index)
+        
+        assert words == ["sat", "acts", "cats", "scat"]
+        assert used["sat"] == ["s@0"]
+        assert used["cats"] == ["s@-1"]
+        assert find_hook_words("cat", [], index) == ([], {})
+    
+    def test_matches_one_pass_per_anchor(self):
+        """Test the shared pass agrees with solving once per anchor letter"""
+        os.chdir(os.path.join(os.path.dirname(__file__), '..', 'app'))
+        snapshot = load_snapshot()
+        index, rack = snapshot.index, "retains"
+        anchors = parse_anchors("e,s,q,z,b", ENGLISH)
+        words, used = find_hook_words(rack, anchors, index)
+        
+        base = set(find_valid_words(rack, index, 3))
+        expected = {}
+        for letter, _ in anchors:
+            for word in find_valid_words(rack + letter, index, 3):
+                if word not in base:
+                    expected.setdefault(word, []).append(letter)
+        assert used == expected
+        assert words == sorted(expected, key=lambda w: (len(w), w))
+    
+    def test_parse_anchors(self):
+        """Test anchor specs with and without positions"""
+        assert parse_anchors("E, s@0,t@-1", ENGLISH) == [("e", None), ("s", 0), ("t", -1)]
+        for spec in ["st", "s@x", "1"]:
+            with pytest.raises(ValueError):
+                parse_anchors(spec, ENGLISH)
+
+class TestDictionaryOverlay:
+    """Test single-word edits and the persisted overlay file"""
+    
+    def test_snapshot_edits(self):
+        """Test that snapshot edits update words, index and overlay"""
+        snapshot = build_snapshot({"cat", "act", "dog"}, {"type": "scowl_large", "size": 3})
+        
+        edited = snapshot.with_word("tac").without_word("dog")
+        assert edited.words == {"cat", "act", "tac"}
+        assert edited.added == {"tac"} and edited.removed == {"dog"}
+        assert edited.revision == 2
+        assert edited.version == snapshot.version
+        assert edited.info["size"] == 3
+        assert get_anagrams("cat", edited.index) == ["act", "cat", "tac"]
+        assert find_valid_words("dog", edited.index) == []
+        
+        # No-op edits return the same snapshot
+        assert edited.with_word("cat") is edited
+        assert edited.without_word("dog") is edited
+    
+    def test_content_version(self):
+        """Test the content version tracks the words served, not the edit count"""
+        snapshot = build_snapshot({"cat", "act", "dog"}, {"type": "scowl_large", "size": 3})
+        assert snapshot.content_version == snapshot.version
+        
+        edited = snapshot.with_word("tac")
+        assert edited.content_version != snapshot.version
+        # The same edits in any order give the same words
+        both = edited.without_word("dog")
+        assert both.content_version == snapshot.without_word("dog").with_word("tac").content_version
+        assert both.content_version != edited.content_version
+    
+    def test_overlay_round_trip(self, tmp_path):
+        """Test that the overlay file records the latest edit per word"""
+        path = str(tmp_path / "overlay.txt")
+        assert load_overlay(path) == (set(), set())
+        
+        save_overlay(path, {"zzyzx", "yeet"}, {"beach"})
+        assert load_overlay(path) == ({"zzyzx", "yeet"}, {"beach"})
+    
+    def test_overlay_uses_alphabet_normalization(self, tmp_path):
+        """Test overlay words are normalized the same way as edits"""
+        from alphabet import SPANISH
+        
+        path = str(tmp_path / "overlay.txt")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("+Canción\n-AÑO\n")
+        assert load_overlay(path, SPANISH) == ({"cancion"}, {"año"})
+    
+    def test_load_snapshot_applies_overlay(self, tmp_path):
+        """Test that the overlay is applied on top of the base list at startup"""
+        from unittest.mock import patch
+        import solver
+        
+        os.chdir(os.path.join(os.path.dirname(__file__), '..', 'app'))
+        path = str(tmp_path / "overlay.txt")
+        save_overlay(path, {"zzyzx"}, {"beach"})
+        
+        # Patch the Config the solver module uses; test_config reloads config
+        with patch.object(solver.Config, 'OVERLAY_FILE', path):
+            snapshot = load_snapshot()
+        
+        assert "zzyzx" in snapshot.words and "beach" not in snapshot.words
+        assert snapshot.added == {"zzyzx"} and snapshot.removed == {"beach"}
+        assert "zzyzx" in find_valid_words("zzyzx", snapshot.index)
+        assert "beach" not in find_valid_words("bhace", snapshot.index)
+
 class TestIntegration:
     """Integration tests using real dictionaries"""
     
@@ -273,4 +609,151 @@ class TestIntegration:
         
         # Google 10k should be smallest
         google_10k = load_specific_dictionary("google-10000-english.txt")
-        assert 9000 < len(google_10k) < 12000, f"Google 10k unexpected size: {len(google_10k)} words" 
\ No newline at end of file
+        assert 9000 < len(google_10k) < 12000, f"Google 10k unexpected size: {len(google_10k)} words" 
+
+
+class TestLetterLimit:
+    """Test the configurable rack length limit"""
+    
+    def test_limit_comes_from_config(self):
+        """Test validation follows Config.MAX_LETTERS"""
+        from unittest.mock import patch
+        import utils
+        
+        rack = "a" * 30
+        assert utils.validate_letters(rack)["errors"] == [
+            f"Too many letters (maximum {utils.Config.MAX_LETTERS} allowed)"]
+        with patch.object(utils.Config, 'MAX_LETTERS', 60):
+            assert utils.validate_letters(rack)["valid"] is True
+            assert utils.validate_letters("a" * 61)["valid"] is False
+
+
+class TestAlphabets:
+    """Test indexing dictionaries spelled with non-English alphabets"""
+    
+    def test_spanish_index(self):
+        """Test ñ is a letter of its own while accents are folded"""
+        from alphabet import SPANISH
+        
+        words = {SPANISH.normalize(w) for w in ["niño", "año", "Ñandú", "nino", "canción"]}
+        index = WordIndex.build(words, "spanish", alphabet=SPANISH)
+        
+        assert words == {"niño", "año", "ñandu", "nino", "cancion"}
+        assert index.find_words("oñin", 3) == ["niño"]
+        assert index.find_words("onin", 3) == ["nino"]
+        assert index.find_words("udnaño", 3) == ["año", "ñandu"]
+        assert index.find_words(SPANISH.clean("CANCIÓN!"), 7) == ["cancion"]
+    
+    def test_german_letters(self):
+        """Test umlauts and ß are indexed as distinct letters"""
+        from alphabet import GERMAN
+        
+        index = WordIndex.build({"süß", "sus", "maß", "mass"}, "german", alphabet=GERMAN)
+        
+        assert index.find_words("ßüs", 3) == ["süß"]
+        assert index.find_words("samß", 3) == ["maß"]
+        assert index.find_words("masü", 3) == []
+    
+    def test_large_alphabet_uses_one_packed_level(self):
+        """Test alphabets too wide for two packed levels still solve exactly"""
+        from alphabet import Alphabet
+        
+        wide = Alphabet("wide", "abcdefghijklmnopqrstuvwxyz" + "αβγδεζηθ")
+        words = {"aαα", "αβγ", "ααα", "βαα", "abc", "cab"}
+        index = WordIndex.build(words, "wide", keep=lambda w: is_valid_word(w, 1), alphabet=wide)
+        
+        for letters in ["ααβ", "αααβ", "abcα", "γβα"]:
+            assert index.find_words(letters, 1) == \
+                find_valid_words(letters, words, 1), letters
+    
+    def test_clean_letters_keeps_alphabet_letters(self):
+        """Test rack cleaning follows the dictionary alphabet"""
+        from alphabet import SPANISH
+        from utils import clean_letters, validate_letters
+        
+        assert clean_letters("Ña-é!") == "a"
+        assert clean_letters("Ña-é!", SPANISH) == "ñae"
+        assert validate_letters("ñandú", SPANISH)["cleaned"] == "ñandu"
+    
+    def test_load_spanish_dictionary(self, tmp_path):
+        """Test a Spanish word list loads with its alphabet"""
+        from unittest.mock import patch
+        import solver
+        DictionaryType = solver.DictionaryType
+        
+        path = tmp_path / "spanish.txt"
+        path.write_text("Niño\naño\ncanción\nsol\n", encoding="utf-8")
+        files = {**solver.Config.DICTIONARY_FILES, DictionaryType.SPANISH: [str(path)]}
+        with patch.object(solver.Config, 'DICTIONARY_FILES', files):
+            words, info = load_dictionary(DictionaryType.SPANISH)
+        snapshot = build_snapshot(words, info)
+        
+        assert info["type"] == "spanish"
+        assert info["alphabet"] == "spanish"
+        assert snapshot.alphabet.name == "spanish"
+        assert find_valid_words("oñin", snapshot.index, 3, snapshot.dictionary_type) == ["niño"]
+        assert "cancion" in snapshot.words
+    
+    def test_missing_language_file_does_not_fall_back_to_english(self):
+        """Test a missing non-English dictionary is an error"""
+        from unittest.mock import patch
+        import solver
+        DictionaryType = solver.DictionaryType
+        
+        files = {**solver.Config.DICTIONARY_FILES, DictionaryType.GERMAN: ["/nonexistent/german.txt"]}
+        with patch.object(solver.Config, 'DICTIONARY_FILES', files):
+            with pytest.raises(FileNotFoundError):
+                load_dictionary(DictionaryType.GERMAN)
+
+
+class TestWordTiers:
+    """Test per-word tier bits resolved during the solver scan"""
+    
+    @pytest.fixture
+    def index(self):
+        """Index whose words sit in different bundled lists"""
+        bits = {"ace": 0b111, "each": 0b111, "ache": 0b110, "bach": 0b100, "cab": 0b011}
+        words = set(bits) | {"abe"}
+        return WordIndex.build(words, keep=lambda w: is_valid_word(w, 1),
+                               tiers=lambda word: bits.get(word, 0))
+    
+    def test_annotation_matches_plain_search(self, index):
+        """Test tiered results equal find_words and name the smallest list"""
+        words, tiers = index.find_tiered_words("bhace", 3)
+        
+        assert words == index.find_words("bhace", 3)
+        assert tier_names(tiers) == {"abe": "extended", "ace": "common", "cab": "common",
+                                     "ache": "medium", "bach": "large", "each": "common"}
+    
+    def test_max_tier(self, index):
+        """Test a tier mask keeps only words from small enough lists"""
+        assert index.find_tiered_words("bhace", 3, tier_mask("common"))[0] == ["ace", "cab", "each"]
+        assert index.find_tiered_words("bhace", 3, tier_mask("medium"))[0] == ["ace", "cab", "ache", "each"]
+        assert index.find_tiered_words("bhace", 3, tier_mask("extended"))[0] == index.find_words("bhace", 3)
+        with pytest.raises(ValueError):
+            tier_mask("huge")
+    
+    def test_edits_are_untiered(self, index):
+        """Test words added after the build count as extended"""
+        edited = index.with_word("hace").without_word("cab")
+        words, tiers = edited.find_tiered_words("bhace", 3)
+        
+        assert words == edited.find_words("bhace", 3)
+        assert tiers["hace"] == 0 and "cab" not in tiers
+        assert "hace" not in edited.find_tiered_words("bhace", 3, tier_mask("large"))[0]
+    
+    def test_index_without_tiers(self):
+        """Test tiered search needs tier data"""
+        with pytest.raises(ValueError):
+            WordIndex.build({"cat"}).find_tiered_words("tac", 3)
+    
+    def test_bundled_tiers(self):
+        """Test the loaded dictionary's tiers come from the bundled lists"""
+        os.chdir(os.path.join(os.path.dirname(__file__), '..', 'app'))
+        snapshot = load_snapshot()
+        words, tiers = find_tiered_words("bhace", snapshot.index, 3)
+        
+        assert tiers["beach"] == "common"
+        assert tiers["ache"] == "medium"
+        assert find_tiered_words("bhace", snapshot.index, 3, "common")[0] == \
+            [word for word in words if tiers[word] == "common"]
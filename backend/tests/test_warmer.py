@@ -0,0 +1,88 @@
+import pytest
+import os
+import sys
+
+# Add the app directory to the path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'app'))
+
+from cache import ResultCache
+from config import DictionaryType
+from solver import find_valid_words, get_anagrams, load_snapshot
+from warmer import build_warm_cache, load_warm_cache, parse_level_pack, parse_log
+
+class TestCacheWarmer:
+    """Test building and loading warm-cache artifacts"""
+    
+    @pytest.fixture(autouse=True)
+    def app_dir(self):
+        """Change to app directory for dictionary file access"""
+        os.chdir(os.path.join(os.path.dirname(__file__), '..', 'app'))
+    
+    def test_parse_log_counts_normalized_racks(self):
+        """Test log parsing merges permutations and skips invalid requests"""
+        lines = [
+            '127.0.0.1 - "GET /solve?letters=bhace&min_word_length=3 HTTP/1.1" 200',
+            '127.0.0.1 - "GET /solve?letters=ehcab HTTP/1.1" 200',
+            '127.0.0.1 - "GET /anagrams?letters=tac&min_word_length=4 HTTP/1.1" 200',
+            '127.0.0.1 - "GET /solve?letters=123 HTTP/1.1" 200',
+            '127.0.0.1 - "GET /solve?letters=abc&min_word_length=x HTTP/1.1" 200',
+            '127.0.0.1 - "GET /health HTTP/1.1" 200',
+        ]
+        racks = parse_log(lines)
+        
+        assert racks.most_common() == [
+            (("solve", "abceh", 3), 2),
+            (("anagrams", "act", 4), 1),
+        ]
+    
+    def test_parse_level_pack(self):
+        """Test every level yields a solve and an anagram rack"""
+        racks = parse_level_pack(["# pack 1", "", "BHACE", "ehcab", "dgirn"])
+        
+        assert racks == [
+            ("solve", "abceh", 3),
+            ("anagrams", "abceh", 3),
+            ("solve", "dginr", 3),
+            ("anagrams", "dginr", 3),
+        ]
+    
+    def test_build_and_load_artifact(self, tmp_path):
+        """Test warmed results match the solver and load into a cache"""
+        racks = parse_level_pack(["bhace", "dgirn", "tac"])
+        output = str(tmp_path / "warm.jsonl.gz")
+        result = build_warm_cache(racks, output, DictionaryType.GOOGLE_10K, workers=2)
+        assert result["entries"] == len(racks)
+        
+        snapshot = load_snapshot(DictionaryType.GOOGLE_10K)
+        assert result["version"] == snapshot.version
+        cache = ResultCache()
+        assert load_warm_cache(output, cache, snapshot.version) == len(racks)
+        
+        solve_key = ResultCache.make_key(snapshot.version, "solve", "bhace", 3)
+        assert cache.get(solve_key) == find_valid_words(
+            "bhace", snapshot.index, 3, snapshot.dictionary_type)
+        anagram_key = ResultCache.make_key(snapshot.version, "anagrams", "tac", 3)
+        assert cache.get(anagram_key) == get_anagrams(
+            "tac", snapshot.index, 3, snapshot.dictionary_type)
+    
+    def test_version_mismatch_is_skipped(self, tmp_path):
+        """Test an artifact for another dictionary is not loaded"""
+        output = str(tmp_path / "warm.jsonl.gz")
+        build_warm_cache(parse_level_pack(["tac"]), output, DictionaryType.GOOGLE_10K, workers=1)
+        
+        cache = ResultCache()
+        assert load_warm_cache(output, cache, "other-version") == 0
+        assert cache.stats()["size"] == 0
+    
+    def test_edited_words_skip_affected_entries(self, tmp_path):
+        """Test entries a word edit could change are not loaded for the edited list"""
+        output = str(tmp_path / "warm.jsonl.gz")
+        build_warm_cache(parse_level_pack(["bhace", "tac"]), output, DictionaryType.GOOGLE_10K, workers=1)
+        snapshot = load_snapshot(DictionaryType.GOOGLE_10K).without_word("beach")
+        
+        cache = ResultCache()
+        loaded = load_warm_cache(
+            output, cache, snapshot.version, snapshot.content_version, snapshot.removed)
+        assert loaded == 2
+        assert cache.get(ResultCache.make_key(snapshot.content_version, "solve", "tac", 3)) is not None
+        assert cache.get(ResultCache.make_key(snapshot.content_version, "solve", "bhace", 3)) is None
@@ -0,0 +1,76 @@
+import pytest
+import os
+import sys
+import random
+
+# Add the app directory to the path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'app'))
+
+from alphabet import ENGLISH
+from wordle import WordleIndex, parse_feedback, score
+
+WORDS = ["crane", "crate", "trace", "react", "caret", "eerie", "speed", "llama",
+         "abbey", "slate", "stale", "least", "steal", "tales"]
+
+class TestFeedback:
+    """Test feedback parsing and single-pair scoring"""
+    
+    def test_parse_feedback(self):
+        """Test marks become base-3 patterns, first letter least significant"""
+        assert parse_feedback("crane:gbbbb", ENGLISH) == [("crane", 2)]
+        assert parse_feedback("CRANE:bybbb, slate:ggggg", ENGLISH) == [
+            ("crane", 3), ("slate", 242)]
+        assert parse_feedback("", ENGLISH) == []
+        for spec in ["crane:gbb", "crane:gbbbx", "cr4ne:gbbbb", "crane"]:
+            with pytest.raises(ValueError):
+                parse_feedback(spec, ENGLISH)
+    
+    def test_score_repeated_letters(self):
+        """Test repeated guess letters are only yellow while copies remain"""
+        marks = lambda guess, answer: [score(guess, answer) // 3**i % 3 for i in range(5)]
+        assert marks("crane", "crane") == [2, 2, 2, 2, 2]
+        assert marks("speed", "abide") == [0, 0, 1, 0, 1]
+        assert marks("speed", "erase") == [1, 0, 1, 1, 0]
+        assert marks("eerie", "speed") == [1, 1, 0, 0, 0]
+        assert marks("eerie", "abide") == [0, 0, 0, 1, 2]
+
+class TestWordleIndex:
+    """Test lane-parallel pattern rows, filtering and ranking"""
+    
+    @pytest.fixture
+    def index(self):
+        return WordleIndex(WORDS, ENGLISH)
+    
+    def test_patterns_match_scoring(self, index):
+        """Test every pattern row agrees with scoring pairs one at a time"""
+        for guess in WORDS + ["sweet", "zzzzz", "aaaaa"]:
+            assert list(index.patterns(guess)) == [score(guess, w) for w in WORDS]
+        assert index.patterns("crane") is index.patterns("crane")
+        with pytest.raises(ValueError):
+            index.patterns("cranes")
+    
+    def test_candidates_consistent_with_feedback(self, index):
+        """Test filtering keeps exactly the words that would give the feedback"""
+        for answer in ["react", "least", "llama"]:
+            feedback = [(guess, score(guess, answer)) for guess in ["crane", "steal"]]
+            words = [index.words[i] for i in index.candidates(feedback)]
+            assert answer in words
+            assert words == [w for w in WORDS
+                             if all(score(g, w) == p for g, p in feedback)]
+    
+    def test_rank_by_entropy(self, index):
+        """Test guesses that split the candidates more rank first"""
+        ranked = index.rank(range(len(WORDS)), limit=len(WORDS))
+        bits = [entropy for _, entropy in ranked]
+        assert bits == sorted(bits, reverse=True)
+        assert ranked[0][1] > 0
+        assert index.rank([3]) == [("react", 0.0)]
+        assert len(index.rank(range(len(WORDS)), limit=3, pool=4)) == 3
+    
+    def test_random_words(self):
+        """Test lane arithmetic on a larger random word list"""
+        rng = random.Random(7)
+        words = sorted({"".join(rng.choice("aeilnrst") for _ in range(6)) for _ in range(500)})
+        index = WordleIndex(words, ENGLISH)
+        for guess in rng.sample(words, 20):
+            assert list(index.patterns(guess)) == [score(guess, w) for w in words]